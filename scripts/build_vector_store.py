@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Build the ChromaDB vector store from regulation documents."""
 
+import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -8,11 +10,81 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.rag.document_loader import DocumentLoader
-from src.rag.vector_store import VectorStore
+from src.rag.vector_store import HNSW_METADATA, VectorStore
+
+# tqdm ships with sentence-transformers, but keep the script usable without it
+try:
+    from tqdm import tqdm
+except ImportError:
+    def tqdm(iterable, **kwargs):
+        return iterable
+
+# Chroma ingests fastest with client-side batches in the 50-250 range
+MIN_BATCH_SIZE = 50
+MAX_BATCH_SIZE = 250
+DEFAULT_BATCH_SIZE = 128
+
+
+def get_batch_size(requested: int = None) -> int:
+    """
+    Resolve the insertion batch size, clamped to a sane range.
+
+    Uses the requested size if given, otherwise EBT_CHROMA_BATCH.
+    """
+    if requested is None:
+        try:
+            requested = int(os.environ.get("EBT_CHROMA_BATCH", DEFAULT_BATCH_SIZE))
+        except ValueError:
+            requested = DEFAULT_BATCH_SIZE
+    return max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, requested))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Delete and rebuild the collection if it already has documents",
+    )
+    parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Skip the test retrieval query after building",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=(
+            f"Chunks embedded and inserted per batch, clamped to "
+            f"{MIN_BATCH_SIZE}-{MAX_BATCH_SIZE} (default: EBT_CHROMA_BATCH or "
+            f"{DEFAULT_BATCH_SIZE})"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes for loading and chunking files (default: CPU count)",
+    )
+    return parser.parse_args()
+
+
+def add_batch(vector_store: VectorStore, batch: list) -> None:
+    """Embed one batch of chunks in a single forward pass and insert it."""
+    documents = [chunk.content for chunk in batch]
+    vector_store.add_documents(
+        documents=documents,
+        metadatas=[chunk.metadata for chunk in batch],
+        ids=[chunk.doc_id for chunk in batch],
+        embeddings=vector_store.embed_batch(documents, show_progress_bar=False),
+    )
 
 
 def main() -> None:
     """Build the vector store."""
+    args = parse_args()
     print("Building SNAP regulations vector store...")
 
     # Initialize components
@@ -23,42 +95,50 @@ def main() -> None:
     existing_count = vector_store.count
     if existing_count > 0:
         print(f"Collection already has {existing_count} documents.")
-        response = input("Delete and rebuild? (y/n): ").strip().lower()
-        if response == "y":
-            vector_store.delete_collection()
-            print("Collection deleted.")
-        else:
-            print("Keeping existing collection.")
+        if not args.force_rebuild:
+            print("Keeping existing collection; pass --force-rebuild to rebuild it.")
             return
+        vector_store.delete_collection()
+        print("Collection deleted.")
+
+    print(f"HNSW settings: {HNSW_METADATA}")
+
+    # Chunk files in worker processes and embed/insert one batch at a time,
+    # so embedding overlaps chunking and peak memory stays bounded to a batch
+    batch_size = get_batch_size(args.batch_size)
+    print(f"Loading and embedding regulation documents (batch size {batch_size})...")
+    chunk_stream = loader.iter_chunks_parallel(
+        chunk_size=1000,
+        overlap=200,
+        workers=args.workers,
+    )
 
-    # Load and chunk documents
-    print("Loading regulation documents...")
-    chunks = loader.load_and_chunk_all(chunk_size=1000, overlap=200)
-
-    if not chunks:
+    batch = []
+    added = 0
+    for chunk in tqdm(chunk_stream, desc="Chunks", unit="chunk"):
+        batch.append(chunk)
+        if len(batch) >= batch_size:
+            add_batch(vector_store, batch)
+            added += len(batch)
+            batch = []
+    if batch:
+        add_batch(vector_store, batch)
+        added += len(batch)
+
+    if not added:
         print("No documents found in data/regulations/")
         print("Please add regulation text files before building the vector store.")
         return
 
-    print(f"Loaded {len(chunks)} document chunks.")
-
-    # Prepare for insertion
-    documents = [chunk.content for chunk in chunks]
-    metadatas = [chunk.metadata for chunk in chunks]
-    ids = [chunk.doc_id for chunk in chunks]
-
-    # Add to vector store
-    print("Adding documents to vector store...")
-    vector_store.add_documents(
-        documents=documents,
-        metadatas=metadatas,
-        ids=ids,
-    )
+    print(f"Added {added} document chunks.")
 
     # Verify
     final_count = vector_store.count
     print(f"Vector store built successfully with {final_count} documents.")
 
+    if args.no_verify:
+        return
+
     # Test query
     print("\nTesting retrieval...")
     test_query = "SNAP eligibility for alcoholic beverages"
@@ -22,11 +22,12 @@ async def main() -> None:
 
     # Verify tables were created
     tables = ["products", "classifications", "audit_trail"]
+    existing = await db.tables_exist(tables)
     for table in tables:
-        exists = await db.table_exists(table)
-        status = "OK" if exists else "MISSING"
+        status = "OK" if table in existing else "MISSING"
         print(f"  Table '{table}': {status}")
 
+    await db.close()
     print("Database initialization complete.")
 
 
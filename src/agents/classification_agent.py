@@ -3,11 +3,14 @@ LangChain-based AI reasoning agent for EBT eligibility classification.
 Uses Gemini API with RAG for SNAP regulation lookup.
 """
 
+import asyncio
 import re
+from pathlib import Path
 from typing import Optional
 
-from src.agents.prompts.classification_prompt import format_classification_prompt
+from src.agents.prompts.classification_prompt import CLASSIFICATION_PROMPT_TEMPLATE
 from src.agents.prompts.system_prompt import get_system_prompt
+from src.agents.semantic_cache import SemanticCache
 from src.agents.tools.regulation_lookup import RegulationLookupTool
 from src.core.config import settings
 from src.core.constants import ClassificationCategory
@@ -20,6 +23,113 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bounds on what is kept from a response
+_MAX_REASONING_STEPS = 10
+_MAX_KEY_FACTORS = 5
+
+# Response parsing patterns, compiled once at import
+_CATEGORY_RE = re.compile(r"category:\s*([A-Z_]+)", re.IGNORECASE)
+_NUMBERED_RE = re.compile(r"^\s*(\d+)\.\s*(.+)$")
+_SENT_SPLIT_RE = re.compile(r"[.!?]+")
+# Both citation patterns in one alternation, told apart by group name
+_CITATION_RE = re.compile(
+    r"(?P<cfr>7\s*CFR\s*(?:section\s*)?(?:§\s*)?271\.2)"
+    r"|(?P<fns>FNS\s+(?:Policy|guidance|rule))",
+    re.IGNORECASE,
+)
+
+# Eligibility phrases; ineligible phrases take precedence over eligible ones
+_INELIGIBLE_PHRASES = (
+    "not eligible",
+    "ineligible",
+    "cannot be purchased",
+    "not allowed",
+    "prohibited",
+    "excluded from snap",
+)
+_ELIGIBLE_PHRASES = (
+    "is eligible",
+    "eligible for snap",
+    "can be purchased",
+    "allowed under snap",
+    "permitted",
+)
+
+# One alternation per polarity so each is a single scan over the response
+_INELIGIBLE_PHRASE_RE = re.compile("|".join(map(re.escape, _INELIGIBLE_PHRASES)))
+_ELIGIBLE_PHRASE_RE = re.compile("|".join(map(re.escape, _ELIGIBLE_PHRASES)))
+
+
+# Explicit category tokens; a dict miss avoids the enum's ValueError path
+_CATEGORY_BY_VALUE = {category.value: category for category in ClassificationCategory}
+
+# Category inference rules in priority order. A category matches when every
+# keyword of any one of its alternatives appears in the lowercased response.
+_INELIGIBLE_CATEGORY_RULES = (
+    (ClassificationCategory.INELIGIBLE_ALCOHOL, (("alcohol",),)),
+    (ClassificationCategory.INELIGIBLE_TOBACCO, (("tobacco",),)),
+    (ClassificationCategory.INELIGIBLE_HOT_FOOD, (("hot", "food"),)),
+    (ClassificationCategory.INELIGIBLE_SUPPLEMENT, (("supplement",),)),
+    (ClassificationCategory.INELIGIBLE_MEDICINE, (("medicine",), ("vitamin",))),
+    (ClassificationCategory.INELIGIBLE_CBD_CANNABIS, (("cbd",), ("cannabis",))),
+    (ClassificationCategory.INELIGIBLE_LIVE_ANIMAL, (("live animal",),)),
+    (ClassificationCategory.INELIGIBLE_NON_FOOD, (("non-food",), ("non food",))),
+)
+_ELIGIBLE_CATEGORY_RULES = (
+    (ClassificationCategory.ELIGIBLE_STAPLE_FOOD, (("staple",),)),
+    (ClassificationCategory.ELIGIBLE_SNACK_FOOD, (("snack",),)),
+    (ClassificationCategory.ELIGIBLE_BEVERAGE, (("beverage",), ("drink",))),
+    (ClassificationCategory.ELIGIBLE_BABY_FOOD, (("baby",), ("infant",))),
+    (ClassificationCategory.ELIGIBLE_SEEDS_PLANTS, (("seed",), ("plant",))),
+    (ClassificationCategory.ELIGIBLE_COOKING_INGREDIENT, (("cooking",), ("ingredient",))),
+)
+
+# Citations are immutable, so the AI-analysis references are shared constants
+_CFR_271_2_CITATION = RegulationCitation(
+    regulation_id="7 CFR 271.2",
+    section="eligible food",
+    excerpt="Referenced in AI analysis",
+    relevance_score=0.9,
+    source_url="https://www.ecfr.gov/current/title-7/section-271.2",
+)
+_FNS_POLICY_CITATION = RegulationCitation(
+    regulation_id="FNS Policy",
+    section="eligible food items",
+    excerpt="Referenced in AI analysis",
+    relevance_score=0.85,
+    source_url="https://www.fns.usda.gov/snap/eligible-food-items",
+)
+
+_llm_cache = None
+_llm_cache_configured = False
+
+
+def _get_llm_cache():
+    """
+    Get the SQLite cache for classification LLM responses, or None.
+
+    The cache is passed to the classification models through their cache
+    argument rather than installed globally, so other LangChain models in
+    the process (e.g. search suggestions) are never cached.
+    """
+    global _llm_cache, _llm_cache_configured
+    if _llm_cache_configured or not settings.llm_cache_enabled:
+        return _llm_cache
+
+    try:
+        from langchain_community.cache import SQLiteCache
+
+        Path(settings.llm_cache_path).parent.mkdir(parents=True, exist_ok=True)
+        _llm_cache = SQLiteCache(database_path=settings.llm_cache_path)
+        logger.info("llm_cache_configured", path=settings.llm_cache_path)
+    except ImportError:
+        logger.warning("llm_cache_not_available")
+    except Exception as e:
+        logger.warning("llm_cache_configuration_failed", error=str(e))
+
+    _llm_cache_configured = True
+    return _llm_cache
+
 
 class ClassificationAgent:
     """
@@ -33,6 +143,7 @@ class ClassificationAgent:
         self,
         retriever: SNAPRegulationRetriever = None,
         model_name: str = None,
+        max_concurrency: int = 10,
     ):
         """
         Initialize the classification agent.
@@ -40,10 +151,14 @@ class ClassificationAgent:
         Args:
             retriever: RAG retriever for regulations
             model_name: LLM model name
+            max_concurrency: Maximum concurrent reasoning calls in reason_batch
         """
         self.model_name = model_name or settings.gemini_model
         self.retriever = retriever or get_retriever()
         self.regulation_tool = RegulationLookupTool(self.retriever)
+        self._cache = SemanticCache(vector_store=self.retriever.vector_store)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._system_message = {"role": "system", "content": get_system_prompt()}
         self._llm = None
 
     @property
@@ -73,6 +188,7 @@ class ClassificationAgent:
                 "model": settings.llm_model,
                 "api_key": settings.llm_api_key,
                 "temperature": 0.1,
+                "cache": _get_llm_cache(),
             }
 
             # Custom base URL for wrapper APIs
@@ -90,6 +206,7 @@ class ClassificationAgent:
                     model=settings.gemini_model,
                     google_api_key=settings.google_api_key,
                     temperature=0.1,
+                    cache=_get_llm_cache(),
                 )
             except ImportError:
                 logger.warning("langchain_google_genai_not_available")
@@ -104,6 +221,7 @@ class ClassificationAgent:
                 api_key=settings.ollama_cloud_api_key,
                 base_url=settings.ollama_cloud_base_url,
                 temperature=0.1,
+                cache=_get_llm_cache(),
             )
 
         # Local Ollama fallback
@@ -115,6 +233,7 @@ class ClassificationAgent:
                     model=settings.ollama_model,
                     base_url=settings.ollama_base_url,
                     temperature=0.1,
+                    cache=_get_llm_cache(),
                 )
             except ImportError:
                 logger.warning("langchain_ollama_not_available")
@@ -126,6 +245,7 @@ class ClassificationAgent:
         self,
         product: ProductInput,
         partial_rule_result: Optional[RuleValidationResult] = None,
+        precomputed_context: Optional[str] = None,
     ) -> AIReasoningResult:
         """
         Use AI reasoning to classify a product.
@@ -133,6 +253,7 @@ class ClassificationAgent:
         Args:
             product: Product to classify
             partial_rule_result: Partial result from rule-based validation
+            precomputed_context: Formatted regulations context, if already retrieved
 
         Returns:
             AIReasoningResult with classification details
@@ -144,14 +265,29 @@ class ClassificationAgent:
         )
 
         try:
-            # Step 1: Retrieve relevant regulations
-            retrieved_docs = self.retriever.retrieve_for_classification(
-                product_name=product.product_name,
-                category=product.category,
-                description=product.description,
-                k=3,
-            )
-            regulations_context = self.retriever.format_context(retrieved_docs)
+            if self.llm is None:
+                # Fallback if LLM not configured
+                logger.warning("llm_not_available_using_fallback")
+                return self._fallback_classification(product)
+
+            # Step 0: Reuse a cached result for a near-identical product
+            cached = await self._cache.lookup(product)
+            if cached is not None:
+                cached.data_sources_used.append("Semantic cache")
+                return cached
+
+            # Step 1: Retrieve relevant regulations (sync retriever, keep the loop free)
+            if precomputed_context is not None:
+                regulations_context = precomputed_context
+            else:
+                retrieved_docs = await asyncio.to_thread(
+                    self.retriever.retrieve_for_classification,
+                    product_name=product.product_name,
+                    category=product.category,
+                    description=product.description,
+                    k=3,
+                )
+                regulations_context = self.retriever.format_context(retrieved_docs)
 
             # Step 2: Format the partial rule analysis
             partial_analysis = self._format_partial_analysis(partial_rule_result)
@@ -160,15 +296,11 @@ class ClassificationAgent:
             prompt = self._build_prompt(product, partial_analysis, regulations_context)
 
             # Step 4: Get LLM response
-            if self.llm is None:
-                # Fallback if LLM not configured
-                logger.warning("llm_not_available_using_fallback")
-                return self._fallback_classification(product)
-
             response = await self._invoke_llm(prompt)
 
             # Step 5: Parse the response
             result = self._parse_response(response, product)
+            await self._cache.store(product, result)
 
             logger.info(
                 "ai_reasoning_completed",
@@ -188,6 +320,55 @@ class ClassificationAgent:
             # Return fallback classification
             return self._fallback_classification(product, str(e))
 
+    async def reason_batch(
+        self,
+        products: list[ProductInput],
+        partial_rule_results: Optional[list[Optional[RuleValidationResult]]] = None,
+    ) -> list[AIReasoningResult]:
+        """
+        Classify multiple products concurrently.
+
+        Args:
+            products: Products to classify
+            partial_rule_results: Partial rule results, aligned with products
+
+        Returns:
+            AIReasoningResults in the same order as products
+        """
+        if partial_rule_results is None:
+            partial_rule_results = [None] * len(products)
+
+        # Retrieve regulations for every product in one vector store query
+        try:
+            batch_docs = await asyncio.to_thread(
+                self.retriever.retrieve_batch,
+                product_names=[p.product_name for p in products],
+                categories=[p.category for p in products],
+                descriptions=[p.description for p in products],
+                k=3,
+            )
+            contexts = [self.retriever.format_context(docs) for docs in batch_docs]
+        except Exception as e:
+            logger.warning("batch_retrieval_failed", error=str(e))
+            contexts = [None] * len(products)
+
+        async def reason_with_semaphore(
+            product: ProductInput,
+            partial_rule_result: Optional[RuleValidationResult],
+            context: Optional[str],
+        ) -> AIReasoningResult:
+            async with self._semaphore:
+                return await self.reason(product, partial_rule_result, context)
+
+        return await asyncio.gather(
+            *[
+                reason_with_semaphore(product, partial, context)
+                for product, partial, context in zip(
+                    products, partial_rule_results, contexts
+                )
+            ]
+        )
+
     def _format_partial_analysis(
         self,
         partial_rule_result: Optional[RuleValidationResult],
@@ -215,59 +396,35 @@ class ClassificationAgent:
         regulations_context: str,
     ) -> str:
         """Build the full prompt for the LLM."""
-        return format_classification_prompt(
-            product_id=product.product_id,
-            product_name=product.product_name,
-            description=product.description or "Not provided",
-            category=product.category or "Unknown",
-            brand=product.brand or "Unknown",
-            upc=product.upc or "Not provided",
-            ingredients=(
+        prompt_vars = {
+            "product_id": product.product_id,
+            "product_name": product.product_name,
+            "description": product.description or "Not provided",
+            "category": product.category or "Unknown",
+            "brand": product.brand or "Unknown",
+            "upc": product.upc or "Not provided",
+            "ingredients": (
                 ", ".join(product.ingredients)
                 if product.ingredients
                 else "Not provided"
             ),
-            nutrition_label_type=product.nutrition_label_type or "Unknown",
-            is_hot_at_sale=(
-                str(product.is_hot_at_sale)
-                if product.is_hot_at_sale is not None
-                else "Unknown"
-            ),
-            is_for_onsite_consumption=(
-                str(product.is_for_onsite_consumption)
-                if product.is_for_onsite_consumption is not None
-                else "Unknown"
-            ),
-            alcohol_content=(
-                f"{product.alcohol_content * 100:.1f}%"
-                if product.alcohol_content
-                else "0%"
-            ),
-            contains_tobacco=(
-                str(product.contains_tobacco)
-                if product.contains_tobacco is not None
-                else "Unknown"
-            ),
-            contains_cbd_cannabis=(
-                str(product.contains_cbd_cannabis)
-                if product.contains_cbd_cannabis is not None
-                else "Unknown"
-            ),
-            is_live_animal=(
-                str(product.is_live_animal)
-                if product.is_live_animal is not None
-                else "No"
-            ),
-            partial_rule_analysis=partial_analysis,
-            retrieved_regulations=regulations_context,
-        )
+            "nutrition_label_type": product.nutrition_label_type or "Unknown",
+            "is_hot_at_sale": product.hot_at_sale_str,
+            "is_for_onsite_consumption": product.onsite_str,
+            "alcohol_content": product.alcohol_content_pct,
+            "contains_tobacco": product.tobacco_str,
+            "contains_cbd_cannabis": product.cbd_str,
+            "is_live_animal": product.live_animal_str,
+            "partial_rule_analysis": partial_analysis,
+            "retrieved_regulations": regulations_context,
+        }
+
+        return CLASSIFICATION_PROMPT_TEMPLATE.format_map(prompt_vars)
 
     async def _invoke_llm(self, prompt: str) -> str:
         """Invoke the LLM with the prompt."""
-        system_prompt = get_system_prompt()
-
         messages = [
-            {"role": "system", "content": system_prompt},
+            self._system_message,
             {"role": "user", "content": prompt},
         ]
 
@@ -290,11 +447,14 @@ class ClassificationAgent:
         # Extract category
         category = self._extract_category(response, response_lower, is_eligible)
 
+        # Walk the response lines once for the reasoning and key factor sections
+        section_steps, section_factors = self._scan_sections(response)
+
         # Extract reasoning chain
-        reasoning_chain = self._extract_reasoning(response)
+        reasoning_chain = self._extract_reasoning(response, section_steps)
 
         # Extract key factors
-        key_factors = self._extract_key_factors(response, product)
+        key_factors = self._extract_key_factors(section_factors, product)
 
         # Extract citations
         citations = self._extract_citations(response)
@@ -332,30 +492,11 @@ class ClassificationAgent:
             return False
 
         # Look for common phrases
-        ineligible_phrases = [
-            "not eligible",
-            "ineligible",
-            "cannot be purchased",
-            "not allowed",
-            "prohibited",
-            "excluded from snap",
-        ]
-
-        eligible_phrases = [
-            "is eligible",
-            "eligible for snap",
-            "can be purchased",
-            "allowed under snap",
-            "permitted",
-        ]
-
-        for phrase in ineligible_phrases:
-            if phrase in response_lower:
-                return False
+        if _INELIGIBLE_PHRASE_RE.search(response_lower):
+            return False
 
-        for phrase in eligible_phrases:
-            if phrase in response_lower:
-                return True
+        if _ELIGIBLE_PHRASE_RE.search(response_lower):
+            return True
 
         # Default to eligible for food items
         return True
@@ -368,84 +509,79 @@ class ClassificationAgent:
     ) -> ClassificationCategory:
         """Extract classification category from response."""
         # Try to find explicit category
-        category_match = re.search(
-            r"category:\s*([A-Z_]+)",
-            response,
-            re.IGNORECASE,
-        )
+        category_match = _CATEGORY_RE.search(response)
 
         if category_match:
-            category_str = category_match.group(1).upper()
-            try:
-                return ClassificationCategory(category_str)
-            except ValueError:
-                pass
+            category = _CATEGORY_BY_VALUE.get(category_match.group(1).upper())
+            if category is not None:
+                return category
+
+        # Infer from content using the first matching keyword rule
+        rules = _ELIGIBLE_CATEGORY_RULES if is_eligible else _INELIGIBLE_CATEGORY_RULES
+        for category, alternatives in rules:
+            for keywords in alternatives:
+                if all(keyword in response_lower for keyword in keywords):
+                    return category
+
+        if is_eligible:
+            return ClassificationCategory.ELIGIBLE_OTHER
+        return ClassificationCategory.INELIGIBLE_OTHER
+
+    def _scan_sections(self, response: str) -> tuple[list[str], list[str]]:
+        """
+        Collect reasoning steps and key factors in a single pass over the response.
 
-        # Infer from content
-        if not is_eligible:
-            if "alcohol" in response_lower:
-                return ClassificationCategory.INELIGIBLE_ALCOHOL
-            elif "tobacco" in response_lower:
-                return ClassificationCategory.INELIGIBLE_TOBACCO
-            elif "hot" in response_lower and "food" in response_lower:
-                return ClassificationCategory.INELIGIBLE_HOT_FOOD
-            elif "supplement" in response_lower:
-                return ClassificationCategory.INELIGIBLE_SUPPLEMENT
-            elif "medicine" in response_lower or "vitamin" in response_lower:
-                return ClassificationCategory.INELIGIBLE_MEDICINE
-            elif "cbd" in response_lower or "cannabis" in response_lower:
-                return ClassificationCategory.INELIGIBLE_CBD_CANNABIS
-            elif "live animal" in response_lower:
-                return ClassificationCategory.INELIGIBLE_LIVE_ANIMAL
-            elif "non-food" in response_lower or "non food" in response_lower:
-                return ClassificationCategory.INELIGIBLE_NON_FOOD
-            else:
-                return ClassificationCategory.INELIGIBLE_OTHER
-        else:
-            if "staple" in response_lower:
-                return ClassificationCategory.ELIGIBLE_STAPLE_FOOD
-            elif "snack" in response_lower:
-                return ClassificationCategory.ELIGIBLE_SNACK_FOOD
-            elif "beverage" in response_lower or "drink" in response_lower:
-                return ClassificationCategory.ELIGIBLE_BEVERAGE
-            elif "baby" in response_lower or "infant" in response_lower:
-                return ClassificationCategory.ELIGIBLE_BABY_FOOD
-            elif "seed" in response_lower or "plant" in response_lower:
-                return ClassificationCategory.ELIGIBLE_SEEDS_PLANTS
-            elif "cooking" in response_lower or "ingredient" in response_lower:
-                return ClassificationCategory.ELIGIBLE_COOKING_INGREDIENT
-            else:
-                return ClassificationCategory.ELIGIBLE_OTHER
+        Args:
+            response: Raw LLM response
 
-    def _extract_reasoning(self, response: str) -> list[str]:
-        """Extract reasoning chain from response."""
+        Returns:
+            Tuple of (reasoning steps, key factors) found in their sections
+        """
         reasoning = []
+        factors = {}  # insertion-ordered set; duplicates are dropped downstream anyway
+        in_reasoning_section = False
+        in_factors = False
 
-        # Look for numbered reasoning steps
-        numbered_pattern = r"^\s*(\d+)\.\s*(.+)$"
-        lines = response.split("\n")
+        for line in response.splitlines():
+            line_lower = line.lower()
+            stripped = line.strip()
 
-        in_reasoning_section = False
-        for line in lines:
-            if "reasoning" in line.lower() and ":" in line:
+            # Reasoning section: numbered or dashed steps until the next header
+            if "reasoning" in line_lower and ":" in line:
                 in_reasoning_section = True
-                continue
-
-            if in_reasoning_section:
-                # Check for section end
-                if line.strip() and not line.strip()[0].isdigit() and ":" in line:
+            elif in_reasoning_section:
+                if stripped and not stripped[0].isdigit() and ":" in line:
                     in_reasoning_section = False
-                    continue
-
-                match = re.match(numbered_pattern, line)
-                if match:
-                    reasoning.append(match.group(2).strip())
-                elif line.strip().startswith("-"):
-                    reasoning.append(line.strip()[1:].strip())
+                elif len(reasoning) < _MAX_REASONING_STEPS:
+                    match = _NUMBERED_RE.match(line)
+                    if match:
+                        reasoning.append(match.group(2).strip())
+                    elif stripped.startswith("-"):
+                        reasoning.append(stripped[1:].strip())
+
+            # Key factors section: dashed items until the next header
+            if "key_factors" in line_lower or "key factors" in line_lower:
+                in_factors = True
+            elif in_factors:
+                if stripped.startswith("-"):
+                    if len(factors) < _MAX_KEY_FACTORS:
+                        factors[stripped[1:].strip()] = None
+                elif stripped and ":" in line:
+                    in_factors = False
+
+            # Both sections are full; the rest of the response can't change the result
+            if len(reasoning) >= _MAX_REASONING_STEPS and len(factors) >= _MAX_KEY_FACTORS:
+                break
+
+        return reasoning, list(factors)
+
+    def _extract_reasoning(self, response: str, section_steps: list[str]) -> list[str]:
+        """Build the reasoning chain from section steps, falling back to key sentences."""
+        reasoning = list(section_steps)
 
         # If no structured reasoning found, extract key sentences
         if not reasoning:
-            sentences = re.split(r"[.!?]+", response)
+            sentences = _SENT_SPLIT_RE.split(response)
             for sentence in sentences[:5]:
                 sentence = sentence.strip()
                 if len(sentence) > 20 and any(
@@ -454,29 +590,15 @@ class ClassificationAgent:
                 ):
                     reasoning.append(sentence)
 
-        return reasoning[:10]  # Limit to 10 steps
+        return reasoning[:_MAX_REASONING_STEPS]
 
     def _extract_key_factors(
         self,
-        response: str,
+        section_factors: list[str],
         product: ProductInput,
     ) -> list[str]:
-        """Extract key factors from response."""
-        factors = []
-
-        # Look for key_factors section
-        if "key_factors" in response.lower() or "key factors" in response.lower():
-            in_factors = False
-            for line in response.split("\n"):
-                if "key_factors" in line.lower() or "key factors" in line.lower():
-                    in_factors = True
-                    continue
-
-                if in_factors:
-                    if line.strip().startswith("-"):
-                        factors.append(line.strip()[1:].strip())
-                    elif line.strip() and ":" in line:
-                        in_factors = False
+        """Combine key factors from the response with product-based factors."""
+        factors = list(section_factors)
 
         # Add product-based factors
         if product.nutrition_label_type:
@@ -488,37 +610,32 @@ class ClassificationAgent:
         if product.category:
             factors.append(f"Category: {product.category}")
 
-        return list(set(factors))[:5]
+        # Order-preserving dedup, stopping once enough unique factors are found
+        unique_factors = {}
+        for factor in factors:
+            if factor not in unique_factors:
+                unique_factors[factor] = None
+                if len(unique_factors) == _MAX_KEY_FACTORS:
+                    break
+
+        return list(unique_factors)
 
     def _extract_citations(self, response: str) -> list[RegulationCitation]:
         """Extract regulation citations from response."""
         citations = []
 
-        # Look for common regulation patterns
-        cfr_pattern = r"7\s*CFR\s*(?:section\s*)?(?:§\s*)?271\.2"
-        fns_pattern = r"FNS\s+(?:Policy|guidance|rule)"
-
-        if re.search(cfr_pattern, response, re.IGNORECASE):
-            citations.append(
-                RegulationCitation(
-                    regulation_id="7 CFR 271.2",
-                    section="eligible food",
-                    excerpt="Referenced in AI analysis",
-                    relevance_score=0.9,
-                    source_url="https://www.ecfr.gov/current/title-7/section-271.2",
-                )
-            )
+        # Look for common regulation patterns in a single scan
+        found = set()
+        for match in _CITATION_RE.finditer(response):
+            found.add(match.lastgroup)
+            if len(found) == 2:
+                break
 
-        if re.search(fns_pattern, response, re.IGNORECASE):
-            citations.append(
-                RegulationCitation(
-                    regulation_id="FNS Policy",
-                    section="eligible food items",
-                    excerpt="Referenced in AI analysis",
-                    relevance_score=0.85,
-                    source_url="https://www.fns.usda.gov/snap/eligible-food-items",
-                )
-            )
+        if "cfr" in found:
+            citations.append(_CFR_271_2_CITATION)
+
+        if "fns" in found:
+            citations.append(_FNS_POLICY_CITATION)
 
         return citations
 
@@ -1,5 +1,7 @@
 """System prompt for the EBT classification agent."""
 
+from functools import lru_cache
+
 SYSTEM_PROMPT = """You are an expert SNAP/EBT eligibility classification agent. Your role is to determine whether products are eligible for purchase with SNAP (Supplemental Nutrition Assistance Program) benefits based on federal regulations.
 
 ## Your Knowledge Base
@@ -64,6 +66,7 @@ CITATIONS:
 Always cite specific regulations when making decisions."""
 
 
+@lru_cache(maxsize=1)
 def get_system_prompt() -> str:
     """Get the system prompt for the classification agent."""
     return SYSTEM_PROMPT
@@ -0,0 +1,264 @@
+"""Semantic cache for AI reasoning results."""
+
+import asyncio
+import re
+import time
+import uuid
+from typing import Optional
+
+from src.core.config import settings
+from src.models.classification import AIReasoningResult
+from src.models.product import ProductInput
+from src.rag.vector_store import VectorStore, get_vector_store
+from src.utils.hashing import compute_content_hash
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Stand-ins for the product's own name and id in stored result text
+_NAME_PLACEHOLDER = "{{product_name}}"
+_ID_PLACEHOLDER = "{{product_id}}"
+
+
+class SemanticCache:
+    """
+    Caches AI reasoning results keyed by product embedding similarity.
+
+    Products are matched in two parts: the descriptive text (name, brand,
+    category) is compared by cosine similarity, while the attributes that
+    drive eligibility (label type, flags, alcohol content) and the rest of
+    what the prompt sees (description, ingredients) must match exactly.
+    Entries are stored in their own ChromaDB collection next to the
+    regulations collection and reuse its embedding model.
+
+    Stored reasoning has the product's name and id replaced by placeholders,
+    which are filled in with the matching product's own on a hit.
+    """
+
+    # Expired entries are deleted on the first store and every this many after
+    PRUNE_INTERVAL = 100
+
+    def __init__(
+        self,
+        vector_store: VectorStore = None,
+        collection_name: str = None,
+        threshold: float = None,
+        ttl_seconds: int = None,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            vector_store: Vector store providing the Chroma client and embeddings
+            collection_name: Name of the cache collection
+            threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: Lifetime of cache entries
+        """
+        self.vector_store = vector_store or get_vector_store()
+        self.collection_name = collection_name or settings.semantic_cache_collection_name
+        self.threshold = threshold if threshold is not None else settings.semantic_cache_threshold
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.semantic_cache_ttl_seconds
+        )
+        self._collection = None
+        self._stores = 0
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the cache can be used."""
+        return settings.semantic_cache_enabled and self.vector_store.is_available
+
+    @property
+    def collection(self):
+        """Get or create the cache collection."""
+        if not self.is_available or self.vector_store.client is None:
+            return None
+
+        if self._collection is None:
+            try:
+                self._collection = self.vector_store.client.get_or_create_collection(
+                    name=self.collection_name,
+                    metadata={
+                        "description": "Cached AI classification results",
+                        "hnsw:space": "cosine",
+                    },
+                )
+            except Exception as e:
+                logger.error("semantic_cache_collection_failed", error=str(e))
+                return None
+        return self._collection
+
+    @staticmethod
+    def product_text(product: ProductInput) -> str:
+        """Build the descriptive text that is compared by similarity."""
+        return f"{product.product_name}|{product.brand}|{product.category}"
+
+    @staticmethod
+    def attributes_key(product: ProductInput) -> str:
+        """Build the key of prompt inputs that must match exactly."""
+        content = f"{product.description}|{'|'.join(product.ingredients or [])}"
+        return "|".join(
+            str(value)
+            for value in (
+                product.nutrition_label_type,
+                product.is_hot_at_sale,
+                product.is_for_onsite_consumption,
+                product.alcohol_content,
+                product.contains_tobacco,
+                product.contains_cbd_cannabis,
+                product.is_live_animal,
+                compute_content_hash(content),
+            )
+        )
+
+    @staticmethod
+    def neutralize(product: ProductInput, result: AIReasoningResult) -> AIReasoningResult:
+        """Replace mentions of the product's name and id with placeholders."""
+        patterns = [
+            (re.compile(rf"(?<!\w){re.escape(value)}(?!\w)", re.IGNORECASE), placeholder)
+            for value, placeholder in (
+                (product.product_name, _NAME_PLACEHOLDER),
+                (product.product_id, _ID_PLACEHOLDER),
+            )
+            if value
+        ]
+
+        def neutral(text: str) -> str:
+            for pattern, placeholder in patterns:
+                text = pattern.sub(placeholder, text)
+            return text
+
+        return result.model_copy(
+            update={
+                "reasoning_chain": [neutral(t) for t in result.reasoning_chain],
+                "key_factors": [neutral(t) for t in result.key_factors],
+            }
+        )
+
+    @staticmethod
+    def personalize(product: ProductInput, result: AIReasoningResult) -> AIReasoningResult:
+        """Fill the placeholders of a stored result with a product's name and id."""
+
+        def personal(text: str) -> str:
+            return text.replace(_NAME_PLACEHOLDER, product.product_name).replace(
+                _ID_PLACEHOLDER, product.product_id
+            )
+
+        return result.model_copy(
+            update={
+                "reasoning_chain": [personal(t) for t in result.reasoning_chain],
+                "key_factors": [personal(t) for t in result.key_factors],
+            }
+        )
+
+    async def lookup(self, product: ProductInput) -> Optional[AIReasoningResult]:
+        """
+        Find a cached result for a similar product.
+
+        Args:
+            product: Product being classified
+
+        Returns:
+            Cached result for this product, or None on a miss
+        """
+        if not self.is_available:
+            return None
+
+        try:
+            result_json = await asyncio.to_thread(self._lookup, product)
+        except Exception as e:
+            logger.warning("semantic_cache_lookup_failed", error=str(e))
+            return None
+
+        if result_json is None:
+            return None
+        return self.personalize(product, AIReasoningResult.model_validate_json(result_json))
+
+    def _lookup(self, product: ProductInput) -> Optional[str]:
+        """Blocking cache lookup."""
+        collection = self.collection
+        if collection is None:
+            return None
+
+        embedding = self.vector_store.embeddings.embed_text(self.product_text(product))
+        if embedding is None:
+            return None
+
+        results = collection.query(
+            query_embeddings=[embedding],
+            n_results=1,
+            where={
+                "$and": [
+                    {"attributes_key": self.attributes_key(product)},
+                    {"expires_at": {"$gt": time.time()}},
+                ]
+            },
+            include=["metadatas", "distances"],
+        )
+
+        if not results["ids"] or not results["ids"][0]:
+            return None
+
+        similarity = 1.0 - results["distances"][0][0]
+        if similarity < self.threshold:
+            return None
+
+        logger.info(
+            "semantic_cache_hit",
+            product_id=product.product_id,
+            similarity=round(similarity, 4),
+        )
+        return results["metadatas"][0][0]["result_json"]
+
+    async def store(self, product: ProductInput, result: AIReasoningResult) -> None:
+        """
+        Store a result for a product.
+
+        Mentions of the product are stored as placeholders, so a hit for a
+        similar product never puts this product's name in its audit trail.
+
+        Args:
+            product: Product that was classified
+            result: AI reasoning result for the product
+        """
+        if not self.is_available:
+            return
+
+        prune = self._stores % self.PRUNE_INTERVAL == 0
+        self._stores += 1
+        result_json = self.neutralize(product, result).model_dump_json()
+
+        try:
+            await asyncio.to_thread(self._store, product, result_json, prune)
+        except Exception as e:
+            logger.warning("semantic_cache_store_failed", error=str(e))
+
+    def _store(self, product: ProductInput, result_json: str, prune: bool = False) -> None:
+        """Blocking cache write, first deleting expired entries if prune is set."""
+        collection = self.collection
+        if collection is None:
+            return
+
+        text = self.product_text(product)
+        embedding = self.vector_store.embeddings.embed_text(text)
+        if embedding is None:
+            return
+
+        # Entries past their TTL are never returned; drop them now and then
+        # so the collection does not grow without bound
+        now = time.time()
+        if prune:
+            collection.delete(where={"expires_at": {"$lte": now}})
+
+        collection.add(
+            ids=[str(uuid.uuid4())],
+            embeddings=[embedding],
+            documents=[text],
+            metadatas=[
+                {
+                    "attributes_key": self.attributes_key(product),
+                    "result_json": result_json,
+                    "expires_at": now + self.ttl_seconds,
+                }
+            ],
+        )
@@ -1,12 +1,69 @@
 """Decision tree tool for rule-based classification decisions."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _exceeds_alcohol_limit(value: Any) -> bool:
+    return value is not None and value > 0.005
+
+
+def _is_true(value: Any) -> bool:
+    return value is True
+
+
+def _is_supplement_label(value: Any) -> bool:
+    return value == "supplement_facts"
+
+
+# Single-attribute checks for evaluate_single_rule, keyed by rule name
+_RULE_DISPATCH = {
+    "alcohol": _exceeds_alcohol_limit,
+    "tobacco": _is_true,
+    "hot_food": _is_true,
+    "supplement": _is_supplement_label,
+    "cbd_cannabis": _is_true,
+    "live_animal": _is_true,
+    "onsite_consumption": _is_true,
+}
+
+
+class _ProductFlags:
+    """
+    Fixed-layout view of a product's rule failures.
+
+    Each attribute is True when the product fails the rule that names it in
+    DecisionTreeTool.RULES; attributes missing from the dict pass.
+    """
+
+    __slots__ = (
+        "non_food",
+        "alcohol",
+        "tobacco",
+        "supplement",
+        "hot",
+        "onsite",
+        "cbd",
+        "live_animal",
+    )
+
+    def __init__(self, product_attributes: Dict[str, Any]):
+        p = product_attributes
+        self.non_food = not p.get("is_human_food", True)
+        self.alcohol = not (p.get("alcohol_content") or 0) <= 0.005
+        self.tobacco = bool(p.get("contains_tobacco", False))
+        self.supplement = p.get("nutrition_label_type") == "supplement_facts"
+        self.hot = bool(p.get("is_hot_at_sale", False))
+        self.onsite = bool(p.get("is_for_onsite_consumption", False))
+        self.cbd = bool(p.get("contains_cbd_cannabis", False))
+        self.live_animal = bool(p.get("is_live_animal", False))
+
+
 class DecisionTreeTool:
     """Tool for applying SNAP eligibility decision tree."""
 
@@ -16,50 +73,83 @@ class DecisionTreeTool:
         "Input should be a JSON string with product attributes."
     )
 
-    # Decision tree rules
+    # Decision tree rules, in evaluation order; "fails_on" names the
+    # _ProductFlags attribute that is True when a product fails the rule
     RULES = [
         {
             "question": "Is it intended for human consumption?",
-            "check": lambda p: p.get("is_human_food", True),
+            "fails_on": "non_food",
             "false_result": ("INELIGIBLE", "INELIGIBLE_NON_FOOD"),
         },
         {
             "question": "Does it contain alcohol (>0.5% ABV)?",
-            "check": lambda p: (p.get("alcohol_content") or 0) <= 0.005,
+            "fails_on": "alcohol",
             "false_result": ("INELIGIBLE", "INELIGIBLE_ALCOHOL"),
         },
         {
             "question": "Is it a tobacco or nicotine product?",
-            "check": lambda p: not p.get("contains_tobacco", False),
+            "fails_on": "tobacco",
             "false_result": ("INELIGIBLE", "INELIGIBLE_TOBACCO"),
         },
         {
             "question": "Does it have a Supplement Facts label?",
-            "check": lambda p: p.get("nutrition_label_type") != "supplement_facts",
+            "fails_on": "supplement",
             "false_result": ("INELIGIBLE", "INELIGIBLE_SUPPLEMENT"),
         },
         {
             "question": "Is it hot at the point of sale?",
-            "check": lambda p: not p.get("is_hot_at_sale", False),
+            "fails_on": "hot",
             "false_result": ("INELIGIBLE", "INELIGIBLE_HOT_FOOD"),
         },
         {
             "question": "Is it intended for on-premises consumption?",
-            "check": lambda p: not p.get("is_for_onsite_consumption", False),
+            "fails_on": "onsite",
             "false_result": ("INELIGIBLE", "INELIGIBLE_ONSITE_CONSUMPTION"),
         },
         {
             "question": "Does it contain cannabis/CBD/controlled substances?",
-            "check": lambda p: not p.get("contains_cbd_cannabis", False),
+            "fails_on": "cbd",
             "false_result": ("INELIGIBLE", "INELIGIBLE_CBD_CANNABIS"),
         },
         {
             "question": "Is it a live animal (not shellfish/fish)?",
-            "check": lambda p: not p.get("is_live_animal", False),
+            "fails_on": "live_animal",
             "false_result": ("INELIGIBLE", "INELIGIBLE_LIVE_ANIMAL"),
         },
     ]
 
+    # Batches at least this large are evaluated with numpy in run_many
+    VECTORIZE_MIN_BATCH = 100
+
+    # RULES frozen as (question, fails_on, eligibility, category) tuples;
+    # the scalar and vectorized evaluations both read the flags from here
+    _RULES = tuple(
+        (rule["question"], rule["fails_on"], *rule["false_result"]) for rule in RULES
+    )
+    _QUESTIONS = tuple(question for question, _, _, _ in _RULES)
+    _FAILS_ON = tuple(fails_on for _, fails_on, _, _ in _RULES)
+    _FAIL_CATEGORIES = tuple(category for _, _, _, category in _RULES)
+
+    def __init__(self):
+        """Precompute the formatted result for every possible outcome."""
+        passes = [f"PASS: {question} -> Continue" for question in self._QUESTIONS]
+
+        self._eligible_output = self._format_result(
+            eligibility="ELIGIBLE",
+            category="ELIGIBLE_OTHER",
+            reasoning=passes + ["All checks passed -> ELIGIBLE"],
+        )
+        self._ineligible_outputs = tuple(
+            self._format_result(
+                eligibility="INELIGIBLE",
+                category=category,
+                reasoning=passes[:index] + [f"FAIL: {question} -> INELIGIBLE"],
+            )
+            for index, (question, category) in enumerate(
+                zip(self._QUESTIONS, self._FAIL_CATEGORIES)
+            )
+        )
+
     def run(self, product_attributes: Dict[str, Any]) -> str:
         """
         Apply decision tree to product attributes.
@@ -72,32 +162,79 @@ class DecisionTreeTool:
         """
         logger.info("decision_tree_evaluation", product=product_attributes)
 
-        reasoning = []
+        failed_index = self._first_failure(self._coerce(product_attributes))
+        if failed_index < 0:
+            return self._eligible_output
+        return self._ineligible_outputs[failed_index]
 
-        for rule in self.RULES:
-            question = rule["question"]
-            passed = rule["check"](product_attributes)
+    def run_many(self, products: List[Dict[str, Any]]) -> List[str]:
+        """
+        Apply the decision tree to many products.
 
-            if passed:
-                reasoning.append(f"PASS: {question} -> Continue")
-            else:
-                eligibility, category = rule["false_result"]
-                reasoning.append(f"FAIL: {question} -> {eligibility}")
+        Args:
+            products: List of product attribute dicts
 
-                return self._format_result(
-                    eligibility="INELIGIBLE",
-                    category=category,
-                    reasoning=reasoning,
-                )
+        Returns:
+            Decision tree results, in the same order as the input
+        """
+        logger.info("decision_tree_batch_evaluation", count=len(products))
 
-        # All rules passed - eligible
-        reasoning.append("All checks passed -> ELIGIBLE")
+        eligible_output = self._eligible_output
+        ineligible_outputs = self._ineligible_outputs
 
-        return self._format_result(
-            eligibility="ELIGIBLE",
-            category="ELIGIBLE_OTHER",
-            reasoning=reasoning,
-        )
+        if len(products) >= self.VECTORIZE_MIN_BATCH:
+            failed_indices = self.run_batch(products).tolist()
+        else:
+            first_failure = self._first_failure
+            failed_indices = [first_failure(self._coerce(product)) for product in products]
+
+        return [
+            eligible_output if failed_index < 0 else ineligible_outputs[failed_index]
+            for failed_index in failed_indices
+        ]
+
+    def run_batch(self, products: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Evaluate every rule for a batch of products with vectorized numpy ops.
+
+        Args:
+            products: List of product attribute dicts
+
+        Returns:
+            Array with the index of each product's first failing rule, or -1
+        """
+        count = len(products)
+        flags = [self._coerce(product) for product in products]
+
+        # One row per rule, in RULES order; True where the product fails it
+        fails = np.vstack([
+            np.fromiter(
+                (getattr(f, fails_on) for f in flags), dtype=bool, count=count
+            )
+            for fails_on in self._FAILS_ON
+        ])
+        return np.where(fails.any(axis=0), fails.argmax(axis=0), -1)
+
+    @staticmethod
+    def _coerce(product_attributes: Dict[str, Any]) -> _ProductFlags:
+        """Read the rule failures out of the attribute dict once."""
+        return _ProductFlags(product_attributes)
+
+    @classmethod
+    def _first_failure(cls, flags: _ProductFlags) -> int:
+        """
+        Find the first rule the product fails.
+
+        Args:
+            flags: Coerced product attributes
+
+        Returns:
+            Index into RULES of the failing rule, or -1 if all rules pass
+        """
+        for index, fails_on in enumerate(cls._FAILS_ON):
+            if getattr(flags, fails_on):
+                return index
+        return -1
 
     async def arun(self, product_attributes: Dict[str, Any]) -> str:
         """Async execution - wraps sync version."""
@@ -148,18 +285,8 @@ class DecisionTreeTool:
         Returns:
             Result if rule triggered, None otherwise
         """
-        rule_map = {
-            "alcohol": lambda v: v is not None and v > 0.005,
-            "tobacco": lambda v: v is True,
-            "hot_food": lambda v: v is True,
-            "supplement": lambda v: v == "supplement_facts",
-            "cbd_cannabis": lambda v: v is True,
-            "live_animal": lambda v: v is True,
-            "onsite_consumption": lambda v: v is True,
-        }
-
-        if rule_name in rule_map:
-            if rule_map[rule_name](value):
-                return f"INELIGIBLE_{rule_name.upper()}"
+        check = _RULE_DISPATCH.get(rule_name)
+        if check is not None and check(value):
+            return f"INELIGIBLE_{rule_name.upper()}"
 
         return None
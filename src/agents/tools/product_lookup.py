@@ -34,8 +34,8 @@ class ProductLookupTool:
         logger.info("product_lookup", query=query)
 
         try:
-            # Try USDA first if it's a UPC
-            if query.isdigit() and len(query) >= 12:
+            # Try USDA first if it's a UPC (cheap length test before the digit scan)
+            if len(query) >= 12 and query.isdigit():
                 result = self._lookup_by_upc(query)
             else:
                 result = self._lookup_by_name(query)
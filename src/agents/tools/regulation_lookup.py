@@ -1,5 +1,7 @@
 """RAG tool for looking up SNAP regulations."""
 
+import asyncio
+from functools import lru_cache
 from typing import List, Optional
 
 from src.rag.retriever import RetrievedDocument, SNAPRegulationRetriever, get_retriever
@@ -27,6 +29,10 @@ class RegulationLookupTool:
         """
         self.retriever = retriever or get_retriever()
 
+        # Eligibility queries repeat heavily; cache formatted results per instance
+        self._lookup_cached = lru_cache(maxsize=512)(self._lookup)
+        self._lookup_by_category_cached = lru_cache(maxsize=128)(self._lookup_by_category)
+
     def run(self, query: str) -> str:
         """
         Execute the regulation lookup.
@@ -40,12 +46,27 @@ class RegulationLookupTool:
         logger.info("regulation_lookup", query=query)
 
         try:
-            docs = self.retriever.retrieve(query, k=3)
-            return self._format_results(docs)
+            # The embedding model is uncased, so normalizing only improves hit rate
+            return self._lookup_cached(query.strip().lower())
         except Exception as e:
             logger.error("regulation_lookup_failed", error=str(e))
             return f"Error searching regulations: {str(e)}"
 
+    def clear_cache(self) -> None:
+        """Drop cached lookups, e.g. after the regulations index is rebuilt."""
+        self._lookup_cached.cache_clear()
+        self._lookup_by_category_cached.cache_clear()
+
+    def _lookup(self, query: str) -> str:
+        """Retrieve and format regulations for a normalized query."""
+        docs = self.retriever.retrieve(query, k=3)
+        return self._format_results(docs)
+
+    def _lookup_by_category(self, category: str) -> str:
+        """Retrieve and format regulations for a category."""
+        docs = self.retriever.retrieve_by_category(category, k=3)
+        return self._format_results(docs)
+
     async def arun(self, query: str) -> str:
         """
         Async execution of regulation lookup.
@@ -56,8 +77,8 @@ class RegulationLookupTool:
         Returns:
             Formatted string of relevant regulations
         """
-        # For now, just wrap the sync version
-        return self.run(query)
+        # Retrieval is synchronous Chroma I/O; run it off the event loop
+        return await asyncio.to_thread(self.run, query)
 
     def _format_results(self, docs: List[RetrievedDocument]) -> str:
         """
@@ -98,8 +119,7 @@ class RegulationLookupTool:
         Returns:
             Formatted string of relevant regulations
         """
-        docs = self.retriever.retrieve_by_category(category, k=3)
-        return self._format_results(docs)
+        return self._lookup_by_category_cached(category)
 
     def lookup_for_product(
         self,
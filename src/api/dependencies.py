@@ -1,13 +1,20 @@
 """FastAPI dependency injection."""
 
+from functools import lru_cache
 from typing import AsyncGenerator
 
+import anyio.to_thread
+
+from src.agents.classification_agent import ClassificationAgent
+from src.core.config import settings
 from src.data.database import Database, get_database, initialize_database
 from src.data.repositories.audit_repo import AuditRepository
 from src.data.repositories.classification_repo import ClassificationRepository
 from src.data.repositories.product_repo import ProductRepository
+from src.services.ai_reasoning_agent import AIReasoningAgent
 from src.services.challenge_handler import ChallengeHandler, get_challenge_handler
 from src.services.classification_engine import ClassificationEngine, get_classification_engine
+from src.utils.http_clients import close_shared_client, get_shared_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,14 +30,26 @@ async def get_db() -> Database:
     return get_database()
 
 
+@lru_cache(maxsize=1)
+def _product_repository() -> ProductRepository:
+    """Build the shared product repository."""
+    return ProductRepository()
+
+
 async def get_product_repository() -> ProductRepository:
     """
     Get product repository instance.
 
     Returns:
-        ProductRepository instance
+        Shared ProductRepository instance
     """
-    return ProductRepository()
+    return _product_repository()
+
+
+@lru_cache(maxsize=1)
+def _classification_repository() -> ClassificationRepository:
+    """Build the shared classification repository."""
+    return ClassificationRepository()
 
 
 async def get_classification_repository() -> ClassificationRepository:
@@ -38,9 +57,15 @@ async def get_classification_repository() -> ClassificationRepository:
     Get classification repository instance.
 
     Returns:
-        ClassificationRepository instance
+        Shared ClassificationRepository instance
     """
-    return ClassificationRepository()
+    return _classification_repository()
+
+
+@lru_cache(maxsize=1)
+def _audit_repository() -> AuditRepository:
+    """Build the shared audit repository."""
+    return AuditRepository()
 
 
 async def get_audit_repository() -> AuditRepository:
@@ -48,12 +73,12 @@ async def get_audit_repository() -> AuditRepository:
     Get audit repository instance.
 
     Returns:
-        AuditRepository instance
+        Shared AuditRepository instance
     """
-    return AuditRepository()
+    return _audit_repository()
 
 
-def get_engine() -> ClassificationEngine:
+async def get_engine() -> ClassificationEngine:
     """
     Get classification engine instance.
 
@@ -63,44 +88,47 @@ def get_engine() -> ClassificationEngine:
     return get_classification_engine()
 
 
+class CloudAIReasoningAgent(AIReasoningAgent):
+    """AI reasoning agent that calls the Ollama Cloud OpenAI-compatible API."""
+
+    def __init__(self, api_key: str):
+        super().__init__()
+        self.cloud_api_key = api_key
+        self._agent = None
+
+    @property
+    def agent(self) -> ClassificationAgent:
+        if self._agent is None:
+            self._agent = ClassificationAgent(
+                retriever=self.retriever,
+                model_name=settings.ollama_cloud_model,
+            )
+            # Override the LLM with cloud configuration
+            from langchain_openai import ChatOpenAI
+            self._agent._llm = ChatOpenAI(
+                model=settings.ollama_cloud_model,
+                api_key=self.cloud_api_key,
+                base_url=settings.ollama_cloud_base_url,
+                temperature=0.1,
+                http_async_client=get_shared_client(),
+            )
+        return self._agent
+
+
+@lru_cache(maxsize=64)
 def get_cloud_engine(api_key: str) -> ClassificationEngine:
     """
     Get a classification engine configured for cloud LLM.
 
+    Engines are cached per API key so repeat callers share one agent, and
+    all cloud agents send requests through the shared HTTP client.
+
     Args:
         api_key: Cloud API key
 
     Returns:
         ClassificationEngine with cloud LLM
     """
-    from src.agents.classification_agent import ClassificationAgent
-    from src.services.ai_reasoning_agent import AIReasoningAgent
-    from src.core.config import settings
-
-    # Create a cloud-configured classification agent
-    class CloudAIReasoningAgent(AIReasoningAgent):
-        def __init__(self, api_key: str):
-            super().__init__()
-            self.cloud_api_key = api_key
-            self._agent = None
-
-        @property
-        def agent(self):
-            if self._agent is None:
-                self._agent = ClassificationAgent(
-                    retriever=self.retriever,
-                    model_name=settings.ollama_cloud_model,
-                )
-                # Override the LLM with cloud configuration
-                from langchain_openai import ChatOpenAI
-                self._agent.llm = ChatOpenAI(
-                    model=settings.ollama_cloud_model,
-                    api_key=self.cloud_api_key,
-                    base_url=settings.ollama_cloud_base_url,
-                    temperature=0.1,
-                )
-            return self._agent
-
     cloud_agent = CloudAIReasoningAgent(api_key)
     return ClassificationEngine(ai_agent=cloud_agent)
 
@@ -123,10 +151,27 @@ async def startup_event() -> None:
     """
     logger.info("application_starting")
 
+    # Size the worker thread pool shared by sync dependencies and routes
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.threadpool_size
+    )
+
     # Initialize database
     db = get_database()
     await initialize_database(db)
 
+    # Build the shared HTTP client now; loading its SSL context takes tens
+    # of milliseconds that would otherwise block the first USDA/price call
+    get_shared_client()
+
+    # Import the cloud LLM client up front so the first cloud request does
+    # not pay for loading langchain_openai and its dependencies
+    if settings.ollama_cloud_enabled:
+        try:
+            import langchain_openai  # noqa: F401
+        except ImportError:
+            logger.warning("langchain_openai_not_available")
+
     logger.info("application_started")
 
 
@@ -137,4 +182,6 @@ async def shutdown_event() -> None:
     Cleans up resources.
     """
     logger.info("application_shutting_down")
+    await close_shared_client()
+    await get_database().close()
     logger.info("application_shutdown_complete")
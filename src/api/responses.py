@@ -0,0 +1,18 @@
+"""Response classes shared by the API routes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Routes return it directly when the content is already JSON-native,
+    which skips FastAPI's jsonable_encoder walk and the stdlib encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,13 +1,15 @@
 """Audit trail endpoint."""
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.api.dependencies import get_audit_repository
+from src.api.responses import ORJSONResponse
 from src.data.repositories.audit_repo import AuditRepository
-from src.models.audit import AuditTrailQuery
+from src.models.audit import AuditSummary, AuditTrailQuery
 
 router = APIRouter(prefix="/audit-trail", tags=["audit"])
 
@@ -25,13 +27,21 @@ async def get_audit_trail(
     product_id: Optional[str] = Query(None, description="Filter by product ID"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor_timestamp: Optional[datetime] = Query(
+        None, description="next_cursor timestamp from the previous page"
+    ),
+    cursor_audit_id: Optional[str] = Query(
+        None, description="next_cursor audit_id from the previous page"
+    ),
     audit_repo: AuditRepository = Depends(get_audit_repository),
-) -> dict:
+) -> ORJSONResponse:
     """
     Query audit trail records with filters.
 
     Returns:
-        Paginated audit trail records
+        Paginated audit trail records. Pass next_cursor back as
+        cursor_timestamp/cursor_audit_id to fetch the following page
+        without an offset scan.
     """
     try:
         query = AuditTrailQuery(
@@ -43,32 +53,36 @@ async def get_audit_trail(
             product_id=product_id,
             limit=limit,
             offset=offset,
+            cursor_timestamp=cursor_timestamp,
+            cursor_audit_id=cursor_audit_id,
         )
 
-        # Get summaries instead of full records for better performance
-        summaries = await audit_repo.get_summaries(query)
-        total = await audit_repo.count(query)
+        # Get summaries instead of full records for better performance; the
+        # page and the total are independent reads on separate connections
+        summaries, total = await asyncio.gather(
+            audit_repo.get_summaries(query),
+            audit_repo.count(query),
+        )
 
-        return {
-            "total_records": total,
-            "returned_records": len(summaries),
-            "limit": limit,
-            "offset": offset,
-            "records": [
-                {
-                    "audit_id": s.audit_id,
-                    "timestamp": s.timestamp.isoformat(),
-                    "product_id": s.product_id,
-                    "product_name": s.product_name,
-                    "is_ebt_eligible": s.is_ebt_eligible,
-                    "classification_category": s.classification_category,
-                    "confidence_score": s.confidence_score,
-                    "model_used": s.model_used,
-                    "was_challenged": s.was_challenged,
-                }
-                for s in summaries
-            ],
-        }
+        next_cursor = None
+        if len(summaries) == limit:
+            last = summaries[-1]
+            next_cursor = {
+                "timestamp": last.timestamp.isoformat(),
+                "audit_id": last.audit_id,
+            }
+
+        # Records are JSON-native, so they are serialized once by orjson
+        return ORJSONResponse(
+            {
+                "total_records": total,
+                "returned_records": len(summaries),
+                "limit": limit,
+                "offset": offset,
+                "next_cursor": next_cursor,
+                "records": [_summary_to_dict(s) for s in summaries],
+            }
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -85,17 +99,10 @@ async def get_audit_stats(
         Statistics summary
     """
     try:
-        # Count all records
-        total_query = AuditTrailQuery(limit=1)
-        total = await audit_repo.count(total_query)
-
-        # Count eligible
-        eligible_query = AuditTrailQuery(is_ebt_eligible=True, limit=1)
-        eligible = await audit_repo.count(eligible_query)
-
-        # Count challenged
-        challenged_query = AuditTrailQuery(was_challenged=True, limit=1)
-        challenged = await audit_repo.count(challenged_query)
+        stats = await audit_repo.get_stats()
+        total = stats["total"]
+        eligible = stats["eligible"]
+        challenged = stats["challenged"]
 
         return {
             "total_classifications": total,
@@ -163,3 +170,18 @@ async def get_audit_record(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _summary_to_dict(summary: AuditSummary) -> dict:
+    """Convert an audit summary to a JSON-native dict."""
+    return {
+        "audit_id": summary.audit_id,
+        "timestamp": summary.timestamp.isoformat(),
+        "product_id": summary.product_id,
+        "product_name": summary.product_name,
+        "is_ebt_eligible": summary.is_ebt_eligible,
+        "classification_category": summary.classification_category,
+        "confidence_score": summary.confidence_score,
+        "model_used": summary.model_used,
+        "was_challenged": summary.was_challenged,
+    }
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 
 from src.api.dependencies import get_challenger
+from src.api.routes.explain import invalidate_explanation
 from src.core.exceptions import AuditNotFoundError, ChallengeError
 from src.models.audit import ChallengeRequest, ChallengeResponse
 from src.services.challenge_handler import ChallengeHandler
@@ -31,6 +32,7 @@ async def challenge_classification(
             audit_id=audit_id,
             challenge=challenge,
         )
+        invalidate_explanation(audit_id)
         return result
 
     except AuditNotFoundError:
@@ -59,26 +61,12 @@ async def get_challenge_history(
         Challenge history
     """
     try:
-        from src.data.repositories.audit_repo import AuditRepository
+        return await handler.get_challenge_history_by_audit_id(audit_id)
 
-        audit_repo = AuditRepository()
-        audit_record = await audit_repo.get_by_audit_id(audit_id)
-
-        if not audit_record:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Audit record not found: {audit_id}",
-            )
-
-        product_id = audit_record.classification_result.product_id
-        history = await handler.get_challenge_history(product_id)
-
-        return {
-            "product_id": product_id,
-            "challenges": history,
-        }
-
-    except HTTPException:
-        raise
+    except AuditNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Audit record not found: {audit_id}",
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
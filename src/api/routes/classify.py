@@ -1,17 +1,27 @@
 """Classification endpoints."""
 
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi.responses import StreamingResponse
 
 from src.api.dependencies import get_engine, get_cloud_engine
+from src.core.config import settings
 from src.core.exceptions import ClassificationError, ValidationError
 from src.models.classification import BulkClassificationResult, ClassificationResult
 from src.models.product import BulkClassifyRequest, ProductInput
 from src.services.classification_engine import ClassificationEngine
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/classify", tags=["classification"])
 
+# Caps bulk requests running at once across all clients
+_bulk_semaphore = asyncio.Semaphore(settings.bulk_global_concurrency)
+
 
 @router.post("", response_model=ClassificationResult)
 @router.post("/", response_model=ClassificationResult)
@@ -36,7 +46,7 @@ async def classify_product(
         if x_ollama_mode == "cloud" and x_ollama_cloud_key:
             engine = get_cloud_engine(x_ollama_cloud_key)
         else:
-            engine = get_engine()
+            engine = await get_engine()
 
         result = await engine.classify(
             product=product,
@@ -66,14 +76,63 @@ async def bulk_classify(
     """
     try:
         options = request.options or {}
-
-        result = await engine.bulk_classify(
-            products=request.products,
-            max_concurrent=getattr(options, "max_concurrent", 5),
-            fail_fast=getattr(options, "fail_fast", False),
+        max_concurrent = min(
+            getattr(options, "max_concurrent", 5),
+            settings.bulk_per_request_max,
         )
+
+        async with _bulk_semaphore:
+            result = await engine.bulk_classify(
+                products=request.products,
+                max_concurrent=max_concurrent,
+                fail_fast=getattr(options, "fail_fast", False),
+            )
         return result
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bulk/stream")
+async def bulk_classify_stream(
+    request: BulkClassifyRequest,
+    engine: ClassificationEngine = Depends(get_engine),
+) -> StreamingResponse:
+    """
+    Classify multiple products, streaming results as NDJSON.
+
+    Each line is {"success": true, "result": ClassificationResult} or
+    {"success": false, "product_id": ..., "error": ...}, in completion order.
+    If the request fails part-way, the last line is {"success": false,
+    "error": ...} without a product_id.
+
+    Args:
+        request: Bulk classification request with products and options
+
+    Returns:
+        StreamingResponse of newline-delimited JSON
+    """
+    options = request.options or {}
+    max_concurrent = min(
+        getattr(options, "max_concurrent", 5),
+        settings.bulk_per_request_max,
+    )
+
+    async def stream() -> AsyncIterator[bytes]:
+        async with _bulk_semaphore:
+            try:
+                async for item in engine.bulk_classify_iter(
+                    products=request.products,
+                    max_concurrent=max_concurrent,
+                    fail_fast=getattr(options, "fail_fast", False),
+                ):
+                    if item["success"]:
+                        item = {"success": True, "result": item["result"].model_dump(mode="json")}
+                    yield orjson.dumps(item) + b"\n"
+            except Exception as e:
+                # The 200 status is already sent; report the failure in-band
+                logger.error("bulk_stream_failed", error=str(e))
+                yield orjson.dumps({"success": False, "error": str(e)}) + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
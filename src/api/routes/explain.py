@@ -1,21 +1,50 @@
 """Explanation endpoint for detailed classification reasoning."""
 
-from typing import Any, Dict
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from src.api.dependencies import get_audit_repository
 from src.core.exceptions import AuditNotFoundError
 from src.data.repositories.audit_repo import AuditRepository
+from src.models.audit import (
+    ChallengeInfo,
+    ExplanationClassification,
+    ExplanationDetails,
+    ExplanationMetadata,
+    ExplanationProduct,
+    ExplanationResponse,
+)
 
 router = APIRouter(prefix="/explain", tags=["explanation"])
 
+ChallengeState = tuple[bool, Optional[datetime]]
 
-@router.get("/{audit_id}")
+# Serialized explanations by audit ID, with the challenge state they were
+# built from. Audit records only change when they are challenged, so a hit is
+# served only while the stored state still matches; that also covers
+# challenges made through other processes or racing with a cache fill.
+_EXPLAIN_CACHE_SIZE = 4096
+_explain_cache: OrderedDict[str, tuple[ChallengeState, bytes]] = OrderedDict()
+
+
+def invalidate_explanation(audit_id: str) -> None:
+    """
+    Drop the cached explanation for an audit record.
+
+    Args:
+        audit_id: Audit ID whose record changed
+    """
+    _explain_cache.pop(audit_id, None)
+
+
+@router.get("/{audit_id}", response_model=ExplanationResponse)
 async def get_explanation(
     audit_id: str,
     audit_repo: AuditRepository = Depends(get_audit_repository),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get detailed explanation for a classification.
 
@@ -26,6 +55,14 @@ async def get_explanation(
         Detailed explanation with reasoning and citations
     """
     try:
+        cached = _explain_cache.get(audit_id)
+        if cached is not None:
+            state, content = cached
+            if await audit_repo.get_challenge_state(audit_id) == state:
+                _explain_cache.move_to_end(audit_id)
+                return Response(content=content, media_type="application/json")
+            invalidate_explanation(audit_id)
+
         audit_record = await audit_repo.get_by_audit_id(audit_id)
 
         if not audit_record:
@@ -36,48 +73,48 @@ async def get_explanation(
 
         result = audit_record.classification_result
 
-        return {
-            "audit_id": audit_id,
-            "product": {
-                "product_id": result.product_id,
-                "product_name": result.product_name,
-            },
-            "classification": {
-                "is_ebt_eligible": result.is_ebt_eligible,
-                "confidence_score": result.confidence_score,
-                "classification_category": result.classification_category.value,
-            },
-            "explanation": {
-                "reasoning_chain": result.reasoning_chain,
-                "key_factors": result.key_factors,
-                "regulation_citations": [
-                    {
-                        "regulation_id": c.regulation_id,
-                        "section": c.section,
-                        "excerpt": c.excerpt,
-                        "relevance_score": c.relevance_score,
-                        "source_url": c.source_url,
-                    }
-                    for c in result.regulation_citations
-                ],
-            },
-            "metadata": {
-                "classification_timestamp": result.classification_timestamp.isoformat(),
-                "model_version": result.model_version,
-                "processing_time_ms": result.processing_time_ms,
-                "data_sources_used": result.data_sources_used,
-            },
-            "original_request": audit_record.request_payload,
-            "challenge_info": {
-                "was_challenged": audit_record.was_challenged,
-                "challenge_reason": audit_record.challenge_reason,
-                "challenge_timestamp": (
-                    audit_record.challenge_timestamp.isoformat()
-                    if audit_record.challenge_timestamp
-                    else None
-                ),
-            },
-        }
+        explanation = ExplanationResponse(
+            audit_id=audit_id,
+            product=ExplanationProduct(
+                product_id=result.product_id,
+                product_name=result.product_name,
+            ),
+            classification=ExplanationClassification(
+                is_ebt_eligible=result.is_ebt_eligible,
+                confidence_score=result.confidence_score,
+                classification_category=result.classification_category.value,
+            ),
+            explanation=ExplanationDetails(
+                reasoning_chain=result.reasoning_chain,
+                key_factors=result.key_factors,
+                regulation_citations=result.regulation_citations,
+            ),
+            metadata=ExplanationMetadata(
+                classification_timestamp=result.classification_timestamp,
+                model_version=result.model_version,
+                processing_time_ms=result.processing_time_ms,
+                data_sources_used=result.data_sources_used,
+            ),
+            original_request=audit_record.request_payload,
+            challenge_info=ChallengeInfo(
+                was_challenged=audit_record.was_challenged,
+                challenge_reason=audit_record.challenge_reason,
+                challenge_timestamp=audit_record.challenge_timestamp,
+            ),
+        )
+
+        # Citations are serialized from the stored models by pydantic-core
+        # in one pass, without reshaping them into intermediate dicts
+        content = explanation.model_dump_json().encode()
+
+        _explain_cache[audit_id] = (
+            (audit_record.was_challenged, audit_record.challenge_timestamp),
+            content,
+        )
+        if len(_explain_cache) > _EXPLAIN_CACHE_SIZE:
+            _explain_cache.popitem(last=False)
+
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         raise
@@ -1,7 +1,12 @@
 """Health check endpoint."""
 
+import asyncio
+import time
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
+import anyio.to_thread
 from fastapi import APIRouter, Depends
 
 from src.api.dependencies import get_db
@@ -10,6 +15,58 @@ from src.data.database import Database
 
 router = APIRouter(tags=["health"])
 
+# Last database probe as (monotonic time, status), shared by all requests
+_last_probe: Optional[tuple[float, str]] = None
+_probe_lock = asyncio.Lock()
+
+
+async def _probe_database(db: Database) -> str:
+    """
+    Check database connectivity, reusing a recent result.
+
+    Probes are cached for settings.health_cache_ttl seconds and concurrent
+    callers share a single in-flight probe, so frequent liveness checks
+    cost at most one query per TTL window.
+
+    Args:
+        db: Database instance
+
+    Returns:
+        "healthy" or "unhealthy"
+    """
+    global _last_probe
+
+    if _last_probe and time.monotonic() - _last_probe[0] < settings.health_cache_ttl:
+        return _last_probe[1]
+
+    async with _probe_lock:
+        # Another request may have refreshed the probe while we waited
+        now = time.monotonic()
+        if _last_probe and now - _last_probe[0] < settings.health_cache_ttl:
+            return _last_probe[1]
+
+        db_status = "healthy"
+        try:
+            await asyncio.wait_for(
+                db.fetch_one("SELECT 1"),
+                timeout=settings.health_probe_timeout,
+            )
+        except Exception:
+            db_status = "unhealthy"
+
+        _last_probe = (now, db_status)
+        return db_status
+
+
+@lru_cache(maxsize=1)
+def _configuration_status() -> dict:
+    """Summarize the configured providers; settings are fixed after startup."""
+    return {
+        "llm_configured": settings.is_llm_configured,
+        "llm_provider": settings.llm_provider if settings.llm_api_key else ("gemini" if settings.is_gemini_configured else ("ollama" if settings.ollama_enabled else "none")),
+        "usda_configured": settings.is_usda_configured,
+    }
+
 
 @router.get("/health")
 async def health_check(
@@ -22,18 +79,12 @@ async def health_check(
         Health status dict
     """
     # Check database connectivity
-    db_status = "healthy"
-    try:
-        await db.fetch_one("SELECT 1")
-    except Exception:
-        db_status = "unhealthy"
+    db_status = await _probe_database(db)
 
     # Check configuration
-    config_status = {
-        "llm_configured": settings.is_llm_configured,
-        "llm_provider": settings.llm_provider if settings.llm_api_key else ("gemini" if settings.is_gemini_configured else ("ollama" if settings.ollama_enabled else "none")),
-        "usda_configured": settings.is_usda_configured,
-    }
+    config_status = _configuration_status()
+
+    thread_limiter = anyio.to_thread.current_default_thread_limiter()
 
     return {
         "status": "healthy" if db_status == "healthy" else "degraded",
@@ -42,6 +93,11 @@ async def health_check(
         "components": {
             "database": db_status,
             "configuration": config_status,
+            "resources": {
+                "database_operations": db.pending_operations,
+                "threadpool_size": thread_limiter.total_tokens,
+                "threadpool_in_use": thread_limiter.borrowed_tokens,
+            },
         },
     }
 
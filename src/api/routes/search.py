@@ -1,21 +1,48 @@
 """Product search routes."""
 
-import json
-import re
-from typing import List, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, Query, Header
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from src.core.config import settings
-from src.data.external.usda_api import get_usda_client
-from src.services.pricing import search_product_prices, PriceInfo
+from src.data.external.usda_api import USDAFoodDataClient, get_usda_client
+from src.services.pricing import get_price_by_barcode, search_product_prices, PriceInfo
+from src.utils.http_clients import get_shared_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/search", tags=["search"])
 
+# Recent USDA searches as (expires_at, task), keyed by (query, page size)
+_USDA_CACHE_SIZE = 2048
+_usda_cache: OrderedDict[tuple[str, int], tuple[float, asyncio.Task]] = OrderedDict()
+
+# Output budget for suggestions: about 40 tokens per product at the
+# maximum page size of 50
+_SUGGESTION_MAX_TOKENS = 2048
+
+_SUGGESTION_PROMPT = """You are a product database assistant. Given a search query, suggest real grocery/food products that match.
+
+Search query: "{query}"
+
+Return exactly {limit} products as a JSON array. Each product should have:
+- name: Full product name (be specific, e.g., "Horizon Organic Whole Milk" not just "Milk")
+- brand: Brand name if applicable (e.g., "Horizon", "Tropicana", "Lay's")
+- category: One of: Produce, Dairy, Meat, Seafood, Bakery, Beverages, Snacks, Frozen Foods, Canned Goods, Condiments, Baby Food, Supplements, Alcohol, Tobacco, Prepared Foods, Other
+- typical_price: Typical US retail price in dollars (number only, e.g., 4.99)
+
+Return ONLY valid JSON array, no other text. Example format:
+[{{"name": "Horizon Organic Whole Milk", "brand": "Horizon", "category": "Dairy", "typical_price": 5.99}}]
+
+Products matching "{query}":"""
+
 
 class ProductSuggestion(BaseModel):
     """A product suggestion from search."""
@@ -36,6 +63,12 @@ class ProductSuggestion(BaseModel):
     price_source: Optional[str] = None
 
 
+_SUGGESTIONS_ADAPTER = TypeAdapter(List[ProductSuggestion])
+
+# UPC-A, EAN-13 and GTIN-14 barcode lengths
+_UPC_LENGTHS = (12, 13, 14)
+
+
 class SearchResponse(BaseModel):
     """Search response with product suggestions."""
 
@@ -63,27 +96,31 @@ async def search_products(
     logger.info("product_search", query=q, limit=limit, include_prices=include_prices)
 
     usda_client = get_usda_client()
+    usda_configured = usda_client.is_configured()
     results: List[ProductSuggestion] = []
 
+    # Scanned barcodes resolve to a single branded product and its prices
+    is_upc = q.isdigit() and len(q) in _UPC_LENGTHS
+
+    # Prices depend only on the query, so fetch them alongside the USDA search
+    price_task = None
+    if include_prices and usda_configured:
+        price_task = asyncio.create_task(
+            get_price_by_barcode(q)
+            if is_upc
+            else search_product_prices(q, limit=limit * 2)
+        )
+
     # Try USDA search if configured
-    if usda_client.is_configured():
+    if usda_configured:
         try:
-            usda_results = await usda_client.search_foods(
-                query=q,
-                page_size=limit,
-            )
+            if is_upc:
+                food = await usda_client.search_by_upc(q)
+                usda_results = {"foods": [food] if food else []}
+            else:
+                usda_results = await _search_usda_cached(usda_client, q, limit)
 
-            for food in usda_results.get("foods", []):
-                results.append(ProductSuggestion(
-                    name=food.get("description", "Unknown"),
-                    brand=food.get("brandOwner") or food.get("brandName"),
-                    category=food.get("foodCategory"),
-                    upc=food.get("gtinUpc"),
-                    description=food.get("additionalDescriptions"),
-                    ingredients=food.get("ingredients"),
-                    fdc_id=food.get("fdcId"),
-                    data_source="usda",
-                ))
+            results = _usda_suggestions(usda_results.get("foods", []))
 
             logger.info("usda_search_success", results=len(results))
 
@@ -99,65 +136,145 @@ async def search_products(
 
     # If no LLM prices, try Open Prices API
     if include_prices and results and not has_pricing:
-        has_pricing = await _enrich_with_prices(q, results)
+        if is_upc:
+            has_pricing = await _enrich_with_barcode_price(q, results, price_task)
+        else:
+            has_pricing = await _enrich_with_prices(q, results, price_task)
+    elif price_task:
+        price_task.cancel()
 
     return SearchResponse(
         query=q,
         results=results[:limit],
         total=len(results),
-        source="usda" if usda_client.is_configured() and results else "llm",
+        source="usda" if usda_configured and results else "llm",
         has_pricing=has_pricing,
     )
 
 
-async def _enrich_with_prices(query: str, results: List[ProductSuggestion]) -> bool:
+def _usda_suggestions(foods: List[Dict[str, Any]]) -> List[ProductSuggestion]:
+    """
+    Build suggestions from USDA foods, skipping any that fail validation.
+
+    All foods are validated in one pass; only if that fails are they
+    validated one by one so the valid ones are kept.
+    """
+    items = [
+        {
+            "name": food.get("description") or "Unknown",
+            "brand": food.get("brandOwner") or food.get("brandName"),
+            "category": food.get("foodCategory"),
+            "upc": food.get("gtinUpc"),
+            "description": food.get("additionalDescriptions"),
+            "ingredients": food.get("ingredients"),
+            "fdc_id": food.get("fdcId"),
+            "data_source": "usda",
+        }
+        for food in foods
+    ]
+    try:
+        return _SUGGESTIONS_ADAPTER.validate_python(items)
+    except ValidationError:
+        pass
+
+    results = []
+    for item in items:
+        try:
+            results.append(ProductSuggestion.model_validate(item))
+        except ValidationError as e:
+            logger.warning("usda_food_skipped", fdc_id=item["fdc_id"], error=str(e))
+    return results
+
+
+async def _search_usda_cached(
+    usda_client: USDAFoodDataClient,
+    query: str,
+    limit: int,
+) -> Dict[str, Any]:
+    """
+    Search USDA, sharing results between identical recent queries.
+
+    Concurrent callers with the same query await one in-flight request,
+    and completed results are reused for settings.usda_cache_ttl seconds.
+    Failed searches are not cached.
+
+    Args:
+        usda_client: USDA API client
+        query: Search query
+        limit: Page size
+
+    Returns:
+        USDA search results dict
+    """
+    key = (query.strip().lower(), limit)
+    now = time.monotonic()
+
+    entry = _usda_cache.get(key)
+    if entry and entry[0] > now:
+        _usda_cache.move_to_end(key)
+        task = entry[1]
+    else:
+        task = asyncio.create_task(
+            usda_client.search_foods(query=query, page_size=limit)
+        )
+        _usda_cache[key] = (now + settings.usda_cache_ttl, task)
+        if len(_usda_cache) > _USDA_CACHE_SIZE:
+            _usda_cache.popitem(last=False)
+
+    try:
+        # Shielded so one caller's cancellation does not cancel the search
+        # for everyone else awaiting it
+        return await asyncio.shield(task)
+    except Exception:
+        if _usda_cache.get(key, (None, None))[1] is task:
+            del _usda_cache[key]
+        raise
+
+
+async def _enrich_with_prices(
+    query: str,
+    results: List[ProductSuggestion],
+    price_task: Optional[asyncio.Task] = None,
+) -> bool:
     """
     Enrich product results with pricing data from Open Prices API.
 
+    Uses the already started price_task when given instead of fetching.
+
     Returns True if any pricing data was found.
     """
     try:
-        price_data = await search_product_prices(query, limit=len(results) * 2)
+        if price_task is not None:
+            price_data = await price_task
+        else:
+            price_data = await search_product_prices(query, limit=len(results) * 2)
 
         if not price_data:
             return False
 
-        # Create lookup by normalized product name
+        # Create lookup by normalized product name, also indexed by the
+        # first few words for fuzzy matching
         price_lookup = {}
         for p in price_data:
-            key = p.product_name.lower().strip()
+            key, prefix = _price_keys(p.product_name)
             price_lookup[key] = p
-            # Also index by first few words for fuzzy matching
-            words = key.split()[:3]
-            if len(words) >= 2:
-                price_lookup[" ".join(words)] = p
+            if prefix:
+                price_lookup[prefix] = p
 
-        # Match prices to products
+        # Match prices to products, trying an exact match first
         matched = 0
         for result in results:
-            result_name = result.name.lower().strip()
+            key, prefix = _price_keys(result.name)
+            price_info = price_lookup.get(key)
+            if price_info is None and prefix:
+                price_info = price_lookup.get(prefix)
 
-            # Try exact match first
-            if result_name in price_lookup:
-                price_info = price_lookup[result_name]
+            if price_info is not None:
                 result.avg_price = price_info.avg_price
                 result.min_price = price_info.min_price
                 result.max_price = price_info.max_price
                 result.price_source = "Open Prices"
                 matched += 1
-                continue
-
-            # Try partial match
-            result_words = result_name.split()[:3]
-            if len(result_words) >= 2:
-                partial_key = " ".join(result_words)
-                if partial_key in price_lookup:
-                    price_info = price_lookup[partial_key]
-                    result.avg_price = price_info.avg_price
-                    result.min_price = price_info.min_price
-                    result.max_price = price_info.max_price
-                    result.price_source = "Open Prices"
-                    matched += 1
 
         logger.info("prices_matched", matched=matched, total=len(results))
         return matched > 0
@@ -167,6 +284,54 @@ async def _enrich_with_prices(query: str, results: List[ProductSuggestion]) -> b
         return False
 
 
+async def _enrich_with_barcode_price(
+    barcode: str,
+    results: List[ProductSuggestion],
+    price_task: Optional[asyncio.Task] = None,
+) -> bool:
+    """
+    Enrich the product with a scanned barcode with its Open Prices data.
+
+    Uses the already started price_task when given instead of fetching.
+
+    Returns True if pricing data was found.
+    """
+    if price_task is not None:
+        price_info = await price_task
+    else:
+        price_info = await get_price_by_barcode(barcode)
+
+    if price_info is None:
+        return False
+
+    matched = 0
+    for result in results:
+        if result.upc == barcode:
+            result.avg_price = price_info.avg_price
+            result.min_price = price_info.min_price
+            result.max_price = price_info.max_price
+            result.price_source = "Open Prices"
+            matched += 1
+
+    logger.info("barcode_prices_matched", matched=matched, total=len(results))
+    return matched > 0
+
+
+def _price_keys(name: str) -> tuple[str, Optional[str]]:
+    """
+    Build the keys used to match a product name to prices.
+
+    Args:
+        name: Product name
+
+    Returns:
+        Normalized full name, and its first three words if it has at least two
+    """
+    key = name.casefold().strip()
+    words = key.split(maxsplit=3)[:3]
+    return key, " ".join(words) if len(words) >= 2 else None
+
+
 async def _get_llm_suggestions(
     query: str,
     limit: int,
@@ -185,66 +350,19 @@ async def _get_llm_suggestions(
         return []
 
     try:
-        if use_cloud:
-            # Use Ollama Cloud via OpenAI-compatible API
-            from langchain_openai import ChatOpenAI
-
-            llm = ChatOpenAI(
-                model=settings.ollama_cloud_model,
-                api_key=ollama_cloud_key,
-                base_url=settings.ollama_cloud_base_url,
-                temperature=0.3,
-            )
-            logger.info("using_ollama_cloud_for_search", model=settings.ollama_cloud_model)
-        else:
-            # Use local Ollama - try to import langchain_ollama
-            try:
-                from langchain_ollama import ChatOllama
-
-                llm = ChatOllama(
-                    model=settings.ollama_model,
-                    base_url=settings.ollama_base_url,
-                    temperature=0.3,
-                )
-            except ImportError:
-                # langchain-ollama not available (e.g., on Streamlit Cloud)
-                # Fall back to OpenAI-compatible API if cloud is configured
-                if settings.ollama_cloud_enabled and settings.ollama_cloud_api_key:
-                    from langchain_openai import ChatOpenAI
-
-                    llm = ChatOpenAI(
-                        model=settings.ollama_cloud_model,
-                        api_key=settings.ollama_cloud_api_key,
-                        base_url=settings.ollama_cloud_base_url,
-                        temperature=0.3,
-                    )
-                    logger.info("fallback_to_ollama_cloud", model=settings.ollama_cloud_model)
-                else:
-                    logger.warning("langchain_ollama_not_available")
-                    return []
-
-        prompt = f"""You are a product database assistant. Given a search query, suggest real grocery/food products that match.
+        llm = _get_search_llm(ollama_cloud_key if use_cloud else None)
+        if llm is None:
+            return []
 
-Search query: "{query}"
-
-Return exactly {limit} products as a JSON array. Each product should have:
-- name: Full product name (be specific, e.g., "Horizon Organic Whole Milk" not just "Milk")
-- brand: Brand name if applicable (e.g., "Horizon", "Tropicana", "Lay's")
-- category: One of: Produce, Dairy, Meat, Seafood, Bakery, Beverages, Snacks, Frozen Foods, Canned Goods, Condiments, Baby Food, Supplements, Alcohol, Tobacco, Prepared Foods, Other
-- typical_price: Typical US retail price in dollars (number only, e.g., 4.99)
-
-Return ONLY valid JSON array, no other text. Example format:
-[{{"name": "Horizon Organic Whole Milk", "brand": "Horizon", "category": "Dairy", "typical_price": 5.99}}]
-
-Products matching "{query}":"""
+        prompt = _SUGGESTION_PROMPT.format(query=query, limit=limit)
 
         response = await llm.ainvoke(prompt)
         content = response.content.strip()
 
         # Extract JSON from response
-        json_match = re.search(r'\[.*\]', content, re.DOTALL)
-        if json_match:
-            products_data = json.loads(json_match.group())
+        json_array = _extract_json_array(content)
+        if json_array:
+            products_data = orjson.loads(json_array)
 
             results = []
             for p in products_data[:limit]:
@@ -271,9 +389,107 @@ Products matching "{query}":"""
             logger.info("llm_search_success", results=len(results))
             return results
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.warning("llm_json_parse_failed", error=str(e))
     except Exception as e:
         logger.warning("llm_search_failed", error=str(e))
 
     return []
+
+
+@lru_cache(maxsize=8)
+def _get_search_llm(cloud_key: Optional[str] = None):
+    """
+    Get the chat model used for product suggestions.
+
+    Models are cached per cloud key so their HTTP connection pools are
+    reused across searches.
+
+    Args:
+        cloud_key: Ollama Cloud API key, or None for local Ollama
+
+    Returns:
+        Chat model, or None if no LLM backend is available
+    """
+    if cloud_key:
+        # Use Ollama Cloud via OpenAI-compatible API
+        from langchain_openai import ChatOpenAI
+
+        logger.info("using_ollama_cloud_for_search", model=settings.ollama_cloud_model)
+        return ChatOpenAI(
+            model=settings.ollama_cloud_model,
+            api_key=cloud_key,
+            base_url=settings.ollama_cloud_base_url,
+            temperature=0.3,
+            http_async_client=get_shared_client(),
+        )
+
+    # Use local Ollama - try to import langchain_ollama
+    try:
+        from langchain_ollama import ChatOllama
+
+        # Greedy decoding with a cap sized for the largest result page
+        return ChatOllama(
+            model=settings.ollama_model,
+            base_url=settings.ollama_base_url,
+            temperature=0.0,
+            num_predict=_SUGGESTION_MAX_TOKENS,
+        )
+    except ImportError:
+        # langchain-ollama not available (e.g., on Streamlit Cloud)
+        # Fall back to OpenAI-compatible API if cloud is configured
+        if settings.ollama_cloud_enabled and settings.ollama_cloud_api_key:
+            from langchain_openai import ChatOpenAI
+
+            logger.info("fallback_to_ollama_cloud", model=settings.ollama_cloud_model)
+            return ChatOpenAI(
+                model=settings.ollama_cloud_model,
+                api_key=settings.ollama_cloud_api_key,
+                base_url=settings.ollama_cloud_base_url,
+                temperature=0.3,
+                http_async_client=get_shared_client(),
+            )
+
+        logger.warning("langchain_ollama_not_available")
+        return None
+
+
+def _extract_json_array(content: str) -> Optional[str]:
+    """
+    Find the first complete JSON array in LLM output.
+
+    Scans once from the first "[" and tracks bracket depth, ignoring
+    brackets inside string literals.
+
+    Args:
+        content: Raw LLM response text
+
+    Returns:
+        The JSON array text, or None if no complete array is found
+    """
+    start = content.find("[")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(content)):
+        char = content[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+
+    return None
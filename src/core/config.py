@@ -1,6 +1,6 @@
 """Configuration management using Pydantic settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +14,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # API Configuration
@@ -27,6 +28,11 @@ class Settings(BaseSettings):
     llm_base_url: Optional[str] = None  # Custom API endpoint (e.g., your wrapper)
     llm_model: str = "gpt-4o-mini"  # Model name for your provider
 
+    # Classification LLM response cache (identical prompts are answered from
+    # SQLite). Entries never expire; delete llm_cache_path to clear it.
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = "./data/llm_cache.db"
+
     # Google Gemini API (legacy, use llm_* settings instead)
     google_api_key: Optional[str] = None
     gemini_model: str = "gemini-1.5-flash"
@@ -50,26 +56,50 @@ class Settings(BaseSettings):
     # Embeddings
     embedding_model: str = "all-MiniLM-L6-v2"
 
+    # Semantic cache for AI reasoning results
+    semantic_cache_enabled: bool = False
+    semantic_cache_collection_name: str = "classification_cache"
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_ttl_seconds: int = 86400
+
     # External APIs
     usda_api_key: Optional[str] = None
     usda_api_base_url: str = "https://api.nal.usda.gov/fdc/v1"
+    usda_cache_ttl: float = 60.0
+    usda_requests_per_hour: int = 1000
+    usda_rate_burst: int = 50
+    usda_max_concurrency: int = 64
+    usda_max_wait: float = 10.0
+    openfoodfacts_cache_ttl: float = 86400.0
 
     # Rate Limiting
     gemini_rpm_limit: int = 15
     gemini_daily_token_limit: int = 1000000
 
+    # Bulk classification limits
+    bulk_global_concurrency: int = 32
+    bulk_per_request_max: int = 16
+    bulk_write_chunk_size: int = 50
+
+    # Worker threads for sync dependencies and blocking calls
+    threadpool_size: int = 40
+
+    # Health checks
+    health_cache_ttl: float = 5.0
+    health_probe_timeout: float = 0.5
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
 
-    @property
+    @cached_property
     def database_path(self) -> str:
         """Extract database path from URL."""
         if self.database_url.startswith("sqlite:///"):
             return self.database_url.replace("sqlite:///", "")
         return self.database_url
 
-    @property
+    @cached_property
     def is_llm_configured(self) -> bool:
         """Check if any LLM is properly configured."""
         # Check new unified LLM config first
@@ -86,12 +116,12 @@ class Settings(BaseSettings):
             return True
         return False
 
-    @property
+    @cached_property
     def is_gemini_configured(self) -> bool:
         """Check if Gemini API is properly configured (legacy)."""
         return self.google_api_key is not None and len(self.google_api_key) > 0
 
-    @property
+    @cached_property
     def is_usda_configured(self) -> bool:
         """Check if USDA API is properly configured."""
         return self.usda_api_key is not None and len(self.usda_api_key) > 0
@@ -29,7 +29,12 @@ class ClassificationCategory(str, Enum):
 
     def is_eligible(self) -> bool:
         """Check if this category represents an eligible classification."""
-        return self.value.startswith("ELIGIBLE_")
+        return self in _ELIGIBLE_CATEGORIES
+
+
+_ELIGIBLE_CATEGORIES = frozenset(
+    c for c in ClassificationCategory if c.value.startswith("ELIGIBLE_")
+)
 
 
 class NutritionLabelType(str, Enum):
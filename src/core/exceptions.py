@@ -6,6 +6,9 @@ from typing import Any, Optional
 class EBTClassificationError(Exception):
     """Base exception for EBT classification errors."""
 
+    # Attributes live in slots; BaseException's lazy __dict__ stays unused
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: Optional[dict[str, Any]] = None):
         self.message = message
         self.details = details or {}
@@ -39,6 +42,8 @@ class DatabaseError(EBTClassificationError):
 class ExternalAPIError(EBTClassificationError):
     """Raised when external API calls fail."""
 
+    __slots__ = ("api_name", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -54,6 +59,8 @@ class ExternalAPIError(EBTClassificationError):
 class RateLimitError(EBTClassificationError):
     """Raised when rate limits are exceeded."""
 
+    __slots__ = ("service", "retry_after")
+
     def __init__(
         self,
         message: str,
@@ -75,6 +82,8 @@ class ChallengeError(EBTClassificationError):
 class AuditNotFoundError(EBTClassificationError):
     """Raised when audit record is not found."""
 
+    __slots__ = ("audit_id",)
+
     def __init__(self, audit_id: str):
         self.audit_id = audit_id
         super().__init__(f"Audit record not found: {audit_id}")
@@ -83,6 +92,8 @@ class AuditNotFoundError(EBTClassificationError):
 class ProductNotFoundError(EBTClassificationError):
     """Raised when product is not found."""
 
+    __slots__ = ("product_id",)
+
     def __init__(self, product_id: str):
         self.product_id = product_id
         super().__init__(f"Product not found: {product_id}")
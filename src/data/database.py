@@ -1,9 +1,10 @@
 """SQLite database connection and utilities."""
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncContextManager, AsyncGenerator
 
 import aiosqlite
 
@@ -17,6 +18,9 @@ logger = get_logger(__name__)
 class Database:
     """Async SQLite database wrapper."""
 
+    # Read-only connections kept open alongside the shared one
+    READ_POOL_SIZE = 2
+
     def __init__(self, db_path: str = None):
         """
         Initialize database connection.
@@ -25,6 +29,13 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path or settings.database_path
+        # Operations holding or waiting for a connection, for /health
+        self.pending_operations = 0
+        self._conn: aiosqlite.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._read_conns: list[aiosqlite.Connection] = []
+        self._idle_read_conns: list[aiosqlite.Connection] = []
+        self._read_slots = asyncio.Semaphore(self.READ_POOL_SIZE)
         self._ensure_directory()
 
     def _ensure_directory(self) -> None:
@@ -32,10 +43,51 @@ class Database:
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
 
+    async def _get_connection(self) -> aiosqlite.Connection:
+        """Open the shared connection on first use and apply PRAGMA_SQL."""
+        if self._conn is None:
+            conn = await aiosqlite.connect(self.db_path)
+            conn.row_factory = aiosqlite.Row
+            await conn.executescript(PRAGMA_SQL)
+            self._conn = conn
+        return self._conn
+
+    async def _open_read_connection(self) -> aiosqlite.Connection:
+        """Open another read-only connection for the pool."""
+        conn = await aiosqlite.connect(self.db_path)
+        conn.row_factory = aiosqlite.Row
+        await conn.executescript(PRAGMA_SQL + "PRAGMA query_only=ON;")
+        self._read_conns.append(conn)
+        return conn
+
+    @asynccontextmanager
+    async def _checkout_shared(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Hold the shared connection."""
+        async with self._lock:
+            yield await self._get_connection()
+
+    @asynccontextmanager
+    async def _checkout_read(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Hold a pooled read-only connection, opening it on first use."""
+        async with self._read_slots:
+            if self._idle_read_conns:
+                conn = self._idle_read_conns.pop()
+            else:
+                conn = await self._open_read_connection()
+            try:
+                yield conn
+            finally:
+                self._idle_read_conns.append(conn)
+
     @asynccontextmanager
     async def connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
         """
-        Get an async database connection.
+        Get exclusive use of the shared database connection.
+
+        The connection is opened once and kept for the life of the
+        Database, so queries do not pay for a new connection and worker
+        thread each time. Callers are serialized; anything a caller leaves
+        uncommitted is rolled back when its block exits.
 
         Yields:
             aiosqlite connection
@@ -43,13 +95,80 @@ class Database:
         Raises:
             DatabaseError: If connection fails
         """
+        async with self._use(self._checkout_shared()) as db:
+            yield db
+
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """
+        Get exclusive use of one of the pooled read-only connections.
+
+        With WAL, reads on these connections are not blocked by a write in
+        progress on the shared connection, and up to READ_POOL_SIZE reads
+        run at once. An in-memory database exists only on its one
+        connection, so its reads use connection().
+
+        Yields:
+            aiosqlite connection
+
+        Raises:
+            DatabaseError: If connection fails
+        """
+        if self.db_path == ":memory:":
+            checkout = self._checkout_shared()
+        else:
+            checkout = self._checkout_read()
+
+        async with self._use(checkout) as db:
+            yield db
+
+    @asynccontextmanager
+    async def _use(
+        self,
+        checkout: AsyncContextManager[aiosqlite.Connection],
+    ) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Check out a connection, rolling back what is left open."""
+        self.pending_operations += 1
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                yield db
+            async with checkout as db:
+                try:
+                    yield db
+                finally:
+                    if db.in_transaction:
+                        await db.rollback()
         except Exception as e:
             logger.error("database_connection_failed", error=str(e), path=self.db_path)
             raise DatabaseError(f"Failed to connect to database: {e}")
+        finally:
+            self.pending_operations -= 1
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """
+        Run several statements as one transaction with a single commit.
+
+        Commits when the block exits normally and rolls back if it raises.
+
+        Yields:
+            aiosqlite connection
+        """
+        async with self.connection() as db:
+            try:
+                yield db
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Close the shared and read-only connections."""
+        for conn in self._read_conns:
+            await conn.close()
+        self._read_conns.clear()
+        self._idle_read_conns.clear()
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
 
     async def execute(
         self,
@@ -77,15 +196,14 @@ class Database:
         parameters_list: list[tuple],
     ) -> None:
         """
-        Execute a query with multiple parameter sets.
+        Execute a query with multiple parameter sets in one transaction.
 
         Args:
             query: SQL query
             parameters_list: List of parameter tuples
         """
-        async with self.connection() as db:
+        async with self.transaction() as db:
             await db.executemany(query, parameters_list)
-            await db.commit()
 
     async def fetch_one(
         self,
@@ -95,6 +213,10 @@ class Database:
         """
         Fetch a single row.
 
+        Every matching row is fetched in the same worker-thread round trip
+        as the execute, so the query must yield at most one row: filter on
+        a unique column, aggregate, or add LIMIT 1.
+
         Args:
             query: SQL query
             parameters: Query parameters
@@ -102,10 +224,9 @@ class Database:
         Returns:
             Row as dict or None
         """
-        async with self.connection() as db:
-            cursor = await db.execute(query, parameters)
-            row = await cursor.fetchone()
-            return dict(row) if row else None
+        async with self.read_connection() as db:
+            rows = await db.execute_fetchall(query, parameters)
+            return dict(rows[0]) if rows else None
 
     async def fetch_all(
         self,
@@ -122,9 +243,8 @@ class Database:
         Returns:
             List of rows as dicts
         """
-        async with self.connection() as db:
-            cursor = await db.execute(query, parameters)
-            rows = await cursor.fetchall()
+        async with self.read_connection() as db:
+            rows = await db.execute_fetchall(query, parameters)
             return [dict(row) for row in rows]
 
     async def table_exists(self, table_name: str) -> bool:
@@ -144,6 +264,30 @@ class Database:
         result = await self.fetch_one(query, (table_name,))
         return result is not None
 
+    async def tables_exist(self, table_names: list[str]) -> set[str]:
+        """
+        Check which of several tables exist in a single query.
+
+        Args:
+            table_names: Names of the tables
+
+        Returns:
+            Set of table names that exist
+        """
+        if not table_names:
+            return set()
+
+        placeholders = ",".join("?" * len(table_names))
+        query = f"""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name IN ({placeholders})
+        """
+        rows = await self.fetch_all(query, tuple(table_names))
+        return {row["name"] for row in rows}
+
+
+# Bump when SCHEMA_SQL changes so existing databases pick up the change
+SCHEMA_VERSION = 4
 
 # Schema definitions
 SCHEMA_SQL = """
@@ -183,6 +327,11 @@ CREATE TABLE IF NOT EXISTS audit_trail (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     audit_id TEXT UNIQUE NOT NULL,
     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    product_id TEXT,
+    product_name TEXT,
+    is_ebt_eligible BOOLEAN,
+    classification_category TEXT,
+    confidence_score REAL,
     request_payload_json TEXT NOT NULL,
     request_source TEXT NOT NULL,
     classification_result_json TEXT NOT NULL,
@@ -198,14 +347,79 @@ CREATE TABLE IF NOT EXISTS audit_trail (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_products_upc ON products(upc);
 CREATE INDEX IF NOT EXISTS idx_products_category ON products(category);
-CREATE INDEX IF NOT EXISTS idx_classifications_product ON classifications(product_id);
+-- Latest classification per product is read from the index without a sort
+CREATE INDEX IF NOT EXISTS idx_classifications_product_time
+    ON classifications(product_id, classified_at DESC);
+DROP INDEX IF EXISTS idx_classifications_product;
 CREATE INDEX IF NOT EXISTS idx_classifications_eligible ON classifications(is_ebt_eligible);
 CREATE INDEX IF NOT EXISTS idx_classifications_category ON classifications(classification_category);
-CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_trail(timestamp);
 CREATE INDEX IF NOT EXISTS idx_audit_challenged ON audit_trail(was_challenged);
+-- audit_id breaks timestamp ties, so keyset pages are read in index order
+CREATE INDEX IF NOT EXISTS idx_audit_time_id ON audit_trail(timestamp, audit_id);
+CREATE INDEX IF NOT EXISTS idx_audit_product_time_id
+    ON audit_trail(product_id, timestamp, audit_id);
+CREATE INDEX IF NOT EXISTS idx_audit_eligible_time_id
+    ON audit_trail(is_ebt_eligible, timestamp, audit_id);
+DROP INDEX IF EXISTS idx_audit_timestamp;
+DROP INDEX IF EXISTS idx_audit_product_time;
+DROP INDEX IF EXISTS idx_audit_eligible_time;
+"""
+
+# Columns added to tables after they were first created. CREATE TABLE IF
+# NOT EXISTS leaves older tables alone, so these are added on upgrade and
+# then filled in by the matching backfill.
+ADDED_COLUMNS = {
+    "audit_trail": [
+        ("product_id", "TEXT"),
+        ("product_name", "TEXT"),
+        ("is_ebt_eligible", "BOOLEAN"),
+        ("classification_category", "TEXT"),
+        ("confidence_score", "REAL"),
+    ],
+}
+
+BACKFILL_SQL = {
+    "audit_trail": """
+UPDATE audit_trail SET
+    product_id = json_extract(classification_result_json, '$.product_id'),
+    product_name = json_extract(classification_result_json, '$.product_name'),
+    is_ebt_eligible = json_extract(classification_result_json, '$.is_ebt_eligible'),
+    classification_category = json_extract(
+        classification_result_json, '$.classification_category'
+    ),
+    confidence_score = json_extract(classification_result_json, '$.confidence_score');
+""",
+}
+
+# WAL lets readers run alongside the single writer, and with it
+# synchronous=NORMAL only syncs at checkpoints. journal_mode is stored in
+# the database file; the rest are per-connection, so they are applied
+# whenever the shared connection is opened.
+PRAGMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA temp_store=MEMORY;
 """
 
 
+async def _add_missing_columns(conn: aiosqlite.Connection) -> None:
+    """Add and backfill ADDED_COLUMNS on tables created before them."""
+    for table, columns in ADDED_COLUMNS.items():
+        rows = await conn.execute_fetchall(f"PRAGMA table_info({table})")
+        existing = {row["name"] for row in rows}
+        if not existing:
+            continue  # New table; SCHEMA_SQL creates it with every column
+
+        missing = [(name, kind) for name, kind in columns if name not in existing]
+        for name, kind in missing:
+            await conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+        if missing:
+            await conn.executescript(BACKFILL_SQL[table])
+            logger.info("database_columns_added", table=table, columns=[n for n, _ in missing])
+
+
 async def initialize_database(db: Database = None) -> None:
     """
     Initialize the database schema.
@@ -219,10 +433,15 @@ async def initialize_database(db: Database = None) -> None:
     logger.info("initializing_database", path=db.db_path)
 
     async with db.connection() as conn:
-        await conn.executescript(SCHEMA_SQL)
-        await conn.commit()
-
-    logger.info("database_initialized", path=db.db_path)
+        cursor = await conn.execute("PRAGMA user_version")
+        (version,) = await cursor.fetchone()
+        if version != SCHEMA_VERSION:
+            await _add_missing_columns(conn)
+            await conn.executescript(SCHEMA_SQL)
+            await conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            await conn.commit()
+
+    logger.info("database_initialized", path=db.db_path, schema_version=SCHEMA_VERSION)
 
 
 # Global database instance
@@ -1,10 +1,15 @@
 """Open Food Facts API client."""
 
+import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
 import httpx
+import orjson
 
+from src.core.config import settings
 from src.core.exceptions import ExternalAPIError
+from src.utils.http_clients import HTTP2_AVAILABLE, HTTP_LIMITS
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,10 +24,15 @@ class OpenFoodFactsClient:
 
     BASE_URL = "https://world.openfoodfacts.org/api/v2"
     USER_AGENT = "EBTClassifier/1.0 (contact@example.com)"
+    CACHE_SIZE = 4096
 
     def __init__(self):
         """Initialize the Open Food Facts client."""
         self._client = None
+        # barcode -> (expires_at, product or None), least recently used first
+        self._product_cache: OrderedDict[str, tuple[float, Optional[Dict[str, Any]]]] = (
+            OrderedDict()
+        )
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -30,7 +40,9 @@ class OpenFoodFactsClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 base_url=self.BASE_URL,
-                timeout=30.0,
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_LIMITS,
+                timeout=httpx.Timeout(30.0, connect=5.0),
                 headers={"User-Agent": self.USER_AGENT},
             )
         return self._client
@@ -42,17 +54,38 @@ class OpenFoodFactsClient:
         """
         Get product information by barcode.
 
+        Lookups, including misses, are cached for
+        settings.openfoodfacts_cache_ttl seconds since popular barcodes are
+        requested over and over. The returned dict is shared and must not
+        be modified.
+
         Args:
             barcode: Product barcode (UPC, EAN, etc.)
 
         Returns:
             Product data dict or None
         """
+        now = time.monotonic()
+        entry = self._product_cache.get(barcode)
+        if entry and entry[0] > now:
+            self._product_cache.move_to_end(barcode)
+            return entry[1]
+
+        product = await self._fetch_product(barcode)
+
+        self._product_cache[barcode] = (now + settings.openfoodfacts_cache_ttl, product)
+        self._product_cache.move_to_end(barcode)
+        if len(self._product_cache) > self.CACHE_SIZE:
+            self._product_cache.popitem(last=False)
+        return product
+
+    async def _fetch_product(self, barcode: str) -> Optional[Dict[str, Any]]:
+        """Fetch a product from the API; errors are raised, not cached."""
         try:
             response = await self.client.get(f"/product/{barcode}.json")
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("status") == 0:
                 logger.info("openfoodfacts_product_not_found", barcode=barcode)
@@ -117,7 +150,7 @@ class OpenFoodFactsClient:
             response = await self.client.get("/search", params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(
                 "openfoodfacts_search_completed",
                 query=query,
@@ -146,17 +179,18 @@ class OpenFoodFactsClient:
         # Extract ingredients as list
         ingredients_text = product_data.get("ingredients_text", "")
         ingredients = [
-            i.strip()
-            for i in ingredients_text.split(",")
-            if i.strip()
+            i
+            for i in map(str.strip, ingredients_text.split(","))
+            if i
         ] if ingredients_text else []
 
         # Determine nutrition label type based on categories
         categories = product_data.get("categories_tags", [])
+        # One lowercase copy of all tags, searched in C; the separator keeps
+        # a keyword from matching across two tags
+        category_text = " ".join(categories).lower()
         nutrition_label_type = "nutrition_facts"
-        if any("supplement" in cat.lower() for cat in categories):
-            nutrition_label_type = "supplement_facts"
-        elif any("vitamin" in cat.lower() for cat in categories):
+        if "supplement" in category_text or "vitamin" in category_text:
             nutrition_label_type = "supplement_facts"
 
         # Check for alcohol
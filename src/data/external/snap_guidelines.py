@@ -1,15 +1,24 @@
 """SNAP guidelines fetcher and parser."""
 
+import asyncio
 import re
+from html import unescape
 from typing import List, Optional
 
 import httpx
 
 from src.core.exceptions import ExternalAPIError
+from src.utils.http_clients import HTTP2_AVAILABLE, HTTP_LIMITS
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns for extract_text_from_html, compiled once
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class SNAPGuidelinesFetcher:
     """
@@ -40,7 +49,9 @@ class SNAPGuidelinesFetcher:
         """Get or create async HTTP client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
-                timeout=60.0,
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_LIMITS,
+                timeout=httpx.Timeout(60.0, connect=5.0),
                 follow_redirects=True,
                 headers={
                     "User-Agent": "Mozilla/5.0 (compatible; EBTClassifier/1.0)",
@@ -87,27 +98,20 @@ class SNAPGuidelinesFetcher:
             Extracted text
         """
         # Remove script and style elements
-        html = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
+        html = _SCRIPT_RE.sub("", html)
+        html = _STYLE_RE.sub("", html)
 
         # Remove HTML comments
-        html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
+        html = _COMMENT_RE.sub("", html)
 
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", html)
-
-        # Decode HTML entities
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
+        text = _TAG_RE.sub(" ", html)
 
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
-        text = "\n".join(line.strip() for line in text.split("\n") if line.strip())
+        # Decode HTML entities, named and numeric, in one pass
+        text = unescape(text)
 
-        return text.strip()
+        # Normalize whitespace; split() collapses runs (and &nbsp;) in one pass
+        return " ".join(text.split())
 
     async def fetch_and_parse(self, source_key: str) -> Optional[str]:
         """
@@ -129,7 +133,9 @@ class SNAPGuidelinesFetcher:
         if not html:
             return None
 
-        text = self.extract_text_from_html(html)
+        # Regex passes over a multi-MB page would stall the event loop, and
+        # sources are fetched concurrently, so extract off the loop
+        text = await asyncio.to_thread(self.extract_text_from_html, html)
 
         logger.info(
             "guidelines_parsed",
@@ -146,14 +152,18 @@ class SNAPGuidelinesFetcher:
         Returns:
             Dict mapping source keys to parsed content
         """
-        results = {}
-
-        for key in self.SOURCES:
-            content = await self.fetch_and_parse(key)
-            if content:
-                results[key] = content
+        # Sources are independent, so fetch them concurrently
+        keys = list(self.SOURCES)
+        contents = await asyncio.gather(
+            *(self.fetch_and_parse(key) for key in keys),
+            return_exceptions=True,
+        )
 
-        return results
+        return {
+            key: content
+            for key, content in zip(keys, contents)
+            if isinstance(content, str) and content
+        }
 
     def get_embedded_guidelines(self) -> dict[str, str]:
         """
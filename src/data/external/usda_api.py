@@ -1,15 +1,71 @@
 """USDA FoodData Central API client."""
 
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional
 
 import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.core.config import settings
-from src.core.exceptions import ExternalAPIError
+from src.core.exceptions import ExternalAPIError, RateLimitError
+from src.utils.http_clients import get_shared_client
 from src.utils.logging import get_logger
+from src.utils.rate_limit import AsyncRateLimiter
 
 logger = get_logger(__name__)
 
+# Responses that mean "slow down" rather than "this request is wrong"
+_RETRY_STATUS_CODES = {429, 503}
+
+
+def _is_throttled(error: BaseException) -> bool:
+    """Check if an error is a throttling response worth retrying."""
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in _RETRY_STATUS_CODES
+    )
+
+
+def _retry_after(error: Optional[BaseException]) -> Optional[float]:
+    """Get the delay a throttling response asked for, in seconds."""
+    if not _is_throttled(error):
+        return None
+    value = error.response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait as long as Retry-After asks, else back off exponentially."""
+    delay = _retry_after(retry_state.outcome.exception())
+    return _backoff(retry_state) if delay is None else delay
+
+
+def _retry_after_too_long(retry_state: RetryCallState) -> bool:
+    """Stop retrying when the server asks for a longer wait than allowed."""
+    delay = _retry_after(retry_state.outcome.exception())
+    return delay is not None and delay > settings.usda_max_wait
+
 
 class USDAFoodDataClient:
     """
@@ -19,6 +75,9 @@ class USDAFoodDataClient:
     """
 
     BASE_URL = "https://api.nal.usda.gov/fdc/v1"
+    # Fail fast on connect and pool waits; reads may take the full 30s
+    TIMEOUT = httpx.Timeout(30.0, connect=5.0, write=10.0, pool=5.0)
+    MAX_ATTEMPTS = 5
 
     def __init__(self, api_key: str = None):
         """
@@ -28,22 +87,53 @@ class USDAFoodDataClient:
             api_key: USDA API key (optional, uses settings if not provided)
         """
         self.api_key = api_key or settings.usda_api_key
-        self._client = None
+        # FoodData Central allows a fixed number of requests per hour per key
+        self._limiter = AsyncRateLimiter(
+            rate=settings.usda_requests_per_hour / 3600,
+            capacity=settings.usda_rate_burst,
+            max_wait=settings.usda_max_wait,
+            service="USDA FoodData Central",
+        )
+        self._semaphore = asyncio.Semaphore(settings.usda_max_concurrency)
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                timeout=30.0,
-            )
-        return self._client
+        """Get the shared async HTTP client."""
+        return get_shared_client()
 
     def is_configured(self) -> bool:
         """Check if API key is configured."""
         return self.api_key is not None and len(self.api_key) > 0
 
+    async def _get(self, path: str, params: Dict[str, Any]) -> httpx.Response:
+        """
+        GET an API path within the rate and concurrency limits.
+
+        429 and 503 responses are retried after their Retry-After delay, or
+        with jittered exponential backoff if they give none. A Retry-After
+        longer than settings.usda_max_wait is not waited out.
+
+        Raises:
+            httpx.HTTPStatusError: On an error status, after retries
+            RateLimitError: If the local rate limit would need too long a wait
+        """
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_throttled),
+            wait=_retry_wait,
+            stop=stop_after_attempt(self.MAX_ATTEMPTS) | _retry_after_too_long,
+            reraise=True,
+        ):
+            with attempt:
+                await self._limiter.acquire()
+                async with self._semaphore:
+                    response = await self.client.get(
+                        f"{self.BASE_URL}{path}",
+                        params=params,
+                        timeout=self.TIMEOUT,
+                    )
+                response.raise_for_status()
+        return response
+
     async def search_foods(
         self,
         query: str,
@@ -75,8 +165,7 @@ class USDAFoodDataClient:
             if data_type:
                 params["dataType"] = data_type
 
-            response = await self.client.get("/foods/search", params=params)
-            response.raise_for_status()
+            response = await self._get("/foods/search", params)
 
             data = response.json()
             logger.info(
@@ -98,6 +187,8 @@ class USDAFoodDataClient:
                 api_name="USDA FoodData Central",
                 status_code=e.response.status_code,
             )
+        except RateLimitError:
+            raise
         except Exception as e:
             logger.error("usda_api_error", error=str(e))
             raise ExternalAPIError(
@@ -122,8 +213,7 @@ class USDAFoodDataClient:
         try:
             params = {"api_key": self.api_key}
 
-            response = await self.client.get(f"/food/{fdc_id}", params=params)
-            response.raise_for_status()
+            response = await self._get(f"/food/{fdc_id}", params)
 
             data = response.json()
             logger.info("usda_food_retrieved", fdc_id=fdc_id)
@@ -138,6 +228,8 @@ class USDAFoodDataClient:
                 api_name="USDA FoodData Central",
                 status_code=e.response.status_code,
             )
+        except RateLimitError:
+            raise
         except Exception as e:
             logger.error("usda_api_error", error=str(e))
             raise ExternalAPIError(
@@ -199,10 +291,7 @@ class USDAFoodDataClient:
         }
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client; the shared client is closed on shutdown."""
 
 
 # Global client instance
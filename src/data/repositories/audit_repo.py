@@ -1,14 +1,14 @@
 """Repository for audit trail operations."""
 
-import json
 from datetime import datetime
 from typing import Optional
 
-from src.core.constants import ClassificationCategory
+import aiosqlite
+import orjson
+
 from src.data.database import Database, get_database
 from src.models.audit import AuditRecord, AuditSummary, AuditTrailQuery
 from src.models.classification import ClassificationResult
-from src.models.regulation import RegulationCitation
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +26,18 @@ class AuditRepository:
         """
         self.db = db or get_database()
 
+    _SAVE_SQL = """
+        INSERT INTO audit_trail (
+            audit_id, timestamp, product_id, product_name, is_ebt_eligible,
+            classification_category, confidence_score, request_payload_json,
+            request_source, classification_result_json, model_used,
+            tokens_consumed, rag_documents_json, was_challenged
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(audit_id) DO UPDATE SET
+            was_challenged = excluded.was_challenged
+    """
+
     async def save(self, record: AuditRecord) -> None:
         """
         Save an audit record.
@@ -33,36 +45,58 @@ class AuditRepository:
         Args:
             record: Audit record to save
         """
-        query = """
-            INSERT INTO audit_trail (
-                audit_id, timestamp, request_payload_json, request_source,
-                classification_result_json, model_used, tokens_consumed,
-                rag_documents_json, was_challenged
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(audit_id) DO UPDATE SET
-                was_challenged = excluded.was_challenged
-        """
-
-        async with self.db.connection() as conn:
-            await conn.execute(
-                query,
-                (
-                    record.audit_id,
-                    record.timestamp.isoformat(),
-                    json.dumps(record.request_payload),
-                    record.request_source,
-                    record.classification_result.model_dump_json(),
-                    record.model_used,
-                    record.tokens_consumed,
-                    json.dumps(record.rag_documents_retrieved),
-                    record.was_challenged,
-                ),
-            )
-            await conn.commit()
+        async with self.db.transaction() as conn:
+            await conn.execute(self._SAVE_SQL, self._save_params(record))
 
         logger.info("audit_record_saved", audit_id=record.audit_id)
 
+    async def save_many(
+        self,
+        records: list[AuditRecord],
+        conn: Optional[aiosqlite.Connection] = None,
+    ) -> None:
+        """
+        Save several audit records in one transaction.
+
+        Args:
+            records: Audit records to save
+            conn: Connection of an open transaction to write in instead;
+                the caller commits it
+        """
+        if not records:
+            return
+
+        params = [self._save_params(r) for r in records]
+        if conn is None:
+            await self.db.execute_many(self._SAVE_SQL, params)
+        else:
+            await conn.executemany(self._SAVE_SQL, params)
+
+        logger.info("audit_records_saved", count=len(records))
+
+    @staticmethod
+    def _save_params(record: AuditRecord) -> tuple:
+        """Build the insert parameters for an audit record."""
+        result = record.classification_result
+        return (
+            record.audit_id,
+            record.timestamp.isoformat(),
+            # Filterable fields are also stored as columns, so queries use
+            # indexes instead of parsing the JSON on every row
+            result.product_id,
+            result.product_name,
+            result.is_ebt_eligible,
+            result.classification_category.value,
+            result.confidence_score,
+            orjson.dumps(record.request_payload).decode(),
+            record.request_source,
+            record.classification_result.model_dump_json(),
+            record.model_used,
+            record.tokens_consumed,
+            orjson.dumps(record.rag_documents_retrieved).decode(),
+            record.was_challenged,
+        )
+
     async def get_by_audit_id(self, audit_id: str) -> Optional[AuditRecord]:
         """
         Get an audit record by ID.
@@ -82,6 +116,74 @@ class AuditRepository:
 
         return None
 
+    async def get_challenge_state(
+        self,
+        audit_id: str,
+    ) -> Optional[tuple[bool, Optional[datetime]]]:
+        """
+        Get the challenge status of an audit record without loading it.
+
+        Args:
+            audit_id: Audit identifier
+
+        Returns:
+            Tuple of (was challenged, challenge timestamp), or None if the
+            audit record does not exist
+        """
+        query = """
+            SELECT was_challenged, challenge_timestamp
+            FROM audit_trail WHERE audit_id = ?
+        """
+
+        row = await self.db.fetch_one(query, (audit_id,))
+
+        if not row:
+            return None
+
+        return (
+            bool(row["was_challenged"]),
+            (
+                datetime.fromisoformat(row["challenge_timestamp"])
+                if row["challenge_timestamp"]
+                else None
+            ),
+        )
+
+    async def get_product_challenges(
+        self,
+        audit_id: str,
+        limit: int = 100,
+    ) -> Optional[tuple[str, list[AuditRecord]]]:
+        """
+        Get challenged records for the product of an audit record in one query.
+
+        Args:
+            audit_id: Audit identifier whose product is looked up
+            limit: Maximum number of challenged records
+
+        Returns:
+            Tuple of (product ID, challenged records, newest first), or None
+            if the audit record does not exist
+        """
+        query = """
+            SELECT a.product_id AS anchor_product_id, c.*
+            FROM audit_trail a
+            LEFT JOIN audit_trail c
+                ON c.product_id = a.product_id
+                AND c.was_challenged = 1
+            WHERE a.audit_id = ?
+            ORDER BY c.timestamp DESC
+            LIMIT ?
+        """
+
+        rows = await self.db.fetch_all(query, (audit_id, limit))
+
+        if not rows:
+            return None
+
+        records = [self._row_to_record(row) for row in rows if row["audit_id"] is not None]
+        return rows[0]["anchor_product_id"], records
+
     async def update_challenge(
         self,
         audit_id: str,
@@ -105,7 +207,7 @@ class AuditRepository:
             WHERE audit_id = ?
         """
 
-        async with self.db.connection() as conn:
+        async with self.db.transaction() as conn:
             await conn.execute(
                 query,
                 (
@@ -115,7 +217,6 @@ class AuditRepository:
                     audit_id,
                 ),
             )
-            await conn.commit()
 
         logger.info("audit_challenge_updated", audit_id=audit_id)
 
@@ -141,15 +242,11 @@ class AuditRepository:
             params.append(query_params.end_date.isoformat())
 
         if query_params.is_ebt_eligible is not None:
-            conditions.append(
-                "json_extract(classification_result_json, '$.is_ebt_eligible') = ?"
-            )
+            conditions.append("is_ebt_eligible = ?")
             params.append(query_params.is_ebt_eligible)
 
         if query_params.classification_category:
-            conditions.append(
-                "json_extract(classification_result_json, '$.classification_category') = ?"
-            )
+            conditions.append("classification_category = ?")
             params.append(query_params.classification_category)
 
         if query_params.was_challenged is not None:
@@ -157,11 +254,18 @@ class AuditRepository:
             params.append(query_params.was_challenged)
 
         if query_params.product_id:
-            conditions.append(
-                "json_extract(classification_result_json, '$.product_id') = ?"
-            )
+            conditions.append("product_id = ?")
             params.append(query_params.product_id)
 
+        if query_params.cursor_timestamp and query_params.cursor_audit_id:
+            # Keyset pagination: seek past the previous page in the index
+            # instead of scanning and discarding OFFSET rows
+            conditions.append("(timestamp, audit_id) < (?, ?)")
+            params.extend([
+                query_params.cursor_timestamp.isoformat(),
+                query_params.cursor_audit_id,
+            ])
+
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
@@ -169,11 +273,11 @@ class AuditRepository:
         sql = f"""
             SELECT * FROM audit_trail
             {where_clause}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, audit_id DESC
             LIMIT ? OFFSET ?
         """
 
-        params.extend([query_params.limit, query_params.offset])
+        params.extend([query_params.limit, self._page_offset(query_params)])
         rows = await self.db.fetch_all(sql, tuple(params))
 
         return [self._row_to_record(row) for row in rows]
@@ -203,21 +307,26 @@ class AuditRepository:
             params.append(query_params.end_date.isoformat())
 
         if query_params.is_ebt_eligible is not None:
-            conditions.append(
-                "json_extract(classification_result_json, '$.is_ebt_eligible') = ?"
-            )
+            conditions.append("is_ebt_eligible = ?")
             params.append(query_params.is_ebt_eligible)
 
         if query_params.classification_category:
-            conditions.append(
-                "json_extract(classification_result_json, '$.classification_category') = ?"
-            )
+            conditions.append("classification_category = ?")
             params.append(query_params.classification_category)
 
         if query_params.was_challenged is not None:
             conditions.append("was_challenged = ?")
             params.append(query_params.was_challenged)
 
+        if query_params.cursor_timestamp and query_params.cursor_audit_id:
+            # Keyset pagination: seek past the previous page in the index
+            # instead of scanning and discarding OFFSET rows
+            conditions.append("(timestamp, audit_id) < (?, ?)")
+            params.extend([
+                query_params.cursor_timestamp.isoformat(),
+                query_params.cursor_audit_id,
+            ])
+
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
@@ -226,20 +335,20 @@ class AuditRepository:
             SELECT
                 audit_id,
                 timestamp,
-                json_extract(classification_result_json, '$.product_id') as product_id,
-                json_extract(classification_result_json, '$.product_name') as product_name,
-                json_extract(classification_result_json, '$.is_ebt_eligible') as is_ebt_eligible,
-                json_extract(classification_result_json, '$.classification_category') as classification_category,
-                json_extract(classification_result_json, '$.confidence_score') as confidence_score,
+                product_id,
+                product_name,
+                is_ebt_eligible,
+                classification_category,
+                confidence_score,
                 model_used,
                 was_challenged
             FROM audit_trail
             {where_clause}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, audit_id DESC
             LIMIT ? OFFSET ?
         """
 
-        params.extend([query_params.limit, query_params.offset])
+        params.extend([query_params.limit, self._page_offset(query_params)])
         rows = await self.db.fetch_all(sql, tuple(params))
 
         summaries = []
@@ -267,29 +376,52 @@ class AuditRepository:
         Args:
             query_params: Query parameters
 
+        Returns:
+            Total count
+        """
+        filters = query_params.model_dump(
+            include={"start_date", "end_date", "is_ebt_eligible", "was_challenged"},
+            exclude_none=True,
+        )
+        return await self.count_where(**filters)
+
+    async def count_where(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        is_ebt_eligible: Optional[bool] = None,
+        was_challenged: Optional[bool] = None,
+    ) -> int:
+        """
+        Count audit records matching filters without building a query model.
+
+        Args:
+            start_date: Earliest timestamp to include
+            end_date: Latest timestamp to include
+            is_ebt_eligible: Filter by eligibility
+            was_challenged: Filter by challenge status
+
         Returns:
             Total count
         """
         conditions = []
         params = []
 
-        if query_params.start_date:
+        if start_date:
             conditions.append("timestamp >= ?")
-            params.append(query_params.start_date.isoformat())
+            params.append(start_date.isoformat())
 
-        if query_params.end_date:
+        if end_date:
             conditions.append("timestamp <= ?")
-            params.append(query_params.end_date.isoformat())
+            params.append(end_date.isoformat())
 
-        if query_params.is_ebt_eligible is not None:
-            conditions.append(
-                "json_extract(classification_result_json, '$.is_ebt_eligible') = ?"
-            )
-            params.append(query_params.is_ebt_eligible)
+        if is_ebt_eligible is not None:
+            conditions.append("is_ebt_eligible = ?")
+            params.append(is_ebt_eligible)
 
-        if query_params.was_challenged is not None:
+        if was_challenged is not None:
             conditions.append("was_challenged = ?")
-            params.append(query_params.was_challenged)
+            params.append(was_challenged)
 
         where_clause = ""
         if conditions:
@@ -300,6 +432,33 @@ class AuditRepository:
         row = await self.db.fetch_one(sql, tuple(params))
         return row["count"] if row else 0
 
+    async def get_stats(self) -> dict:
+        """
+        Count all, eligible and challenged records in a single query.
+
+        Returns:
+            Dict with total, eligible and challenged counts
+        """
+        sql = """
+            SELECT
+                COUNT(*) AS total,
+                COALESCE(SUM(CASE WHEN is_ebt_eligible = 1 THEN 1 ELSE 0 END), 0) AS eligible,
+                COALESCE(SUM(CASE WHEN was_challenged = 1 THEN 1 ELSE 0 END), 0) AS challenged
+            FROM audit_trail
+        """
+
+        row = await self.db.fetch_one(sql)
+        if not row:
+            return {"total": 0, "eligible": 0, "challenged": 0}
+        return row
+
+    @staticmethod
+    def _page_offset(query_params: AuditTrailQuery) -> int:
+        """Get the OFFSET for a page; a cursor replaces the offset."""
+        if query_params.cursor_timestamp and query_params.cursor_audit_id:
+            return 0
+        return query_params.offset
+
     def _row_to_record(self, row: dict) -> AuditRecord:
         """
         Convert a database row to AuditRecord.
@@ -310,72 +469,27 @@ class AuditRepository:
         Returns:
             AuditRecord instance
         """
-        result_data = json.loads(row["classification_result_json"])
-
-        # Reconstruct citations
-        citations = [
-            RegulationCitation(**c) for c in result_data.get("regulation_citations", [])
-        ]
-
-        classification_result = ClassificationResult(
-            product_id=result_data["product_id"],
-            product_name=result_data["product_name"],
-            is_ebt_eligible=result_data["is_ebt_eligible"],
-            confidence_score=result_data["confidence_score"],
-            classification_category=ClassificationCategory(
-                result_data["classification_category"]
-            ),
-            reasoning_chain=result_data["reasoning_chain"],
-            regulation_citations=citations,
-            key_factors=result_data.get("key_factors", []),
-            classification_timestamp=datetime.fromisoformat(
-                result_data["classification_timestamp"]
-            ),
-            model_version=result_data["model_version"],
-            processing_time_ms=result_data.get("processing_time_ms", 0),
-            data_sources_used=result_data.get("data_sources_used", []),
-            audit_id=result_data["audit_id"],
-            request_hash=result_data.get("request_hash", ""),
+        # Both results were stored with model_dump_json, so pydantic-core
+        # parses and validates them straight from the JSON text
+        classification_result = ClassificationResult.model_validate_json(
+            row["classification_result_json"]
         )
 
-        # Handle challenge result if present
         challenge_result = None
         if row.get("challenge_result_json"):
-            challenge_data = json.loads(row["challenge_result_json"])
-            challenge_citations = [
-                RegulationCitation(**c)
-                for c in challenge_data.get("regulation_citations", [])
-            ]
-            challenge_result = ClassificationResult(
-                product_id=challenge_data["product_id"],
-                product_name=challenge_data["product_name"],
-                is_ebt_eligible=challenge_data["is_ebt_eligible"],
-                confidence_score=challenge_data["confidence_score"],
-                classification_category=ClassificationCategory(
-                    challenge_data["classification_category"]
-                ),
-                reasoning_chain=challenge_data["reasoning_chain"],
-                regulation_citations=challenge_citations,
-                key_factors=challenge_data.get("key_factors", []),
-                classification_timestamp=datetime.fromisoformat(
-                    challenge_data["classification_timestamp"]
-                ),
-                model_version=challenge_data["model_version"],
-                processing_time_ms=challenge_data.get("processing_time_ms", 0),
-                data_sources_used=challenge_data.get("data_sources_used", []),
-                audit_id=challenge_data["audit_id"],
-                request_hash=challenge_data.get("request_hash", ""),
+            challenge_result = ClassificationResult.model_validate_json(
+                row["challenge_result_json"]
             )
 
         return AuditRecord(
             audit_id=row["audit_id"],
             timestamp=datetime.fromisoformat(row["timestamp"]),
-            request_payload=json.loads(row["request_payload_json"]),
+            request_payload=orjson.loads(row["request_payload_json"]),
             request_source=row["request_source"],
             classification_result=classification_result,
             model_used=row["model_used"],
             tokens_consumed=row["tokens_consumed"] or 0,
-            rag_documents_retrieved=json.loads(row["rag_documents_json"] or "[]"),
+            rag_documents_retrieved=orjson.loads(row["rag_documents_json"] or "[]"),
             was_challenged=bool(row["was_challenged"]),
             challenge_reason=row.get("challenge_reason"),
             challenge_result=challenge_result,
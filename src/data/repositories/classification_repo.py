@@ -1,9 +1,12 @@
 """Repository for classification data operations."""
 
-import json
 from datetime import datetime
 from typing import Optional
 
+import aiosqlite
+import orjson
+from pydantic import TypeAdapter
+
 from src.core.constants import ClassificationCategory
 from src.data.database import Database, get_database
 from src.models.classification import ClassificationResult
@@ -12,6 +15,12 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Enum lookup by stored value; avoids the Enum call machinery per row
+_CATEGORY_BY_VALUE = {c.value: c for c in ClassificationCategory}
+
+# Validates a whole citation list in one pydantic-core call
+_CITATION_LIST_ADAPTER = TypeAdapter(list[RegulationCitation])
+
 
 class ClassificationRepository:
     """Repository for classification CRUD operations."""
@@ -25,6 +34,23 @@ class ClassificationRepository:
         """
         self.db = db or get_database()
 
+    _SAVE_SQL = """
+        INSERT INTO classifications (
+            audit_id, product_id, is_ebt_eligible, confidence_score,
+            classification_category, reasoning_chain_json,
+            regulation_citations_json, key_factors_json,
+            model_version, processing_time_ms, classified_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(audit_id) DO UPDATE SET
+            is_ebt_eligible = excluded.is_ebt_eligible,
+            confidence_score = excluded.confidence_score,
+            classification_category = excluded.classification_category,
+            reasoning_chain_json = excluded.reasoning_chain_json,
+            regulation_citations_json = excluded.regulation_citations_json,
+            key_factors_json = excluded.key_factors_json
+    """
+
     async def save(self, result: ClassificationResult) -> None:
         """
         Save a classification result.
@@ -32,45 +58,8 @@ class ClassificationRepository:
         Args:
             result: Classification result to save
         """
-        query = """
-            INSERT INTO classifications (
-                audit_id, product_id, is_ebt_eligible, confidence_score,
-                classification_category, reasoning_chain_json,
-                regulation_citations_json, key_factors_json,
-                model_version, processing_time_ms, classified_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(audit_id) DO UPDATE SET
-                is_ebt_eligible = excluded.is_ebt_eligible,
-                confidence_score = excluded.confidence_score,
-                classification_category = excluded.classification_category,
-                reasoning_chain_json = excluded.reasoning_chain_json,
-                regulation_citations_json = excluded.regulation_citations_json,
-                key_factors_json = excluded.key_factors_json
-        """
-
-        citations_json = json.dumps(
-            [c.model_dump() for c in result.regulation_citations]
-        )
-
-        async with self.db.connection() as conn:
-            await conn.execute(
-                query,
-                (
-                    result.audit_id,
-                    result.product_id,
-                    result.is_ebt_eligible,
-                    result.confidence_score,
-                    result.classification_category.value,
-                    json.dumps(result.reasoning_chain),
-                    citations_json,
-                    json.dumps(result.key_factors),
-                    result.model_version,
-                    result.processing_time_ms,
-                    result.classification_timestamp.isoformat(),
-                ),
-            )
-            await conn.commit()
+        async with self.db.transaction() as conn:
+            await conn.execute(self._SAVE_SQL, self._save_params(result))
 
         logger.info(
             "classification_saved",
@@ -78,6 +67,47 @@ class ClassificationRepository:
             product_id=result.product_id,
         )
 
+    async def save_many(
+        self,
+        results: list[ClassificationResult],
+        conn: Optional[aiosqlite.Connection] = None,
+    ) -> None:
+        """
+        Save several classification results in one transaction.
+
+        Args:
+            results: Classification results to save
+            conn: Connection of an open transaction to write in instead;
+                the caller commits it
+        """
+        if not results:
+            return
+
+        params = [self._save_params(r) for r in results]
+        if conn is None:
+            await self.db.execute_many(self._SAVE_SQL, params)
+        else:
+            await conn.executemany(self._SAVE_SQL, params)
+
+        logger.info("classifications_saved", count=len(results))
+
+    @staticmethod
+    def _save_params(result: ClassificationResult) -> tuple:
+        """Build the insert parameters for a classification result."""
+        return (
+            result.audit_id,
+            result.product_id,
+            result.is_ebt_eligible,
+            result.confidence_score,
+            result.classification_category.value,
+            orjson.dumps(result.reasoning_chain).decode(),
+            orjson.dumps([c.model_dump() for c in result.regulation_citations]).decode(),
+            orjson.dumps(result.key_factors).decode(),
+            result.model_version,
+            result.processing_time_ms,
+            result.classification_timestamp.isoformat(),
+        )
+
     async def get_by_audit_id(self, audit_id: str) -> Optional[ClassificationResult]:
         """
         Get a classification by audit ID.
@@ -224,18 +254,19 @@ class ClassificationRepository:
         Returns:
             ClassificationResult instance
         """
-        citations_data = json.loads(row["regulation_citations_json"])
-        citations = [RegulationCitation(**c) for c in citations_data]
+        citations = _CITATION_LIST_ADAPTER.validate_python(
+            orjson.loads(row["regulation_citations_json"])
+        )
 
         return ClassificationResult(
             product_id=row["product_id"],
             product_name=row["product_name"],
             is_ebt_eligible=bool(row["is_ebt_eligible"]),
             confidence_score=row["confidence_score"],
-            classification_category=ClassificationCategory(row["classification_category"]),
-            reasoning_chain=json.loads(row["reasoning_chain_json"]),
+            classification_category=_CATEGORY_BY_VALUE[row["classification_category"]],
+            reasoning_chain=orjson.loads(row["reasoning_chain_json"]),
             regulation_citations=citations,
-            key_factors=json.loads(row["key_factors_json"]),
+            key_factors=orjson.loads(row["key_factors_json"]),
             classification_timestamp=datetime.fromisoformat(row["classified_at"]),
             model_version=row["model_version"],
             processing_time_ms=row["processing_time_ms"] or 0,
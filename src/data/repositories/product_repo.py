@@ -4,6 +4,8 @@ import json
 from datetime import datetime
 from typing import Optional
 
+import aiosqlite
+
 from src.data.database import Database, get_database
 from src.models.product import ProductInput
 from src.utils.logging import get_logger
@@ -23,6 +25,22 @@ class ProductRepository:
         """
         self.db = db or get_database()
 
+    _SAVE_SQL = """
+        INSERT INTO products (
+            product_id, product_name, upc, category, brand,
+            description, raw_input_json, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(product_id) DO UPDATE SET
+            product_name = excluded.product_name,
+            upc = excluded.upc,
+            category = excluded.category,
+            brand = excluded.brand,
+            description = excluded.description,
+            raw_input_json = excluded.raw_input_json,
+            updated_at = excluded.updated_at
+    """
+
     async def save(self, product: ProductInput) -> None:
         """
         Save or update a product.
@@ -30,42 +48,49 @@ class ProductRepository:
         Args:
             product: Product input to save
         """
-        raw_json = json.dumps(product.model_dump())
-
-        query = """
-            INSERT INTO products (
-                product_id, product_name, upc, category, brand,
-                description, raw_input_json, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(product_id) DO UPDATE SET
-                product_name = excluded.product_name,
-                upc = excluded.upc,
-                category = excluded.category,
-                brand = excluded.brand,
-                description = excluded.description,
-                raw_input_json = excluded.raw_input_json,
-                updated_at = excluded.updated_at
-        """
-
-        async with self.db.connection() as conn:
-            await conn.execute(
-                query,
-                (
-                    product.product_id,
-                    product.product_name,
-                    product.upc,
-                    product.category,
-                    product.brand,
-                    product.description,
-                    raw_json,
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-            await conn.commit()
+        async with self.db.transaction() as conn:
+            await conn.execute(self._SAVE_SQL, self._save_params(product))
 
         logger.info("product_saved", product_id=product.product_id)
 
+    async def save_many(
+        self,
+        products: list[ProductInput],
+        conn: Optional[aiosqlite.Connection] = None,
+    ) -> None:
+        """
+        Save or update several products in one transaction.
+
+        Args:
+            products: Product inputs to save
+            conn: Connection of an open transaction to write in instead;
+                the caller commits it
+        """
+        if not products:
+            return
+
+        params = [self._save_params(p) for p in products]
+        if conn is None:
+            await self.db.execute_many(self._SAVE_SQL, params)
+        else:
+            await conn.executemany(self._SAVE_SQL, params)
+
+        logger.info("products_saved", count=len(products))
+
+    @staticmethod
+    def _save_params(product: ProductInput) -> tuple:
+        """Build the insert parameters for a product."""
+        return (
+            product.product_id,
+            product.product_name,
+            product.upc,
+            product.category,
+            product.brand,
+            product.description,
+            json.dumps(product.model_dump()),
+            datetime.utcnow().isoformat(),
+        )
+
     async def get_by_id(self, product_id: str) -> Optional[ProductInput]:
         """
         Get a product by ID.
@@ -96,7 +121,8 @@ class ProductRepository:
         Returns:
             ProductInput if found, None otherwise
         """
-        query = "SELECT raw_input_json FROM products WHERE upc = ?"
+        # upc is not unique, so stop at the first match
+        query = "SELECT raw_input_json FROM products WHERE upc = ? LIMIT 1"
 
         row = await self.db.fetch_one(query, (upc,))
 
@@ -186,7 +212,6 @@ class ProductRepository:
         """
         query = "DELETE FROM products WHERE product_id = ?"
 
-        async with self.db.connection() as conn:
+        async with self.db.transaction() as conn:
             cursor = await conn.execute(query, (product_id,))
-            await conn.commit()
-            return cursor.rowcount > 0
+        return cursor.rowcount > 0
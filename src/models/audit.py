@@ -6,6 +6,7 @@ from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from src.models.classification import ClassificationResult
+from src.models.regulation import RegulationCitation
 
 
 class AuditRecord(BaseModel):
@@ -102,6 +103,14 @@ class AuditTrailQuery(BaseModel):
         ge=0,
         description="Pagination offset",
     )
+    cursor_timestamp: Optional[datetime] = Field(
+        default=None,
+        description="Timestamp of the last record of the previous page",
+    )
+    cursor_audit_id: Optional[str] = Field(
+        default=None,
+        description="Audit ID of the last record of the previous page",
+    )
 
 
 class AuditTrailResponse(BaseModel):
@@ -150,3 +159,55 @@ class ChallengeResponse(BaseModel):
     new_classification: ClassificationResult
     classification_changed: bool
     reasoning_for_change: list[str]
+
+
+class ExplanationProduct(BaseModel):
+    """Product identity in an explanation."""
+
+    product_id: str
+    product_name: str
+
+
+class ExplanationClassification(BaseModel):
+    """Outcome of the explained classification."""
+
+    is_ebt_eligible: bool
+    confidence_score: float
+    classification_category: str
+
+
+class ExplanationDetails(BaseModel):
+    """Reasoning behind the explained classification."""
+
+    reasoning_chain: list[str]
+    key_factors: list[str]
+    regulation_citations: list[RegulationCitation]
+
+
+class ExplanationMetadata(BaseModel):
+    """Processing metadata of the explained classification."""
+
+    classification_timestamp: datetime
+    model_version: str
+    processing_time_ms: int
+    data_sources_used: list[str]
+
+
+class ChallengeInfo(BaseModel):
+    """Challenge status of an audit record."""
+
+    was_challenged: bool
+    challenge_reason: Optional[str] = None
+    challenge_timestamp: Optional[datetime] = None
+
+
+class ExplanationResponse(BaseModel):
+    """Detailed explanation of a classification."""
+
+    audit_id: str
+    product: ExplanationProduct
+    classification: ExplanationClassification
+    explanation: ExplanationDetails
+    metadata: ExplanationMetadata
+    original_request: dict[str, Any]
+    challenge_info: ChallengeInfo
@@ -14,6 +14,11 @@ from src.utils.validators import (
 )
 
 
+def _format_optional(value: Optional[bool], default: str = "Unknown") -> str:
+    """Format an optional attribute, using a default when it is unset."""
+    return default if value is None else str(value)
+
+
 class ProductInput(BaseModel):
     """Input schema for product classification request."""
 
@@ -113,6 +118,33 @@ class ProductInput(BaseModel):
     def sanitize_strings(cls, v: Optional[str]) -> Optional[str]:
         return sanitize_text(v)
 
+    # Prompt-ready attribute strings; plain properties so they follow field
+    # changes and model_copy(update=...), and stay out of model_dump()
+
+    @property
+    def alcohol_content_pct(self) -> str:
+        return f"{self.alcohol_content * 100:.1f}%" if self.alcohol_content else "0%"
+
+    @property
+    def hot_at_sale_str(self) -> str:
+        return _format_optional(self.is_hot_at_sale)
+
+    @property
+    def onsite_str(self) -> str:
+        return _format_optional(self.is_for_onsite_consumption)
+
+    @property
+    def tobacco_str(self) -> str:
+        return _format_optional(self.contains_tobacco)
+
+    @property
+    def cbd_str(self) -> str:
+        return _format_optional(self.contains_cbd_cannabis)
+
+    @property
+    def live_animal_str(self) -> str:
+        return _format_optional(self.is_live_animal, "No")
+
     model_config = {
         "json_schema_extra": {
             "examples": [
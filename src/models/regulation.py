@@ -33,6 +33,7 @@ class RegulationCitation(BaseModel):
     )
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -1,9 +1,11 @@
 """Document loader for SNAP regulation documents."""
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from src.utils.logging import get_logger
 
@@ -214,3 +216,64 @@ class DocumentLoader:
         )
 
         return all_chunks
+
+    def iter_chunks_parallel(
+        self,
+        chunk_size: int = 1000,
+        overlap: int = 200,
+        workers: Optional[int] = None,
+    ) -> Iterator[Document]:
+        """
+        Load and chunk documents across worker processes, yielding chunks.
+
+        Files are read and split in parallel; chunks are yielded in file order
+        as each file completes so callers can embed while chunking continues.
+
+        Args:
+            chunk_size: Target size of each chunk
+            overlap: Overlap between chunks
+            workers: Number of worker processes (defaults to CPU count)
+
+        Yields:
+            Chunked documents
+        """
+        if not self.regulations_dir.exists():
+            logger.warning("regulations_dir_not_found", path=str(self.regulations_dir))
+            return
+
+        file_paths = list(self.regulations_dir.glob("*.txt"))
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        chunk_file = partial(
+            _load_and_chunk_file,
+            str(self.regulations_dir),
+            chunk_size=chunk_size,
+            overlap=overlap,
+        )
+
+        if workers <= 1:
+            for file_path in file_paths:
+                yield from chunk_file(file_path)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunks in executor.map(chunk_file, file_paths):
+                yield from chunks
+
+
+def _load_and_chunk_file(
+    regulations_dir: str,
+    file_path: Path,
+    chunk_size: int,
+    overlap: int,
+) -> List[Document]:
+    """Load and chunk a single file; module-level so worker processes can run it."""
+    loader = DocumentLoader(regulations_dir)
+    try:
+        document = loader._load_file(file_path)
+    except Exception as e:
+        logger.error("document_load_failed", path=str(file_path), error=str(e))
+        return []
+
+    if document is None:
+        return []
+    return loader.chunk_document(document, chunk_size, overlap)
@@ -61,33 +61,50 @@ class EmbeddingsManager:
             text: Text to embed
 
         Returns:
-            List of floats representing the embedding, or None if not available
+            Unit-length embedding as a list of floats, or None if not available
         """
         if not self.is_available or self.model is None:
             return None
 
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
+            embedding = self.model.encode(
+                text,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
             return embedding.tolist()
         except Exception as e:
             logger.error("embedding_failed", error=str(e), text_length=len(text))
             return None
 
-    def embed_texts(self, texts: List[str]) -> Optional[List[List[float]]]:
+    def embed_texts(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+    ) -> Optional[List[List[float]]]:
         """
         Generate embeddings for multiple texts.
 
         Args:
             texts: List of texts to embed
+            batch_size: Number of texts per forward pass
+            show_progress_bar: Display encoding progress
 
         Returns:
-            List of embeddings, or None if not available
+            List of unit-length embeddings, or None if not available
         """
         if not self.is_available or self.model is None:
             return None
 
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=show_progress_bar,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
             return [emb.tolist() for emb in embeddings]
         except Exception as e:
             logger.error("batch_embedding_failed", error=str(e), count=len(texts))
@@ -67,11 +67,26 @@ class SNAPRegulationRetriever:
             where=where_filter,
         )
 
-        # Convert to RetrievedDocument objects
+        documents = self._to_documents(results, min_relevance)
+
+        logger.info(
+            "documents_retrieved",
+            query_length=len(query),
+            results=len(documents),
+        )
+
+        return documents
+
+    def _to_documents(
+        self,
+        results: List[dict],
+        min_relevance: float = 0.0,
+    ) -> List[RetrievedDocument]:
+        """Convert vector store results to documents sorted by relevance."""
         documents = []
         for result in results:
             # Convert distance to relevance score (lower distance = higher relevance)
-            # ChromaDB uses L2 distance by default
+            # The collection uses inner-product space: distance = 1 - cosine
             distance = result.get("distance", 0)
             relevance_score = 1.0 / (1.0 + distance)
 
@@ -87,13 +102,6 @@ class SNAPRegulationRetriever:
 
         # Sort by relevance (highest first)
         documents.sort(key=lambda x: x.relevance_score, reverse=True)
-
-        logger.info(
-            "documents_retrieved",
-            query_length=len(query),
-            results=len(documents),
-        )
-
         return documents
 
     def retrieve_for_classification(
@@ -115,7 +123,54 @@ class SNAPRegulationRetriever:
         Returns:
             List of relevant documents
         """
-        # Build a comprehensive query
+        query = self._build_classification_query(product_name, category, description)
+        return self.retrieve(query, k=k)
+
+    def retrieve_batch(
+        self,
+        product_names: List[str],
+        categories: Optional[List[Optional[str]]] = None,
+        descriptions: Optional[List[Optional[str]]] = None,
+        k: int = 3,
+    ) -> List[List[RetrievedDocument]]:
+        """
+        Retrieve regulations for several products with one vector store query.
+
+        Args:
+            product_names: Product names
+            categories: Product categories, aligned with product_names
+            descriptions: Product descriptions, aligned with product_names
+            k: Number of documents to retrieve per product
+
+        Returns:
+            One list of relevant documents per product
+        """
+        categories = categories or [None] * len(product_names)
+        descriptions = descriptions or [None] * len(product_names)
+
+        queries = [
+            self._build_classification_query(name, category, description)
+            for name, category, description in zip(product_names, categories, descriptions)
+        ]
+        batch_results = self.vector_store.query_batch(queries, n_results=k)
+
+        documents = [self._to_documents(results) for results in batch_results]
+
+        logger.info(
+            "documents_batch_retrieved",
+            queries=len(queries),
+            results=sum(len(docs) for docs in documents),
+        )
+
+        return documents
+
+    def _build_classification_query(
+        self,
+        product_name: str,
+        category: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> str:
+        """Build a comprehensive retrieval query for a product."""
         query_parts = [f"SNAP EBT eligibility for {product_name}"]
 
         if category:
@@ -124,9 +179,7 @@ class SNAPRegulationRetriever:
         if description:
             query_parts.append(description[:200])  # Limit description length
 
-        query = " ".join(query_parts)
-
-        return self.retrieve(query, k=k)
+        return " ".join(query_parts)
 
     def retrieve_by_category(
         self,
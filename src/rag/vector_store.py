@@ -17,6 +17,17 @@ except ImportError:
     CHROMADB_AVAILABLE = False
     logger.warning("chromadb_not_available", message="ChromaDB not installed, RAG features disabled")
 
+# HNSW settings applied when the collection is created. Embeddings are unit
+# length, so inner product ranks like cosine without the per-query norm; the
+# build parameters favour recall, and the high sync threshold lets bulk loads
+# persist the index once instead of every few hundred inserts.
+HNSW_METADATA = {
+    "hnsw:space": "ip",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:sync_threshold": 10000,
+}
+
 
 class VectorStore:
     """ChromaDB vector store for SNAP regulations."""
@@ -94,7 +105,10 @@ class VectorStore:
             try:
                 self._collection = self.client.get_or_create_collection(
                     name=self.collection_name,
-                    metadata={"description": "SNAP regulations and eligibility guidelines"},
+                    metadata={
+                        "description": "SNAP regulations and eligibility guidelines",
+                        **HNSW_METADATA,
+                    },
                 )
                 logger.info(
                     "chromadb_collection_ready",
@@ -107,18 +121,46 @@ class VectorStore:
                 return None
         return self._collection
 
+    def embed_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 256,
+        show_progress_bar: bool = True,
+    ) -> Optional[List[List[float]]]:
+        """
+        Embed many texts up front in large batches.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts per forward pass
+            show_progress_bar: Display encoding progress
+
+        Returns:
+            List of embeddings, or None if embeddings are unavailable
+        """
+        if not self.is_available or not texts or self.embeddings is None:
+            return None
+
+        return self.embeddings.embed_texts(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=show_progress_bar,
+        )
+
     def add_documents(
         self,
         documents: List[str],
         metadatas: Optional[List[dict]] = None,
         ids: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
-        """Add documents to the vector store."""
+        """Add documents to the vector store, embedding them unless embeddings are given."""
         if not self.is_available or not documents:
             return
 
         try:
-            embeddings = self.embeddings.embed_texts(documents)
+            if embeddings is None:
+                embeddings = self.embeddings.embed_texts(documents)
             if ids is None:
                 ids = [f"doc_{i}" for i in range(len(documents))]
 
@@ -150,34 +192,64 @@ class VectorStore:
                 where=where,
                 include=["documents", "metadatas", "distances"],
             )
-
-            formatted_results = []
-            if results["documents"] and results["documents"][0]:
-                for i, doc in enumerate(results["documents"][0]):
-                    formatted_results.append({
-                        "document": doc,
-                        "metadata": (
-                            results["metadatas"][0][i]
-                            if results["metadatas"] and results["metadatas"][0]
-                            else {}
-                        ),
-                        "distance": (
-                            results["distances"][0][i]
-                            if results["distances"] and results["distances"][0]
-                            else 0
-                        ),
-                        "id": (
-                            results["ids"][0][i]
-                            if results["ids"] and results["ids"][0]
-                            else f"result_{i}"
-                        ),
-                    })
-
-            return formatted_results
+            return self._format_query_results(results, 0)
         except Exception as e:
             logger.error("query_failed", error=str(e))
             return []
 
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[dict] = None,
+    ) -> List[List[dict]]:
+        """
+        Query the vector store with several texts in a single round-trip.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Results per query
+            where: Optional metadata filter applied to every query
+
+        Returns:
+            One result list per query text, in the same order
+        """
+        if not self.is_available or not query_texts:
+            return [[] for _ in query_texts]
+
+        try:
+            query_embeddings = self.embeddings.embed_texts(query_texts)
+            results = self.collection.query(
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+            return [
+                self._format_query_results(results, i) for i in range(len(query_texts))
+            ]
+        except Exception as e:
+            logger.error("batch_query_failed", error=str(e), count=len(query_texts))
+            return [[] for _ in query_texts]
+
+    def _format_query_results(self, results: dict, query_index: int) -> List[dict]:
+        """Format the Chroma results for one query of a (possibly batched) call."""
+        formatted_results = []
+        documents = results["documents"][query_index] if results["documents"] else []
+        metadatas = results["metadatas"][query_index] if results["metadatas"] else None
+        distances = results["distances"][query_index] if results["distances"] else None
+        ids = results["ids"][query_index] if results["ids"] else None
+
+        for i, doc in enumerate(documents):
+            formatted_results.append({
+                "document": doc,
+                "metadata": metadatas[i] if metadatas else {},
+                "distance": distances[i] if distances else 0,
+                "id": ids[i] if ids else f"result_{i}",
+            })
+
+        return formatted_results
+
     def delete_collection(self) -> None:
         """Delete the current collection."""
         if not self.is_available:
@@ -71,6 +71,28 @@ class AIReasoningAgent:
             partial_rule_result=partial_rule_result,
         )
 
+    async def reason_batch(
+        self,
+        products: list[ProductInput],
+        partial_rule_results: Optional[list[Optional[RuleValidationResult]]] = None,
+    ) -> list[AIReasoningResult]:
+        """
+        Use AI reasoning to classify several products at once.
+
+        Args:
+            products: Products to classify
+            partial_rule_results: Partial rule results, aligned with products
+
+        Returns:
+            AIReasoningResults in the same order as products
+        """
+        logger.info("ai_batch_reasoning_requested", count=len(products))
+
+        return await self.agent.reason_batch(
+            products=products,
+            partial_rule_results=partial_rule_results,
+        )
+
     def is_available(self) -> bool:
         """Check if AI reasoning is available."""
         return settings.is_llm_configured
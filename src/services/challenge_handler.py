@@ -6,7 +6,7 @@ import uuid
 
 from src.core.exceptions import AuditNotFoundError, ChallengeError
 from src.data.repositories.audit_repo import AuditRepository
-from src.models.audit import ChallengeRequest, ChallengeResponse
+from src.models.audit import AuditRecord, ChallengeRequest, ChallengeResponse
 from src.models.classification import ClassificationResult
 from src.models.product import ProductInput
 from src.services.classification_engine import ClassificationEngine, get_classification_engine
@@ -259,26 +259,51 @@ class ChallengeHandler:
 
         records = await self.audit_repo.query(query)
 
-        return [
-            {
-                "audit_id": r.audit_id,
-                "timestamp": r.timestamp.isoformat(),
-                "challenge_reason": r.challenge_reason,
-                "original_eligible": r.classification_result.is_ebt_eligible,
-                "challenge_eligible": (
-                    r.challenge_result.is_ebt_eligible
-                    if r.challenge_result
-                    else None
-                ),
-                "changed": (
-                    r.classification_result.is_ebt_eligible
-                    != r.challenge_result.is_ebt_eligible
-                    if r.challenge_result
-                    else False
-                ),
-            }
-            for r in records
-        ]
+        return [self._format_challenge(r) for r in records]
+
+    async def get_challenge_history_by_audit_id(
+        self,
+        audit_id: str,
+    ) -> Dict[str, Any]:
+        """
+        Get challenge history for the product of an audit record.
+
+        Args:
+            audit_id: Audit ID of a classification of the product
+
+        Returns:
+            Dict with the product ID and its challenge records
+
+        Raises:
+            AuditNotFoundError: If the audit record doesn't exist
+        """
+        found = await self.audit_repo.get_product_challenges(audit_id, limit=100)
+        if found is None:
+            raise AuditNotFoundError(audit_id)
+
+        product_id, records = found
+        return {
+            "product_id": product_id,
+            "challenges": [self._format_challenge(r) for r in records],
+        }
+
+    def _format_challenge(self, record: AuditRecord) -> Dict[str, Any]:
+        """Format a challenged audit record for the history response."""
+        original = record.classification_result
+        challenge = record.challenge_result
+
+        return {
+            "audit_id": record.audit_id,
+            "timestamp": record.timestamp.isoformat(),
+            "challenge_reason": record.challenge_reason,
+            "original_eligible": original.is_ebt_eligible,
+            "challenge_eligible": challenge.is_ebt_eligible if challenge else None,
+            "changed": (
+                original.is_ebt_eligible != challenge.is_ebt_eligible
+                if challenge
+                else False
+            ),
+        }
 
 
 # Global handler instance
@@ -5,9 +5,10 @@ and AI reasoning for EBT eligibility determination.
 
 import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 import uuid
 
+from src.core.config import settings
 from src.core.constants import MODEL_VERSION
 from src.core.exceptions import ClassificationError
 from src.data.repositories.audit_repo import AuditRepository
@@ -15,9 +16,11 @@ from src.data.repositories.classification_repo import ClassificationRepository
 from src.data.repositories.product_repo import ProductRepository
 from src.models.audit import AuditRecord
 from src.models.classification import (
+    AIReasoningResult,
     BulkClassificationResult,
     BulkClassificationSummary,
     ClassificationResult,
+    RuleValidationResult,
 )
 from src.models.product import ProductInput
 from src.services.ai_reasoning_agent import AIReasoningAgent
@@ -82,6 +85,36 @@ class ClassificationEngine:
             request_source: Origin of request (API, UI, Batch)
             force_reprocess: Skip cache and reprocess
 
+        Returns:
+            ClassificationResult with eligibility determination
+        """
+        return await self._classify(
+            product,
+            request_source=request_source,
+            check_cache=not force_reprocess,
+        )
+
+    async def _classify(
+        self,
+        product: ProductInput,
+        request_source: str = "API",
+        check_cache: bool = True,
+        rule_result: Optional[RuleValidationResult] = None,
+        ai_result: Optional[AIReasoningResult] = None,
+        pending_writes: Optional[list] = None,
+    ) -> ClassificationResult:
+        """
+        Classify a product, reusing any steps already computed by the caller.
+
+        Args:
+            product: Product input data
+            request_source: Origin of request (API, UI, Batch)
+            check_cache: Return a stored classification if one exists
+            rule_result: Rule validation result, if already computed
+            ai_result: AI reasoning result, if already computed
+            pending_writes: If given, the product, classification and audit
+                record are appended here for the caller to store in batch
+
         Returns:
             ClassificationResult with eligibility determination
         """
@@ -97,7 +130,7 @@ class ClassificationEngine:
 
         try:
             # Step 1: Check cache (unless forced reprocess)
-            if not force_reprocess:
+            if check_cache:
                 cached = await self.classification_repo.get_by_product_id(
                     product.product_id
                 )
@@ -106,10 +139,12 @@ class ClassificationEngine:
                     return cached
 
             # Step 2: Save product to database
-            await self.product_repo.save(product)
+            if pending_writes is None:
+                await self.product_repo.save(product)
 
             # Step 3: Apply rule-based validation
-            rule_result = self.rule_validator.validate(product)
+            if rule_result is None:
+                rule_result = self.rule_validator.validate(product)
 
             if rule_result.is_deterministic:
                 # Clear-cut case - use rule-based result
@@ -139,10 +174,11 @@ class ClassificationEngine:
                     product_id=product.product_id,
                 )
 
-                ai_result = await self.ai_agent.reason(
-                    product=product,
-                    partial_rule_result=rule_result,
-                )
+                if ai_result is None:
+                    ai_result = await self.ai_agent.reason(
+                        product=product,
+                        partial_rule_result=rule_result,
+                    )
 
                 # Step 5: Calculate confidence score
                 confidence = self.confidence_scorer.calculate(
@@ -166,13 +202,17 @@ class ClassificationEngine:
                 )
 
             # Step 6: Store classification and audit trail
-            await self.classification_repo.save(classification)
-            await self._store_audit(
+            audit = self._build_audit(
                 audit_id=audit_id,
                 product=product,
                 result=classification,
                 request_source=request_source,
             )
+            if pending_writes is None:
+                await self.classification_repo.save(classification)
+                await self.audit_repo.save(audit)
+            else:
+                pending_writes.append((product, classification, audit))
 
             logger.info(
                 "classification_completed",
@@ -215,28 +255,39 @@ class ClassificationEngine:
         semaphore = asyncio.Semaphore(max_concurrent)
         results = []
         errors = []
-
-        async def classify_with_semaphore(product: ProductInput):
-            async with semaphore:
-                try:
-                    result = await self.classify(product, request_source="Batch")
-                    return {"success": True, "result": result}
-                except Exception as e:
-                    if fail_fast:
-                        raise
-                    return {
-                        "success": False,
-                        "product_id": product.product_id,
-                        "error": str(e),
-                    }
-
-        tasks = [classify_with_semaphore(p) for p in products]
-        completed = await asyncio.gather(*tasks, return_exceptions=not fail_fast)
-
-        for item in completed:
-            if isinstance(item, Exception):
-                errors.append({"error": str(item)})
-            elif item["success"]:
+        pending_writes: list[tuple] = []
+        store_errors: dict[str, str] = {}
+
+        tasks = self._bulk_tasks(
+            products,
+            semaphore,
+            fail_fast=fail_fast,
+            pending_writes=pending_writes,
+        )
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                await next_completed
+                while len(pending_writes) >= settings.bulk_write_chunk_size:
+                    store_errors.update(
+                        await self._store_many(
+                            pending_writes, settings.bulk_write_chunk_size
+                        )
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Store whatever finished, even if fail_fast is about to raise
+            store_errors.update(await self._store_many(pending_writes))
+
+        for task in tasks:
+            item = task.result()
+            if item["success"] and item["result"].audit_id in store_errors:
+                item = {
+                    "success": False,
+                    "product_id": item["result"].product_id,
+                    "error": store_errors[item["result"].audit_id],
+                }
+            if item["success"]:
                 results.append(item["result"])
             else:
                 errors.append(item)
@@ -262,6 +313,184 @@ class ClassificationEngine:
             ),
         )
 
+    async def bulk_classify_iter(
+        self,
+        products: list[ProductInput],
+        max_concurrent: int = 5,
+        fail_fast: bool = False,
+    ) -> AsyncIterator[dict]:
+        """
+        Classify multiple products, yielding each outcome as it completes.
+
+        Products decided by rules or the cache are yielded without waiting
+        for the AI batch of ambiguous products.
+
+        Args:
+            products: List of products to classify
+            max_concurrent: Max concurrent classifications
+            fail_fast: Stop after the first failed product if True
+
+        Yields:
+            {"success": True, "result": ClassificationResult} per classified
+            product, or {"success": False, "product_id": ..., "error": ...}
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        tasks = self._bulk_tasks(products, semaphore, fail_fast=False)
+
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                item = await next_completed
+                yield item
+                if fail_fast and not item["success"]:
+                    return
+        finally:
+            # Stop outstanding work if the consumer goes away early
+            for task in tasks:
+                task.cancel()
+
+    def _bulk_tasks(
+        self,
+        products: list[ProductInput],
+        semaphore: asyncio.Semaphore,
+        fail_fast: bool,
+        pending_writes: Optional[list] = None,
+    ) -> list[asyncio.Task]:
+        """
+        Start one classification task per product of a bulk request.
+
+        Rules are cheap, so they run first. Uncached ambiguous products go to
+        the AI agent together in one batch; every other product is
+        classified without waiting for it.
+
+        Returns:
+            Tasks aligned with products, each resolving to the outcome dict
+            of _classify_bulk_item
+        """
+        rule_results = [self.rule_validator.validate(p) for p in products]
+        ambiguous = [i for i, r in enumerate(rule_results) if not r.is_deterministic]
+
+        async def reason_ambiguous() -> dict[int, tuple]:
+            subset = [products[i] for i in ambiguous]
+            cached = await self._lookup_cached(subset, semaphore)
+            ai_results = await self._reason_batch(
+                subset, [rule_results[i] for i in ambiguous], cached
+            )
+            return dict(zip(ambiguous, zip(cached, ai_results)))
+
+        ai_stage = asyncio.create_task(reason_ambiguous()) if ambiguous else None
+
+        async def classify_one(i: int) -> dict:
+            if rule_results[i].is_deterministic:
+                (cached_result,) = await self._lookup_cached([products[i]], semaphore)
+                ai_result = None
+            else:
+                cached_result, ai_result = (await ai_stage)[i]
+            return await self._classify_bulk_item(
+                products[i],
+                rule_results[i],
+                cached_result,
+                ai_result,
+                semaphore=semaphore,
+                fail_fast=fail_fast,
+                pending_writes=pending_writes,
+            )
+
+        return [asyncio.create_task(classify_one(i)) for i in range(len(products))]
+
+    async def _classify_bulk_item(
+        self,
+        product: ProductInput,
+        rule_result: RuleValidationResult,
+        cached_result: Optional[ClassificationResult],
+        ai_result: Optional[AIReasoningResult],
+        semaphore: asyncio.Semaphore,
+        fail_fast: bool,
+        pending_writes: Optional[list] = None,
+    ) -> dict:
+        """Classify one product of a bulk request, reporting failures as data."""
+        if cached_result is not None:
+            logger.info("cache_hit", product_id=product.product_id)
+            return {"success": True, "result": cached_result}
+
+        async with semaphore:
+            try:
+                result = await self._classify(
+                    product,
+                    request_source="Batch",
+                    check_cache=False,  # already looked up in _bulk_tasks
+                    rule_result=rule_result,
+                    ai_result=ai_result,
+                    pending_writes=pending_writes,
+                )
+                return {"success": True, "result": result}
+            except Exception as e:
+                if fail_fast:
+                    raise
+                return {
+                    "success": False,
+                    "product_id": product.product_id,
+                    "error": str(e),
+                }
+
+    async def _lookup_cached(
+        self,
+        products: list[ProductInput],
+        semaphore: asyncio.Semaphore,
+    ) -> list[Optional[ClassificationResult]]:
+        """Look up stored classifications for products, None where missing."""
+
+        async def lookup(product: ProductInput) -> Optional[ClassificationResult]:
+            async with semaphore:
+                try:
+                    return await self.classification_repo.get_by_product_id(
+                        product.product_id
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "cache_lookup_failed",
+                        product_id=product.product_id,
+                        error=str(e),
+                    )
+                    return None
+
+        return await asyncio.gather(*[lookup(p) for p in products])
+
+    async def _reason_batch(
+        self,
+        products: list[ProductInput],
+        rule_results: list[RuleValidationResult],
+        cached: list[Optional[ClassificationResult]],
+    ) -> list[Optional[AIReasoningResult]]:
+        """
+        Run AI reasoning for all uncached ambiguous products in one batch.
+
+        Returns results aligned with products, None where no AI result was
+        produced; those products fall back to per-product reasoning.
+        """
+        ai_results: list[Optional[AIReasoningResult]] = [None] * len(products)
+        pending = [
+            i
+            for i, (rule_result, cached_result) in enumerate(zip(rule_results, cached))
+            if not rule_result.is_deterministic and cached_result is None
+        ]
+        if not pending:
+            return ai_results
+
+        logger.info("ai_batch_reasoning", count=len(pending))
+
+        try:
+            batch = await self.ai_agent.reason_batch(
+                products=[products[i] for i in pending],
+                partial_rule_results=[rule_results[i] for i in pending],
+            )
+        except Exception as e:
+            logger.warning("ai_batch_reasoning_failed", error=str(e))
+            return ai_results
+
+        for i, ai_result in zip(pending, batch):
+            ai_results[i] = ai_result
+        return ai_results
+
     def _build_result(
         self,
         product: ProductInput,
@@ -297,15 +526,15 @@ class ClassificationEngine:
             request_hash=request_hash,
         )
 
-    async def _store_audit(
+    def _build_audit(
         self,
         audit_id: str,
         product: ProductInput,
         result: ClassificationResult,
         request_source: str,
-    ) -> None:
-        """Store audit trail record."""
-        audit = AuditRecord(
+    ) -> AuditRecord:
+        """Build the audit trail record for a classification."""
+        return AuditRecord(
             audit_id=audit_id,
             timestamp=result.classification_timestamp,
             request_payload=product.model_dump(),
@@ -316,7 +545,44 @@ class ClassificationEngine:
             rag_documents_retrieved=[],
             was_challenged=False,
         )
-        await self.audit_repo.save(audit)
+
+    async def _store_many(
+        self,
+        pending_writes: list[tuple],
+        limit: Optional[int] = None,
+    ) -> dict[str, str]:
+        """
+        Store pending products, classifications and audit records together.
+
+        Takes writes off the front of pending_writes and stores them in one
+        transaction, so a product is never stored without its classification
+        and audit record. Failures are returned rather than raised.
+
+        Args:
+            pending_writes: (product, classification, audit) tuples
+            limit: Most writes to take; all of them by default
+
+        Returns:
+            Error message by audit_id for each classification not stored
+        """
+        if not pending_writes:
+            return {}
+
+        writes = pending_writes[:limit]
+        del pending_writes[:limit]
+        products, classifications, audits = zip(*writes)
+        try:
+            async with self.product_repo.db.transaction() as conn:
+                await self.product_repo.save_many(list(products), conn=conn)
+                await self.classification_repo.save_many(list(classifications), conn=conn)
+                await self.audit_repo.save_many(list(audits), conn=conn)
+        except Exception as e:
+            logger.error("bulk_store_failed", count=len(writes), error=str(e))
+            return {
+                c.audit_id: f"Failed to store classification: {e}"
+                for c in classifications
+            }
+        return {}
 
 
 # Global engine instance
@@ -3,6 +3,7 @@ Rule-based validator implementing SNAP eligibility rules from 7 CFR 271.2.
 Handles clear-cut cases without requiring AI reasoning.
 """
 
+import re
 from typing import Optional
 
 from src.core.constants import (
@@ -17,6 +18,11 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# All eligible category keywords in one pattern, searched in a single call
+_ELIGIBLE_CATEGORY_RE = re.compile(
+    "|".join(map(re.escape, CLEARLY_ELIGIBLE_CATEGORIES))
+)
+
 
 class RuleValidator:
     """
@@ -240,7 +246,7 @@ class RuleValidator:
             # Check if category is a known eligible category
             if product.category:
                 category_lower = product.category.lower()
-                if any(cat in category_lower for cat in CLEARLY_ELIGIBLE_CATEGORIES):
+                if _ELIGIBLE_CATEGORY_RE.search(category_lower):
                     reasoning.append(
                         f"Product category '{product.category}' is a standard food category"
                     )
@@ -0,0 +1,48 @@
+"""Process-wide HTTP client for outbound API calls."""
+
+import httpx
+
+# HTTP/2 support needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool limits shared by every outbound call
+HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0,
+)
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client.
+
+    Reusing one client keeps TCP/TLS connections alive across requests
+    instead of setting up a new pool per call, and multiplexes requests
+    to the same host over HTTP/2 when h2 is installed.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_LIMITS,
+            timeout=60.0,
+        )
+    return _client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -21,8 +21,11 @@ def configure_logging() -> None:
         level=log_level,
     )
 
-    # Shared processors for both dev and prod
+    # Shared processors for both dev and prod. Level filtering runs first so
+    # records below the configured level are dropped before any processing,
+    # which keeps hot-path logs such as per-product tool calls cheap.
     shared_processors: list[Any] = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
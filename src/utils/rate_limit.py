@@ -0,0 +1,78 @@
+"""Rate limiting for outbound API calls."""
+
+import asyncio
+import math
+import time
+from typing import Optional
+
+from src.core.exceptions import RateLimitError
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how often an operation may start.
+
+    Tokens refill at ``rate`` per second up to ``capacity``, so short
+    bursts go straight through while sustained load is spread out to the
+    configured rate. Callers that find the bucket empty reserve the next
+    token and sleep until it is due, which keeps them in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        max_wait: Optional[float] = None,
+        service: str = "api",
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+            max_wait: Longest a caller may wait for a token, in seconds;
+                unbounded if None
+            service: Service name reported in RateLimitError
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.service = service
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+
+        Raises:
+            RateLimitError: If the wait would be longer than max_wait
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+        # The token is reserved before sleeping; no await happens between
+        # reading and updating the bucket, so no lock is needed
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+
+        wait = -self._tokens / self.rate
+        if self.max_wait is not None and wait > self.max_wait:
+            self._tokens += 1
+            raise RateLimitError(
+                f"{self.service} rate limit reached",
+                service=self.service,
+                retry_after=math.ceil(wait),
+            )
+
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Hand the reservation back so later callers are not delayed
+            self._tokens += 1
+            raise
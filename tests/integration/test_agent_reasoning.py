@@ -384,3 +384,71 @@ class TestAgentPromptConstruction:
         prompt = agent._build_classification_prompt(product, regulations)
 
         assert "271.2" in prompt or "regulation" in prompt.lower()
+
+
+class TestAgentResponseParsing:
+    """Test suite for parsing LLM responses."""
+
+    @pytest.fixture
+    def agent(self):
+        """Create a classification agent instance."""
+        return ClassificationAgent()
+
+    def test_key_factors_keep_response_order(self, agent):
+        """Test that key factors are deduplicated in first-seen order."""
+        product = ProductInput(
+            product_id="PARSE-001",
+            product_name="Potato Chips",
+            category="Snacks",
+            nutrition_label_type="nutrition_facts",
+        )
+        response = (
+            "ELIGIBILITY: ELIGIBLE\n"
+            "KEY_FACTORS:\n"
+            "- Shelf-stable snack\n"
+            "- Has Nutrition Facts label\n"
+            "- Shelf-stable snack\n"
+            "- Not hot at sale\n"
+        )
+
+        result = agent._parse_response(response, product)
+
+        assert result.key_factors == [
+            "Shelf-stable snack",
+            "Has Nutrition Facts label",
+            "Not hot at sale",
+            "Category: Snacks",
+        ]
+
+
+class TestAgentBatchReasoning:
+    """Test suite for concurrent batch reasoning."""
+
+    @pytest.fixture
+    def agent(self):
+        """Create a classification agent instance."""
+        return ClassificationAgent(max_concurrency=2)
+
+    @pytest.mark.asyncio
+    async def test_reason_batch_preserves_order(self, agent):
+        """Test that batch results line up with the input products."""
+        products = [
+            ProductInput(product_id="BATCH-001", product_name="Sparkling Water"),
+            ProductInput(
+                product_id="BATCH-002",
+                product_name="Fish Oil Capsules",
+                nutrition_label_type="supplement_facts",
+            ),
+            ProductInput(product_id="BATCH-003", product_name="Granola Bar"),
+        ]
+
+        with patch.object(
+            ClassificationAgent, "llm", new_callable=lambda: property(lambda self: None)
+        ):
+            results = await agent.reason_batch(products)
+
+        assert len(results) == 3
+        assert results[0].is_eligible is True
+        assert results[1].is_eligible is False
+        assert results[1].category == ClassificationCategory.INELIGIBLE_SUPPLEMENT
+        assert results[2].is_eligible is True
@@ -336,6 +336,39 @@ class TestExplainEndpoint:
         assert "reasoning_chain" in explanation
 
 
+    @pytest.mark.asyncio
+    async def test_explain_after_challenge_shows_challenge(self, async_client: AsyncClient):
+        """Test that an explanation cached before a challenge is not served after it."""
+        classify_response = await async_client.post(
+            "/classify",
+            json={
+                "product_id": "EXP-003",
+                "product_name": "Mystery Beverage",
+                "category": "Beverages",
+            },
+        )
+        audit_id = classify_response.json()["audit_id"]
+
+        # Cache the unchallenged explanation
+        before = await async_client.get(f"/explain/{audit_id}")
+        assert before.json()["challenge_info"]["was_challenged"] is False
+
+        challenge_response = await async_client.post(
+            f"/challenge/{audit_id}",
+            json={
+                "challenge_reason": "This product should be classified differently based on its actual ingredients.",
+            },
+        )
+        assert challenge_response.status_code == 200
+
+        after = await async_client.get(f"/explain/{audit_id}")
+
+        assert after.status_code == 200
+        challenge_info = after.json()["challenge_info"]
+        assert challenge_info["was_challenged"] is True
+        assert challenge_info["challenge_reason"] is not None
+
+
 class TestAuditTrailEndpoint:
     """Test suite for /audit-trail endpoint."""
 
@@ -0,0 +1,114 @@
+"""Unit tests for the audit trail repository."""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+
+from src.core.constants import ClassificationCategory
+from src.data.database import Database, initialize_database
+from src.data.repositories.audit_repo import AuditRepository
+from src.models.audit import AuditRecord, AuditTrailQuery
+from src.models.classification import ClassificationResult
+
+
+# Several records share a timestamp so paging must break ties on audit_id
+TIMESTAMPS = [
+    datetime(2024, 1, 15, 10, 0, 0),
+    datetime(2024, 1, 15, 10, 0, 0),
+    datetime(2024, 1, 15, 10, 0, 0),
+    datetime(2024, 1, 15, 11, 0, 0, 500000),
+    datetime(2024, 1, 15, 11, 0, 0, 500000),
+    datetime(2024, 1, 15, 12, 0, 0),
+    datetime(2024, 1, 16, 9, 0, 0),
+]
+
+
+def _make_record(index: int, timestamp: datetime) -> AuditRecord:
+    """Build an audit record for a test product."""
+    audit_id = f"audit-{index:03d}"
+    result = ClassificationResult(
+        product_id=f"PROD-{index:03d}",
+        product_name="Fresh Apples",
+        is_ebt_eligible=True,
+        confidence_score=0.95,
+        classification_category=ClassificationCategory.ELIGIBLE_STAPLE_FOOD,
+        reasoning_chain=["Staple food"],
+        regulation_citations=[],
+        key_factors=["produce"],
+        classification_timestamp=timestamp,
+        model_version="1.0.0",
+        processing_time_ms=10,
+        data_sources_used=[],
+        audit_id=audit_id,
+        request_hash="hash",
+    )
+    return AuditRecord(
+        audit_id=audit_id,
+        timestamp=timestamp,
+        request_payload={},
+        request_source="API",
+        classification_result=result,
+        model_used="test-model",
+    )
+
+
+class TestAuditRepository:
+    """Test suite for AuditRepository."""
+
+    @pytest_asyncio.fixture
+    async def repo(self):
+        """Create a repository over an in-memory database with test records."""
+        db = Database(":memory:")
+        await initialize_database(db)
+        repo = AuditRepository(db)
+        await repo.save_many(
+            [_make_record(i, ts) for i, ts in enumerate(TIMESTAMPS)]
+        )
+        yield repo
+        await db.close()
+
+    @staticmethod
+    def _expected_order() -> list[str]:
+        """Audit ids newest first, ties broken by audit_id descending."""
+        records = [(ts, f"audit-{i:03d}") for i, ts in enumerate(TIMESTAMPS)]
+        return [audit_id for _, audit_id in sorted(records, reverse=True)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["get_summaries", "query"])
+    async def test_keyset_pages_have_no_duplicates_or_gaps(
+        self,
+        repo: AuditRepository,
+        method: str,
+    ):
+        """Test that following the cursor visits every record exactly once."""
+        fetch = getattr(repo, method)
+        seen = []
+        cursor = {}
+
+        while True:
+            page = await fetch(AuditTrailQuery(limit=2, **cursor))
+            seen.extend(item.audit_id for item in page)
+            if len(page) < 2:
+                break
+            cursor = {
+                "cursor_timestamp": page[-1].timestamp,
+                "cursor_audit_id": page[-1].audit_id,
+            }
+
+        assert seen == self._expected_order()
+
+    @pytest.mark.asyncio
+    async def test_cursor_ignores_offset(self, repo: AuditRepository):
+        """Test that a cursor replaces the offset instead of adding to it."""
+        first = await repo.get_summaries(AuditTrailQuery(limit=3))
+        second = await repo.get_summaries(
+            AuditTrailQuery(
+                limit=3,
+                offset=3,
+                cursor_timestamp=first[-1].timestamp,
+                cursor_audit_id=first[-1].audit_id,
+            )
+        )
+
+        assert [s.audit_id for s in second] == self._expected_order()[3:6]
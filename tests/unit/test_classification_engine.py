@@ -1,5 +1,6 @@
 """Unit tests for the classification engine."""
 
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -21,6 +22,7 @@ class TestClassificationEngine:
         """Create a mock product repository."""
         repo = AsyncMock()
         repo.save = AsyncMock()
+        repo.db = MagicMock()  # db.transaction() works as an async context manager
         return repo
 
     @pytest.fixture
@@ -429,6 +431,96 @@ class TestClassificationEngine:
         # Verify classification was saved
         mock_classification_repo.save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bulk_classify_stores_results_in_batch(
+        self,
+        engine,
+        mock_product_repo,
+        mock_classification_repo,
+        mock_audit_repo,
+    ):
+        """Test that bulk classification stores results with one batch write per table."""
+        products = [
+            ProductInput(
+                product_id="STORE-001",
+                product_name="Fresh Apples",
+                category="Produce",
+                nutrition_label_type="nutrition_facts",
+            ),
+            ProductInput(
+                product_id="STORE-002",
+                product_name="Wine Bottle",
+                category="Beverages",
+                alcohol_content=0.12,
+            ),
+        ]
+
+        await engine.bulk_classify(products)
+
+        mock_classification_repo.save.assert_not_called()
+        mock_audit_repo.save.assert_not_called()
+        for repo in (mock_product_repo, mock_classification_repo, mock_audit_repo):
+            repo.save_many.assert_called_once()
+            assert len(repo.save_many.call_args.args[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_classify_flushes_writes_in_chunks(
+        self,
+        engine,
+        mock_audit_repo,
+    ):
+        """Test that bulk classification stores results every bulk_write_chunk_size items."""
+        products = [
+            ProductInput(
+                product_id=f"CHUNK-{i:03d}",
+                product_name="Fresh Apples",
+                category="Produce",
+                nutrition_label_type="nutrition_facts",
+            )
+            for i in range(5)
+        ]
+
+        with patch(
+            "src.services.classification_engine.settings",
+            MagicMock(bulk_write_chunk_size=2),
+        ):
+            result = await engine.bulk_classify(products)
+
+        assert result.successful == 5
+        stored = [len(c.args[0]) for c in mock_audit_repo.save_many.call_args_list]
+        assert sum(stored) == 5
+        assert max(stored) <= 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_classify_reports_storage_failure_per_item(
+        self,
+        engine,
+        mock_classification_repo,
+    ):
+        """Test that a failed batch write becomes per-product errors."""
+        mock_classification_repo.save_many = AsyncMock(side_effect=Exception("disk full"))
+        products = [
+            ProductInput(
+                product_id="FAIL-001",
+                product_name="Fresh Apples",
+                category="Produce",
+                nutrition_label_type="nutrition_facts",
+            ),
+            ProductInput(
+                product_id="FAIL-002",
+                product_name="Wine Bottle",
+                category="Beverages",
+                alcohol_content=0.12,
+            ),
+        ]
+
+        result = await engine.bulk_classify(products)
+
+        assert result.successful == 0
+        assert result.failed == 2
+        assert sorted(e["product_id"] for e in result.errors) == ["FAIL-001", "FAIL-002"]
+        assert all("disk full" in e["error"] for e in result.errors)
+
     @pytest.mark.asyncio
     async def test_classification_returns_cached_result(
         self,
@@ -480,3 +572,102 @@ class TestClassificationEngine:
 
         # AI agent should be called for ambiguous product
         mock_ai_agent.reason.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_classify_batches_ambiguous_products(
+        self,
+        engine,
+        mock_ai_agent,
+    ):
+        """Test that bulk classification sends only ambiguous products to the AI in one batch."""
+        mock_ai_agent.reason_batch = AsyncMock(
+            side_effect=lambda products, partial_rule_results: [
+                mock_ai_agent.reason.return_value for _ in products
+            ]
+        )
+        products = [
+            ProductInput(
+                product_id="BATCH-001",
+                product_name="Mystery Product",
+            ),
+            ProductInput(
+                product_id="BATCH-002",
+                product_name="Wine Bottle",
+                category="Beverages",
+                alcohol_content=0.12,
+            ),
+            ProductInput(
+                product_id="BATCH-003",
+                product_name="Another Mystery Product",
+            ),
+        ]
+
+        result = await engine.bulk_classify(products)
+
+        assert result.successful == 3
+        mock_ai_agent.reason_batch.assert_called_once()
+        batched = mock_ai_agent.reason_batch.call_args.kwargs["products"]
+        assert [p.product_id for p in batched] == ["BATCH-001", "BATCH-003"]
+        mock_ai_agent.reason.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_classify_iter_yields_each_product(self, engine):
+        """Test that streaming bulk classification yields one outcome per product."""
+        products = [
+            ProductInput(
+                product_id="STREAM-001",
+                product_name="Fresh Apples",
+                category="Produce",
+                nutrition_label_type="nutrition_facts",
+            ),
+            ProductInput(
+                product_id="STREAM-002",
+                product_name="Red Wine",
+                category="Beverages",
+                alcohol_content=0.13,
+            ),
+        ]
+
+        items = [item async for item in engine.bulk_classify_iter(products)]
+
+        assert all(item["success"] for item in items)
+        assert sorted(item["result"].product_id for item in items) == [
+            "STREAM-001",
+            "STREAM-002",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_classify_iter_does_not_wait_for_ai_batch(
+        self,
+        engine,
+        mock_ai_agent,
+    ):
+        """Test that rule-decided products stream out while the AI batch is running."""
+        release = asyncio.Event()
+
+        async def reason_batch(products, partial_rule_results):
+            await release.wait()
+            return [mock_ai_agent.reason.return_value for _ in products]
+
+        mock_ai_agent.reason_batch = AsyncMock(side_effect=reason_batch)
+        products = [
+            ProductInput(
+                product_id="STREAM-003",
+                product_name="Mystery Product",
+            ),
+            ProductInput(
+                product_id="STREAM-004",
+                product_name="Red Wine",
+                category="Beverages",
+                alcohol_content=0.13,
+            ),
+        ]
+
+        stream = engine.bulk_classify_iter(products)
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        assert first["result"].product_id == "STREAM-004"
+
+        release.set()
+        second = await stream.__anext__()
+        assert second["result"].product_id == "STREAM-003"
+        mock_ai_agent.reason.assert_not_called()
@@ -0,0 +1,173 @@
+"""Unit tests for database initialization and schema upgrades."""
+
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from src.core.exceptions import DatabaseError
+from src.data.database import SCHEMA_VERSION, Database, initialize_database
+
+
+# audit_trail as created before the filter columns were added
+BASELINE_AUDIT_SCHEMA = """
+CREATE TABLE audit_trail (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    audit_id TEXT UNIQUE NOT NULL,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    request_payload_json TEXT NOT NULL,
+    request_source TEXT NOT NULL,
+    classification_result_json TEXT NOT NULL,
+    model_used TEXT NOT NULL,
+    tokens_consumed INTEGER DEFAULT 0,
+    rag_documents_json TEXT,
+    was_challenged BOOLEAN DEFAULT FALSE,
+    challenge_reason TEXT,
+    challenge_result_json TEXT,
+    challenge_timestamp TIMESTAMP
+);
+CREATE INDEX idx_audit_timestamp ON audit_trail(timestamp);
+CREATE INDEX idx_audit_challenged ON audit_trail(was_challenged);
+"""
+
+
+class TestInitializeDatabase:
+    """Test suite for initialize_database."""
+
+    @pytest.fixture
+    def baseline_db_path(self, tmp_path) -> str:
+        """Create a database with the baseline audit_trail schema and one record."""
+        path = str(tmp_path / "baseline.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(BASELINE_AUDIT_SCHEMA)
+        conn.execute(
+            """
+            INSERT INTO audit_trail (
+                audit_id, timestamp, request_payload_json, request_source,
+                classification_result_json, model_used
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                "audit-001",
+                "2024-01-15T10:30:00",
+                "{}",
+                "API",
+                json.dumps({
+                    "product_id": "PROD-001",
+                    "product_name": "Fresh Apples",
+                    "is_ebt_eligible": True,
+                    "classification_category": "ELIGIBLE_STAPLE_FOOD",
+                    "confidence_score": 0.95,
+                }),
+                "test-model",
+            ),
+        )
+        conn.commit()
+        conn.close()
+        return path
+
+    @pytest.mark.asyncio
+    async def test_upgrade_backfills_audit_columns(self, baseline_db_path: str):
+        """Test that upgrading a baseline database fills the new audit columns."""
+        db = Database(baseline_db_path)
+        try:
+            await initialize_database(db)
+
+            row = await db.fetch_one(
+                """
+                SELECT product_id, product_name, is_ebt_eligible,
+                       classification_category, confidence_score
+                FROM audit_trail WHERE audit_id = ?
+                """,
+                ("audit-001",),
+            )
+            version = await db.fetch_one("PRAGMA user_version")
+        finally:
+            await db.close()
+
+        assert row == {
+            "product_id": "PROD-001",
+            "product_name": "Fresh Apples",
+            "is_ebt_eligible": 1,
+            "classification_category": "ELIGIBLE_STAPLE_FOOD",
+            "confidence_score": 0.95,
+        }
+        assert version["user_version"] == SCHEMA_VERSION
+
+    @pytest.mark.asyncio
+    async def test_upgrade_replaces_audit_indexes(self, baseline_db_path: str):
+        """Test that upgrading creates the keyset indexes and drops the old ones."""
+        db = Database(baseline_db_path)
+        try:
+            await initialize_database(db)
+            rows = await db.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?",
+                ("audit_trail",),
+            )
+        finally:
+            await db.close()
+
+        indexes = {row["name"] for row in rows}
+        assert {
+            "idx_audit_time_id",
+            "idx_audit_product_time_id",
+            "idx_audit_eligible_time_id",
+        } <= indexes
+        assert "idx_audit_timestamp" not in indexes
+
+    @pytest.mark.asyncio
+    async def test_initialize_is_idempotent(self, baseline_db_path: str):
+        """Test that initializing an up-to-date database changes nothing."""
+        db = Database(baseline_db_path)
+        try:
+            await initialize_database(db)
+            await initialize_database(db)
+            count = await db.fetch_one("SELECT COUNT(*) AS n FROM audit_trail")
+        finally:
+            await db.close()
+
+        assert count["n"] == 1
+
+
+class TestReadConnections:
+    """Test suite for the pooled read-only connections."""
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently(self, tmp_path):
+        """Test that two reads hold separate connections at the same time."""
+        db = Database(str(tmp_path / "pool.db"))
+        held = []
+        both_held = asyncio.Event()
+
+        async def read() -> None:
+            async with db.read_connection() as conn:
+                held.append(conn)
+                if len(held) == Database.READ_POOL_SIZE:
+                    both_held.set()
+                await asyncio.wait_for(both_held.wait(), timeout=1.0)
+
+        try:
+            await initialize_database(db)
+            await asyncio.gather(read(), read())
+            reused = await db.fetch_one("SELECT 1 AS n")
+            opened = len(db._read_conns)
+        finally:
+            await db.close()
+
+        assert held[0] is not held[1]
+        assert reused == {"n": 1}
+        assert opened == Database.READ_POOL_SIZE
+
+    @pytest.mark.asyncio
+    async def test_read_connections_reject_writes(self, tmp_path):
+        """Test that the pooled connections are read-only."""
+        db = Database(str(tmp_path / "pool.db"))
+        try:
+            await initialize_database(db)
+            with pytest.raises(DatabaseError):
+                async with db.read_connection() as conn:
+                    await conn.execute("DELETE FROM audit_trail")
+        finally:
+            await db.close()
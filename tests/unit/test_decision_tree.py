@@ -0,0 +1,74 @@
+"""Unit tests for the decision tree tool."""
+
+import pytest
+from src.agents.tools.decision_tree import DecisionTreeTool
+
+
+PRODUCTS = [
+    {},
+    {"is_human_food": False},
+    {"alcohol_content": 0.05},
+    {"alcohol_content": 0.004, "contains_tobacco": True},
+    {"nutrition_label_type": "supplement_facts"},
+    {"is_hot_at_sale": True},
+    {"is_for_onsite_consumption": True},
+    {"contains_cbd_cannabis": True},
+    {"is_live_animal": True},
+    {"is_hot_at_sale": True, "contains_tobacco": True},
+]
+
+EXPECTED_CATEGORIES = [
+    "ELIGIBLE_OTHER",
+    "INELIGIBLE_NON_FOOD",
+    "INELIGIBLE_ALCOHOL",
+    "INELIGIBLE_TOBACCO",
+    "INELIGIBLE_SUPPLEMENT",
+    "INELIGIBLE_HOT_FOOD",
+    "INELIGIBLE_ONSITE_CONSUMPTION",
+    "INELIGIBLE_CBD_CANNABIS",
+    "INELIGIBLE_LIVE_ANIMAL",
+    "INELIGIBLE_TOBACCO",
+]
+
+
+class TestDecisionTreeTool:
+    """Test suite for DecisionTreeTool."""
+
+    @pytest.fixture
+    def tool(self) -> DecisionTreeTool:
+        """Create a decision tree tool instance."""
+        return DecisionTreeTool()
+
+    @pytest.mark.parametrize("product, category", list(zip(PRODUCTS, EXPECTED_CATEGORIES)))
+    def test_rule_categories(self, tool: DecisionTreeTool, product: dict, category: str):
+        """Test that each product gets the category of its first failing rule."""
+        assert f"Category: {category}" in tool.run(product)
+
+    def test_rules_name_product_flags(self, tool: DecisionTreeTool):
+        """Test that every rule fails on an attribute of the coerced flags."""
+        flags = tool._coerce({})
+
+        for rule in tool.RULES:
+            assert getattr(flags, rule["fails_on"]) is False
+
+    def test_eligible_result(self, tool: DecisionTreeTool):
+        """Test that a product passing every rule is eligible."""
+        result = tool.run({"nutrition_label_type": "nutrition_facts"})
+
+        assert "Result: ELIGIBLE" in result
+        assert "Category: ELIGIBLE_OTHER" in result
+
+    def test_first_failure_wins(self, tool: DecisionTreeTool):
+        """Test that the earliest failing rule determines the category."""
+        result = tool.run({"is_hot_at_sale": True, "contains_tobacco": True})
+
+        assert "Category: INELIGIBLE_TOBACCO" in result
+        assert "Is it hot at the point of sale?" not in result
+
+    def test_batch_matches_single(self, tool: DecisionTreeTool):
+        """Test that scalar and vectorized batches match single evaluation."""
+        small = PRODUCTS
+        large = PRODUCTS * (tool.VECTORIZE_MIN_BATCH // len(PRODUCTS) + 1)
+
+        assert tool.run_many(small) == [tool.run(p) for p in small]
+        assert tool.run_many(large) == [tool.run(p) for p in large]
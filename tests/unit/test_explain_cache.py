@@ -0,0 +1,93 @@
+"""Unit tests for the cached explanation endpoint."""
+
+from datetime import datetime
+
+import orjson
+import pytest
+import pytest_asyncio
+
+from src.api.routes import explain
+from src.core.constants import ClassificationCategory
+from src.data.database import Database, initialize_database
+from src.data.repositories.audit_repo import AuditRepository
+from src.models.audit import AuditRecord
+from src.models.classification import ClassificationResult
+
+
+TIMESTAMP = datetime(2024, 1, 15, 10, 0, 0)
+
+
+def _make_result(audit_id: str) -> ClassificationResult:
+    """Build a classification result for a test product."""
+    return ClassificationResult(
+        product_id="PROD-001",
+        product_name="Mystery Beverage",
+        is_ebt_eligible=True,
+        confidence_score=0.7,
+        classification_category=ClassificationCategory.ELIGIBLE_BEVERAGE,
+        reasoning_chain=["Beverage with nutrition facts"],
+        regulation_citations=[],
+        key_factors=["beverage"],
+        classification_timestamp=TIMESTAMP,
+        model_version="1.0.0",
+        processing_time_ms=10,
+        data_sources_used=[],
+        audit_id=audit_id,
+        request_hash="hash",
+    )
+
+
+class TestExplanationCache:
+    """Test suite for the explanation cache."""
+
+    @pytest_asyncio.fixture
+    async def repo(self, monkeypatch):
+        """Create a repository with one unchallenged record and an empty cache."""
+        monkeypatch.setattr(explain, "_explain_cache", explain.OrderedDict())
+        db = Database(":memory:")
+        await initialize_database(db)
+        repo = AuditRepository(db)
+        await repo.save(
+            AuditRecord(
+                audit_id="audit-001",
+                timestamp=TIMESTAMP,
+                request_payload={},
+                request_source="API",
+                classification_result=_make_result("audit-001"),
+                model_used="test-model",
+            )
+        )
+        yield repo
+        await db.close()
+
+    async def _explain(self, repo: AuditRepository) -> dict:
+        response = await explain.get_explanation("audit-001", audit_repo=repo)
+        return orjson.loads(response.body)
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_explanation(self, repo: AuditRepository):
+        """Test that an unchanged record is served from the cache."""
+        first = await self._explain(repo)
+        state, content = explain._explain_cache["audit-001"]
+        explain._explain_cache["audit-001"] = (state, content.replace(b"Mystery", b"Cached"))
+
+        second = await self._explain(repo)
+
+        assert first["product"]["product_name"] == "Mystery Beverage"
+        assert second["product"]["product_name"] == "Cached Beverage"
+
+    @pytest.mark.asyncio
+    async def test_challenge_without_invalidation_is_not_served_stale(
+        self,
+        repo: AuditRepository,
+    ):
+        """Test that a challenge the cache never heard about still shows up."""
+        before = await self._explain(repo)
+
+        # As if the challenge ran in another process or raced the cache fill
+        await repo.update_challenge("audit-001", "Wrong category", _make_result("audit-002"))
+        after = await self._explain(repo)
+
+        assert before["challenge_info"]["was_challenged"] is False
+        assert after["challenge_info"]["was_challenged"] is True
+        assert after["challenge_info"]["challenge_reason"] == "Wrong category"
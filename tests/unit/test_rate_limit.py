@@ -0,0 +1,75 @@
+"""Unit tests for the async rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.exceptions import RateLimitError
+from src.utils.rate_limit import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Test suite for AsyncRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_does_not_wait(self):
+        """Test that calls within the burst capacity go straight through."""
+        limiter = AsyncRateLimiter(rate=1.0, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_next_token(self):
+        """Test that a call past the burst waits for the refill."""
+        limiter = AsyncRateLimiter(rate=20.0, capacity=1)
+        await limiter.acquire()
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_raises_beyond_max_wait(self):
+        """Test that a wait longer than max_wait raises RateLimitError."""
+        limiter = AsyncRateLimiter(rate=0.1, capacity=1, max_wait=1.0, service="test")
+        await limiter.acquire()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await limiter.acquire()
+
+        assert exc_info.value.service == "test"
+        assert exc_info.value.retry_after == 10
+
+    @pytest.mark.asyncio
+    async def test_rejected_call_keeps_no_token(self):
+        """Test that a rejected call does not push back later callers."""
+        limiter = AsyncRateLimiter(rate=1.0, capacity=1, max_wait=0.5)
+        await limiter.acquire()
+
+        for _ in range(3):
+            with pytest.raises(RateLimitError):
+                await limiter.acquire()
+
+        assert limiter._tokens > -1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_returns_token(self):
+        """Test that cancelling a waiting caller hands its token back."""
+        limiter = AsyncRateLimiter(rate=1.0, capacity=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter._tokens < 0
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter._tokens > -1
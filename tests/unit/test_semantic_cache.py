@@ -0,0 +1,170 @@
+"""Unit tests for the semantic cache."""
+
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents.semantic_cache import SemanticCache
+from src.core.constants import ClassificationCategory
+from src.models.classification import AIReasoningResult
+from src.models.product import ProductInput
+
+
+# Embeddings by product text; unknown texts get an unrelated vector
+EMBEDDINGS = {
+    "Fresh Apples|None|Produce": [1.0, 0.0, 0.0],
+    "Fresh Apple|None|Produce": [0.99, 0.05, 0.0],
+    "Frozen Pizza|None|Frozen": [0.0, 1.0, 0.0],
+}
+
+
+class FakeEmbeddings:
+    """Embedding model returning fixed vectors."""
+
+    def embed_text(self, text: str) -> list[float]:
+        return EMBEDDINGS.get(text, [0.0, 0.0, 1.0])
+
+
+class FakeCollection:
+    """In-memory stand-in for the ChromaDB collection calls the cache makes."""
+
+    def __init__(self):
+        self.entries = []
+        self.deletes = 0
+
+    def add(self, ids, embeddings, documents, metadatas):
+        self.entries.extend(zip(ids, embeddings, metadatas))
+
+    def delete(self, where):
+        self.deletes += 1
+        cutoff = where["expires_at"]["$lte"]
+        self.entries = [e for e in self.entries if e[2]["expires_at"] > cutoff]
+
+    def query(self, query_embeddings, n_results, where, include):
+        key_filter, expiry_filter = where["$and"]
+        matches = sorted(
+            (self._distance(query_embeddings[0], embedding), entry_id, metadata)
+            for entry_id, embedding, metadata in self.entries
+            if metadata["attributes_key"] == key_filter["attributes_key"]
+            and metadata["expires_at"] > expiry_filter["expires_at"]["$gt"]
+        )[:n_results]
+        return {
+            "ids": [[m[1] for m in matches]],
+            "distances": [[m[0] for m in matches]],
+            "metadatas": [[m[2] for m in matches]],
+        }
+
+    @staticmethod
+    def _distance(a: list[float], b: list[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        return 1.0 - dot / (math.hypot(*a) * math.hypot(*b))
+
+
+def _product(product_id: str, name: str, category: str, **attributes) -> ProductInput:
+    return ProductInput(product_id=product_id, product_name=name, category=category, **attributes)
+
+
+def _result(*reasoning: str) -> AIReasoningResult:
+    return AIReasoningResult(
+        is_eligible=True,
+        category=ClassificationCategory.ELIGIBLE_STAPLE_FOOD,
+        reasoning_chain=list(reasoning),
+        key_factors=["produce"],
+        data_sources_used=["SNAP Guidelines"],
+    )
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache."""
+
+    @pytest.fixture
+    def collection(self) -> FakeCollection:
+        return FakeCollection()
+
+    @pytest.fixture
+    def make_cache(self, collection: FakeCollection, monkeypatch):
+        """Build caches that use the fake collection, enabled regardless of settings."""
+        monkeypatch.setattr(SemanticCache, "is_available", property(lambda self: True))
+
+        def make(ttl_seconds: int = 3600) -> SemanticCache:
+            vector_store = MagicMock()
+            vector_store.embeddings = FakeEmbeddings()
+            cache = SemanticCache(
+                vector_store=vector_store,
+                collection_name="test_cache",
+                threshold=0.95,
+                ttl_seconds=ttl_seconds,
+            )
+            cache._collection = collection
+            return cache
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_hit_for_similar_product(self, make_cache):
+        """Test that a similar product with the same attributes hits."""
+        cache = make_cache()
+        await cache.store(_product("P1", "Fresh Apples", "Produce"), _result("Apples are produce"))
+
+        hit = await cache.lookup(_product("P2", "Fresh Apple", "Produce"))
+
+        assert hit is not None
+        assert hit.reasoning_chain == ["Apples are produce"]
+
+    @pytest.mark.asyncio
+    async def test_miss_below_threshold(self, make_cache):
+        """Test that a dissimilar product misses."""
+        cache = make_cache()
+        await cache.store(_product("P1", "Fresh Apples", "Produce"), _result("Produce"))
+
+        assert await cache.lookup(_product("P2", "Frozen Pizza", "Frozen")) is None
+
+    @pytest.mark.asyncio
+    async def test_miss_on_attribute_mismatch(self, make_cache):
+        """Test that eligibility attributes and description must match exactly."""
+        cache = make_cache()
+        await cache.store(_product("P1", "Fresh Apples", "Produce"), _result("Produce"))
+
+        assert await cache.lookup(
+            _product("P2", "Fresh Apples", "Produce", is_hot_at_sale=True)
+        ) is None
+        assert await cache.lookup(
+            _product("P3", "Fresh Apples", "Produce", description="Apple pie filling")
+        ) is None
+
+    @pytest.mark.asyncio
+    async def test_miss_after_expiry(self, make_cache):
+        """Test that expired entries are not returned."""
+        cache = make_cache(ttl_seconds=-1)
+        await cache.store(_product("P1", "Fresh Apples", "Produce"), _result("Produce"))
+
+        assert await cache.lookup(_product("P1", "Fresh Apples", "Produce")) is None
+
+    @pytest.mark.asyncio
+    async def test_stored_reasoning_is_product_neutral(self, make_cache, collection):
+        """Test that product mentions are stored as placeholders and filled in on a hit."""
+        cache = make_cache()
+        await cache.store(
+            _product("P1", "Fresh Apples", "Produce"),
+            _result("FRESH APPLES (P1) are a staple food"),
+        )
+
+        stored = collection.entries[0][2]["result_json"]
+        assert "Fresh Apples" not in stored and "FRESH APPLES" not in stored
+        assert "P1" not in stored
+
+        hit = await cache.lookup(_product("P2", "Fresh Apple", "Produce"))
+        assert hit.reasoning_chain == ["Fresh Apple (P2) are a staple food"]
+
+    @pytest.mark.asyncio
+    async def test_prunes_expired_entries_periodically(self, make_cache, collection):
+        """Test that expired entries are deleted on the first store and every PRUNE_INTERVAL."""
+        cache = make_cache(ttl_seconds=-1)
+        product = _product("P1", "Fresh Apples", "Produce")
+
+        for _ in range(cache.PRUNE_INTERVAL + 1):
+            await cache.store(product, _result("Produce"))
+
+        assert collection.deletes == 2
+        assert len(collection.entries) == 1